@@ -0,0 +1,4 @@
+"""Benchmarks for the Sudoku rules, the reader, the printer and the hint pipeline.
+
+Run them from the root of the repository with ``python -m bench``.
+"""
@@ -0,0 +1,63 @@
+"""Runs the benchmark suite and prints the results."""
+
+import json
+import sys
+from argparse import ArgumentParser
+from glob import glob
+from os import path
+
+from bench.benchmarks import file_benchmarks, group_benchmarks
+from bench.corpus import load_corpus
+from bench.harness import Benchmark, format_table, measure
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Main function of the benchmark suite."""
+    parser = ArgumentParser(prog="bench", description="Benchmarks the Sudoku rules.")
+    parser.add_argument(
+        "--size", type=int, default=30, help="the number of generated puzzles"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=2024, help="the seed of the generated puzzles"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=20, help="the number of timed rounds"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="the minimum duration of a single round in seconds",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    options = parser.parse_args(arguments)
+
+    corpus = load_corpus(options.size, options.seed)
+    benchmarks: list[Benchmark] = file_benchmarks(
+        sorted(glob(path.join("puzzles", "*.txt")))
+    )
+    for group, puzzles in corpus.groups.items():
+        benchmarks.extend(group_benchmarks(group, puzzles))
+
+    measurements = []
+    for benchmark in benchmarks:
+        if options.filter in benchmark.name:
+            measurements.append(measure(benchmark, options.rounds, options.min_time))
+            if not options.json:
+                print(f"measured {benchmark.group} {benchmark.name}", file=sys.stderr)
+
+    if options.json:
+        print(json.dumps([item.todict() for item in measurements], indent=2))
+    else:
+        sizes = ", ".join(
+            f"{group}: {len(puzzles)}" for group, puzzles in corpus.groups.items()
+        )
+        print(f"seed {options.seed}, puzzles per group: {sizes}")
+        print(format_table(measurements))
+
+
+if __name__ == "__main__":
+    main()
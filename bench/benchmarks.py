@@ -0,0 +1,171 @@
+"""Module listing the benchmarks that run on every group of puzzles."""
+
+import io
+from collections.abc import Callable
+from contextlib import redirect_stdout
+
+from bench.harness import Benchmark
+from src.__main__ import print_hints_for_file
+from src.cell import FullCell
+from src.higlights import FieldPointer
+from src.sudoku import Sudoku
+from src.sudokuextrapolateblock import find_extrapolations_from_blocks
+from src.sudokuextrapolateline import (
+    extrapolate_lines_until_stable,
+    find_extrapolations_from_columns,
+    find_extrapolations_from_rows,
+)
+from src.sudokufinder import (
+    find_cells_with_single_option,
+    find_cells_with_unique_number_in_blocks,
+    find_cells_with_unique_number_in_columns,
+    find_cells_with_unique_number_in_rows,
+    find_cells_with_unique_number_in_single_block,
+    find_cells_with_unique_number_in_single_column,
+    find_cells_with_unique_number_in_single_row,
+)
+from src.sudokuhints import find_first_hints, find_hints
+from src.sudokuprinter import print_sudoku
+from src.sudokureader import (
+    decode_line,
+    digits_from_file,
+    sudoku_from_file,
+    sudoku_from_string,
+)
+from src.sudokuwriter import sudoku_to_string
+
+type Rule = Callable[[Sudoku], object]
+
+RULES: dict[str, Rule] = {
+    "finder.single_option": find_cells_with_single_option,
+    "finder.unique_in_rows": find_cells_with_unique_number_in_rows,
+    "finder.unique_in_columns": find_cells_with_unique_number_in_columns,
+    "finder.unique_in_blocks": find_cells_with_unique_number_in_blocks,
+    "finder.unique_in_single_units": lambda sudoku: [
+        (
+            find_cells_with_unique_number_in_single_row(sudoku.getrow(index)),
+            find_cells_with_unique_number_in_single_column(sudoku.getcolumn(index)),
+            find_cells_with_unique_number_in_single_block(
+                sudoku.getblock((index - 1) % 3 + 1, (index - 1) // 3 + 1)
+            ),
+        )
+        for index in range(1, 10)
+    ],
+    "extrapolate.rows": find_extrapolations_from_rows,
+    "extrapolate.columns": find_extrapolations_from_columns,
+    "extrapolate.blocks": find_extrapolations_from_blocks,
+    "extrapolate.lines_until_stable": extrapolate_lines_until_stable,
+    "printer.print_sudoku": lambda sudoku: print_sudoku(sudoku, []),
+    "printer.print_sudoku_highlighted": lambda sudoku: print_sudoku(
+        sudoku,
+        [
+            FieldPointer(position)
+            for position, cell in sudoku.cells
+            if not isinstance(cell, FullCell)
+        ],
+    ),
+    "pipeline.find_hints": find_hints,
+    "pipeline.find_first_hints": find_first_hints,
+}
+"""The benchmarks that run a function once on every puzzle of a group."""
+
+
+def to_array(sudoku: Sudoku) -> list[list[int | None]]:
+    """Converts a Sudoku to the nested lists that Sudoku.fromarray reads."""
+    return [
+        [cell.value if isinstance(cell, FullCell) else None for cell in row.cells]
+        for row in map(sudoku.getrow, range(1, 10))
+    ]
+
+
+def first_empty_cell(sudoku: Sudoku) -> tuple[int, int, int]:
+    """Finds an empty cell and a number that can be set there."""
+    for position, cell in sudoku.cells:
+        if not isinstance(cell, FullCell) and cell.possible_numbers:
+            return (*position, cell.possible_numbers[0])
+    raise ValueError("The Sudoku has no empty cell with candidates")
+
+
+def for_each(puzzles: list[Sudoku], rule: Rule) -> Callable[[], None]:
+    """Returns a function that applies a rule to every puzzle.
+
+    Every call gets a new Sudoku with the same cells, so caches that a Sudoku
+    builds lazily, like its index of number locations, are part of the timing.
+    """
+    cells = [tuple(cell for _, cell in sudoku.cells) for sudoku in puzzles]
+
+    def run() -> None:
+        for item in cells:
+            rule(Sudoku(item))
+
+    return run
+
+
+def group_benchmarks(group: str, puzzles: list[Sudoku]) -> list[Benchmark]:
+    """Lists every benchmark for one group of puzzles."""
+    count = len(puzzles)
+    arrays = [to_array(sudoku) for sudoku in puzzles]
+    lines = [sudoku_to_string(sudoku) for sudoku in puzzles]
+    digits = [decode_line(line.encode()) for line in lines]
+    settable = [
+        (sudoku, first_empty_cell(sudoku))
+        for sudoku in puzzles
+        if any(
+            not isinstance(cell, FullCell) and cell.possible_numbers
+            for _, cell in sudoku.cells
+        )
+    ]
+
+    def fromarray() -> None:
+        for array in arrays:
+            Sudoku.fromarray(array)
+
+    def fromdigits() -> None:
+        for values in digits:
+            Sudoku.fromdigits(values)
+
+    def fromstring() -> None:
+        for line in lines:
+            sudoku_from_string(line)
+
+    def set_cell() -> None:
+        for sudoku, (x, y, number) in settable:
+            sudoku.set(x, y, number)
+
+    benchmarks = [
+        Benchmark("sudoku.fromarray", group, fromarray, count),
+        Benchmark("sudoku.fromdigits", group, fromdigits, count),
+        Benchmark("reader.sudoku_from_string", group, fromstring, count),
+    ]
+    if settable:
+        benchmarks.append(Benchmark("sudoku.set", group, set_cell, len(settable)))
+    benchmarks.extend(
+        Benchmark(name, group, for_each(puzzles, rule), count)
+        for name, rule in RULES.items()
+    )
+    return benchmarks
+
+
+def file_benchmarks(filenames: list[str]) -> list[Benchmark]:
+    """Lists the benchmarks that read puzzles from files, including main()."""
+
+    def read() -> None:
+        for filename in filenames:
+            sudoku_from_file(filename)
+
+    def decode() -> None:
+        for filename in filenames:
+            for _ in digits_from_file(filename):
+                pass
+
+    def pipeline() -> None:
+        with redirect_stdout(io.StringIO()):
+            for filename in filenames:
+                print_hints_for_file(filename)
+
+    count = len(filenames)
+    return [
+        Benchmark("reader.sudoku_from_file", "bundled", read, count),
+        Benchmark("reader.digits_from_file", "bundled", decode, count),
+        Benchmark("pipeline.main", "bundled", pipeline, count),
+    ]
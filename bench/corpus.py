@@ -0,0 +1,111 @@
+"""Module for loading the bundled puzzles and generating a repeatable corpus.
+
+Generated puzzles start from a solved grid that is shuffled with a seeded random
+generator: the numbers are relabelled, bands and stacks are swapped, rows and
+columns are swapped inside them, and the grid may be transposed. Givens are then
+removed one by one as long as the puzzle keeps a unique solution. Every puzzle is
+put in a tier by the rules that are needed to solve it.
+"""
+
+import random
+from dataclasses import dataclass
+from glob import glob
+from os import path
+
+from src.sudoku import Sudoku
+from src.sudokupropagator import ContradictionError, Rule, propagate
+from src.sudokureader import sudoku_from_file, sudoku_from_string
+from src.sudokusolver import has_unique_solution
+from src.sudokuwriter import sudoku_to_string
+
+SOLVED_GRID = (
+    "123456789456789123789123456231564897564897231897231564312645978645978312978312645"
+)
+
+TIERS = ("singles", "intersections", "search")
+"""The difficulty tiers, from the easiest to the hardest."""
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """Named groups of puzzles to run the benchmarks on."""
+
+    groups: dict[str, list[Sudoku]]
+
+
+def bundled_puzzles(directory: str = "puzzles") -> list[Sudoku]:
+    """Reads every bundled puzzle file, in order of file name."""
+    return [
+        sudoku_from_file(filename)
+        for filename in sorted(glob(path.join(directory, "*.txt")))
+    ]
+
+
+def shuffled_grid(rng: random.Random) -> str:
+    """Returns a random solved grid that is equivalent to SOLVED_GRID."""
+    numbers = list("123456789")
+    rng.shuffle(numbers)
+    rows = [
+        band * 3 + row
+        for band in rng.sample(range(3), 3)
+        for row in rng.sample(range(3), 3)
+    ]
+    columns = [
+        stack * 3 + column
+        for stack in rng.sample(range(3), 3)
+        for column in rng.sample(range(3), 3)
+    ]
+    transpose = rng.random() < 0.5
+
+    cells = []
+    for y in rows:
+        for x in columns:
+            (row, column) = (x, y) if transpose else (y, x)
+            cells.append(numbers[int(SOLVED_GRID[row * 9 + column]) - 1])
+    return "".join(cells)
+
+
+def generate_puzzle(rng: random.Random, givens: int) -> Sudoku:
+    """Removes givens from a random grid until ``givens`` are left, or until none
+    can be removed without losing the unique solution."""
+    cells = list(shuffled_grid(rng))
+    for index in rng.sample(range(81), 81):
+        if cells.count(".") >= 81 - givens:
+            break
+        value = cells[index]
+        cells[index] = "."
+        if not has_unique_solution(sudoku_from_string("".join(cells))):
+            cells[index] = value
+    return sudoku_from_string("".join(cells))
+
+
+def tier(sudoku: Sudoku) -> str:
+    """Puts a puzzle in the tier of the hardest rule needed to solve it."""
+    try:
+        result = propagate(sudoku)
+    except ContradictionError:
+        return "search"
+    if "." in sudoku_to_string(result.sudoku):
+        return "search"
+    if any(deduction.rule is Rule.LINE_INTO_BLOCK for deduction in result.deductions):
+        return "intersections"
+    return "singles"
+
+
+def generated_puzzles(size: int, seed: int) -> dict[str, list[Sudoku]]:
+    """Generates ``size`` puzzles with the given seed and groups them by tier."""
+    rng = random.Random(seed)
+    tiers: dict[str, list[Sudoku]] = {name: [] for name in TIERS}
+    for _ in range(size):
+        sudoku = generate_puzzle(rng, rng.randint(22, 36))
+        tiers[tier(sudoku)].append(sudoku)
+    return tiers
+
+
+def load_corpus(size: int, seed: int) -> Corpus:
+    """Loads the bundled puzzles and a generated corpus grouped by tier."""
+    groups = {"bundled": bundled_puzzles()}
+    for name, puzzles in generated_puzzles(size, seed).items():
+        if puzzles:
+            groups[f"tier:{name}"] = puzzles
+    return Corpus(groups)
@@ -0,0 +1,102 @@
+"""Module for timing benchmarks and measuring their allocations.
+
+Every benchmark is a function that processes one group of puzzles. It is run in
+rounds of a fixed number of calls, so the timings are spread over many short
+samples that are converted to the time for a single puzzle.
+"""
+
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named function that processes a number of puzzles per call."""
+
+    name: str
+    group: str
+    function: Callable[[], object]
+    puzzles: int
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """The timings and allocations of one benchmark, per puzzle."""
+
+    name: str
+    group: str
+    median: float
+    p95: float
+    ops_per_second: float
+    peak_bytes: int
+
+    def todict(self) -> dict[str, object]:
+        """Converts the measurement to a dictionary for JSON output."""
+        return asdict(self)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Returns the sample at the given fraction, by the nearest rank method."""
+    if not samples:
+        raise ValueError("Cannot take a percentile of no samples")
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * fraction // 1))
+    return ordered[int(rank) - 1]
+
+
+def measure(benchmark: Benchmark, rounds: int, min_time: float) -> Measurement:
+    """Times a benchmark and measures the peak memory of a single call."""
+    timer = timeit.Timer(benchmark.function)
+    (number, _) = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    samples = [
+        total / number / benchmark.puzzles
+        for total in timer.repeat(repeat=rounds, number=number)
+    ]
+
+    tracemalloc.start()
+    try:
+        benchmark.function()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(samples)
+    return Measurement(
+        benchmark.name,
+        benchmark.group,
+        median,
+        percentile(samples, 0.95),
+        1 / median if median else 0.0,
+        peak // benchmark.puzzles,
+    )
+
+
+def format_table(measurements: list[Measurement]) -> str:
+    """Formats measurements as a table with one row per benchmark."""
+    header = (
+        f"{'group':<20} {'benchmark':<44} {'median':>10} {'p95':>10} "
+        f"{'ops/s':>10} {'peak':>10}"
+    )
+    rows = [
+        f"{item.group:<20} {item.name:<44} {format_time(item.median):>10} "
+        f"{format_time(item.p95):>10} {item.ops_per_second:>10.0f} "
+        f"{format_bytes(item.peak_bytes):>10}"
+        for item in measurements
+    ]
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+def format_time(seconds: float) -> str:
+    """Formats a duration with a unit that keeps it readable."""
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+
+def format_bytes(size: int) -> str:
+    """Formats a number of bytes in KiB."""
+    return f"{size / 1024:.1f}KiB"
@@ -1,53 +1,201 @@
 """Main module of the Sudoku solver program."""
 
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterable
 from os import path
+from typing import TextIO
 
 from src.higlights import FieldPointer
-from src.sudokuextrapolateline import (
-    eliminate_from_list_of_extrapolated_columns,
-    eliminate_from_list_of_extrapolated_rows,
-    find_extrapolations_from_columns,
-    find_extrapolations_from_rows,
-)
-from src.sudokufinder import (
-    find_cells_with_single_option,
-    find_cells_with_unique_number_in_blocks,
-    find_cells_with_unique_number_in_columns,
-    find_cells_with_unique_number_in_rows,
+from src.hintcache import HintCache
+from src.instrumentation import INSTRUMENTATION
+from src.sudokubatch import (
+    BatchRunner,
+    Task,
+    cached_hint_task,
+    hint_puzzle,
+    run_task,
+    solve_puzzle,
 )
+from src.sudokuhints import find_first_hints, find_hints
 from src.sudokuprinter import print_sudoku
-from src.sudokureader import sudoku_from_file
+from src.sudokureader import puzzle_lines, puzzles_from_file, sudoku_from_file
 
 
-def main() -> None:
+def main(arguments: list[str] | None = None) -> None:
     """Main function of the program."""
-    sudoku = sudoku_from_file(path.join("puzzles", "13.txt"))
-
-    old_sudoku = None
-    new_sudoku = sudoku
-    while old_sudoku is not new_sudoku:
-        old_sudoku = new_sudoku
-        extrapolations = find_extrapolations_from_rows(old_sudoku)
-        new_sudoku = eliminate_from_list_of_extrapolated_rows(
-            new_sudoku, extrapolations
-        )
-
-        extrapolations = find_extrapolations_from_columns(old_sudoku)
-        new_sudoku = eliminate_from_list_of_extrapolated_columns(
-            new_sudoku, extrapolations
-        )
-
-    positions = set()
-    positions = positions | set(find_cells_with_single_option(sudoku))
-    positions = positions | set(find_cells_with_unique_number_in_rows(sudoku))
-    positions = positions | set(find_cells_with_unique_number_in_columns(sudoku))
-    positions = positions | set(find_cells_with_unique_number_in_blocks(sudoku))
+    parser = ArgumentParser(prog="sudoku", description="Points out cells to fill in.")
+    parser.add_argument(
+        "puzzle",
+        nargs="?",
+        default=path.join("puzzles", "13.txt"),
+        help="a puzzle file with nine lines of nine characters",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="read puzzles of 81 characters or 9 lines of 9 from FILE, "
+        "or one puzzle per line from stdin if FILE is -",
+    )
+    parser.add_argument(
+        "--solve",
+        action="store_true",
+        help="in batch mode, write the solution instead of the hints",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="in batch mode, spread the puzzles over N worker processes",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        metavar="N",
+        help="in batch mode, the number of puzzles sent to a worker at a time "
+        "(default 64)",
+    )
+    parser.add_argument(
+        "--stats",
+        choices=["table", "json"],
+        help="measure every rule and print the statistics on stderr at the end",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="remember the hints of every puzzle in FILE across runs",
+    )
+    parser.add_argument(
+        "--canonical",
+        action="store_true",
+        help="share cached hints between puzzles that only differ by a symmetry",
+    )
+    parser.add_argument(
+        "--first",
+        type=int,
+        metavar="N",
+        help="stop looking as soon as N hints are found",
+    )
+    options = parser.parse_args(arguments)
+    if options.cache and options.jobs:
+        parser.error("--cache cannot be combined with --jobs")
+    if options.cache and options.solve:
+        parser.error("--cache cannot be combined with --solve")
+    if options.canonical and not options.cache:
+        parser.error("--canonical requires --cache")
+    if options.first is not None and (options.batch or options.cache):
+        parser.error("--first only applies to a single puzzle without --cache")
+    if options.first is not None and options.first < 1:
+        parser.error("--first must be at least 1")
+    if options.jobs is not None and options.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if options.chunksize is not None and options.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+    if not options.batch and (
+        options.solve or options.jobs is not None or options.chunksize is not None
+    ):
+        parser.error("--solve, --jobs and --chunksize only apply with --batch")
+    chunksize = 64 if options.chunksize is None else options.chunksize
+
+    INSTRUMENTATION.enabled = options.stats is not None
+    INSTRUMENTATION.reset()
+    cache = (
+        HintCache(path=options.cache, canonical=options.canonical)
+        if options.cache
+        else None
+    )
+    try:
+        task = task_for(options.solve, cache)
+        if not options.batch:
+            print_hints_for_file(options.puzzle, cache, options.first)
+        elif options.batch == "-":
+            run_batch(sys.stdin, sys.stdout, task, options.jobs, chunksize)
+        else:
+            puzzles = puzzles_from_file(options.batch)
+            run_puzzles(puzzles, sys.stdout, task, options.jobs, chunksize)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if options.stats == "table":
+        print(INSTRUMENTATION.totable(), file=sys.stderr)
+    elif options.stats == "json":
+        print(INSTRUMENTATION.tojson(), file=sys.stderr)
+    if options.stats and cache is not None:
+        print(cache.stats.report(), file=sys.stderr)
+
 
+def task_for(solve: bool, cache: HintCache | None = None) -> Task:
+    """Picks the task that batch mode runs on every puzzle."""
+    if solve:
+        return solve_puzzle
+    return cached_hint_task(cache) if cache is not None else hint_puzzle
+
+
+def print_hints_for_file(
+    filename: str, cache: HintCache | None = None, first: int | None = None
+) -> None:
+    """Prints a single puzzle with its hints highlighted.
+
+    The printer only shows values, so the puzzle is printed as it was read, with
+    the hints that were found after extrapolating it. With ``first``, only that
+    many hints are looked for.
+    """
+    sudoku = sudoku_from_file(filename)
+    if first is not None:
+        positions = find_first_hints(sudoku, first).positions
+    elif cache is not None:
+        positions = cache.find_hints(sudoku)
+    else:
+        positions = find_hints(sudoku).positions
     highlights = [FieldPointer(position) for position in positions]
 
     output = print_sudoku(sudoku, highlights)
     print(output)
 
 
+def print_hints_for_lines(lines: Iterable[str], output: TextIO) -> None:
+    """Writes one line per puzzle with the puzzle and the positions of its hints.
+
+    Every result is written as soon as it is found, so a corpus of any size is
+    processed in constant memory.
+    """
+    run_batch(lines, output, hint_puzzle)
+
+
+def run_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    task: Task,
+    jobs: int | None = None,
+    chunksize: int = 64,
+) -> None:
+    """Writes the result of a task for every line that holds a puzzle."""
+    run_puzzles(puzzle_lines(lines), output, task, jobs, chunksize)
+
+
+def run_puzzles(
+    puzzles: Iterable[str],
+    output: TextIO,
+    task: Task,
+    jobs: int | None = None,
+    chunksize: int = 64,
+) -> None:
+    """Writes the result of a task for every puzzle, one line at a time.
+
+    With jobs, the puzzles are spread over that many worker processes and the
+    throughput is reported on stderr.
+    """
+    if not jobs:
+        for puzzle in puzzles:
+            output.write(run_task(task, puzzle) + "\n")
+        return
+
+    runner = BatchRunner(task, jobs, chunksize)
+    for result in runner.run(puzzles):
+        output.write(result + "\n")
+    print(runner.stats.report(), file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
@@ -1,21 +1,41 @@
 """Module representing a 3x3 block in a Sudoku puzzle."""
 
-from src.cell import Cell, EmptyCell
+from collections.abc import Sequence
+
+from src.cell import Cell
 from src.cellcollection import CellCollection
 
+BLOCK_SLOTS: tuple[int, ...] = tuple(range(9))
+"""Slots of a block that is stored on its own, in reading order."""
+
 
 class Block(CellCollection):
-    """Represents a 3x3 block in a Sudoku puzzle."""
+    """Represents a 3x3 block in a Sudoku puzzle.
+
+    A block is a view: ``slots`` maps the local positions in reading order onto
+    ``cells``, which is either the storage of a whole Sudoku or just the nine cells
+    of the block.
+    """
 
     def __init__(
-        self, offset: tuple[int, int], cells: dict[tuple[int, int], Cell]
+        self,
+        offset: tuple[int, int],
+        cells: Sequence[Cell],
+        slots: tuple[int, ...] = BLOCK_SLOTS,
     ) -> None:
+        super().__init__(cells, slots)
         (self._offset_x, self._offset_y) = offset
-        self._cells = cells
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        """Returns the global offset that is added to local block coordinates."""
+        return (self._offset_x, self._offset_y)
 
     def get(self, x: int, y: int) -> Cell:
         """Gets a cell from the block using local coordinates."""
-        return self._cells[(x, y)] if (x, y) in self._cells else EmptyCell.create()
+        if x < 1 or x > 3 or y < 1 or y > 3:
+            raise ValueError("Local coordinates must be between 1 and 3")
+        return self._cells[self._slots[(y - 1) * 3 + (x - 1)]]
 
     def local_to_global(self, x: int, y: int) -> tuple[int, int]:
         """Converts local block coordinates to global Sudoku coordinates."""
@@ -34,7 +54,3 @@ class Block(CellCollection):
         if result < 1 or result > 3:
             raise ValueError("The given column does not intersect with this block")
         return result
-
-    @property
-    def cells(self) -> list[Cell]:
-        return list(self._cells.values())
@@ -0,0 +1,36 @@
+"""Module with lookup tables for sets of candidate numbers stored as 9-bit masks.
+
+Bit ``n - 1`` of a mask is set when the number ``n`` is still a candidate.
+"""
+
+from collections.abc import Iterable
+
+ALL_CANDIDATES = 0b111111111
+"""Mask in which every number from 1 to 9 is a candidate."""
+
+CANDIDATE_COUNT: tuple[int, ...] = tuple(mask.bit_count() for mask in range(512))
+"""Number of candidates in each mask."""
+
+SINGLE_CANDIDATE: tuple[int | None, ...] = tuple(
+    mask.bit_length() if mask.bit_count() == 1 else None for mask in range(512)
+)
+"""The only candidate in each mask, or None if the mask has zero or several."""
+
+CANDIDATE_NUMBERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(number for number in range(1, 10) if mask & (1 << (number - 1)))
+    for mask in range(512)
+)
+"""The candidates in each mask in ascending order."""
+
+
+def number_to_mask(number: int) -> int:
+    """Converts a number between 1 and 9 to a mask with only that number."""
+    return 1 << (number - 1)
+
+
+def numbers_to_mask(numbers: Iterable[int]) -> int:
+    """Converts a collection of numbers between 1 and 9 to a mask."""
+    mask = 0
+    for number in numbers:
+        mask |= 1 << (number - 1)
+    return mask
@@ -3,46 +3,78 @@
 from dataclasses import dataclass
 from typing import Union
 
+from src.candidates import (
+    ALL_CANDIDATES,
+    CANDIDATE_COUNT,
+    CANDIDATE_NUMBERS,
+    SINGLE_CANDIDATE,
+)
 
+
+@dataclass(frozen=True)
 class EmptyCell:
-    """Represents an empty cell in a Sudoku puzzle, tracking eliminated numbers."""
+    """Represents an empty cell in a Sudoku puzzle, tracking its candidate numbers.
 
-    def __init__(self, eliminated: set[int]) -> None:
-        self._eliminated: set[int] = eliminated
+    The candidates are stored as a 9-bit mask. Since there are only 512 possible
+    masks, every instance is shared: use ``create`` or ``frommask`` instead of the
+    constructor.
+    """
+
+    candidates: int
+
+    def __post_init__(self) -> None:
+        if self.candidates < 0 or self.candidates > ALL_CANDIDATES:
+            raise ValueError("Candidates must be a mask between 0 and 511")
 
     def couldbe(self, number: int) -> bool:
         """Checks if the cell could be a certain number."""
         if number < 1 or number > 9:
             return False
-        return number not in self._eliminated
+        return (self.candidates >> (number - 1)) & 1 == 1
 
     def eliminate(self, number: int) -> "EmptyCell":
-        """Creates a new cell with the given number eliminated."""
+        """Returns the cell with the given number eliminated."""
         if number < 1 or number > 9:
             raise ValueError("Number must be between 1 and 9")
-        eliminated = self._eliminated.copy()
-        eliminated.add(number)
-        return EmptyCell(eliminated)
+        return _EMPTY_CELLS[self.candidates & ~(1 << (number - 1))]
 
     def reconsider(self, number: int) -> "EmptyCell":
-        """Creates a new cell with the given number reconsidered."""
+        """Returns the cell with the given number reconsidered."""
         if number < 1 or number > 9:
             raise ValueError("Number must be between 1 and 9")
-        if number in self._eliminated:
-            eliminated = self._eliminated.copy()
-            eliminated.remove(number)
-            return EmptyCell(eliminated)
-        return self
+        return _EMPTY_CELLS[self.candidates | (1 << (number - 1))]
+
+    @property
+    def possible_numbers(self) -> tuple[int, ...]:
+        """Returns the possible numbers for this cell in ascending order."""
+        return CANDIDATE_NUMBERS[self.candidates]
 
     @property
-    def possible_numbers(self) -> list[int]:
-        """Returns a list of possible numbers for this cell."""
-        return [number for number in range(1, 10) if number not in self._eliminated]
+    def possible_count(self) -> int:
+        """Returns the amount of possible numbers for this cell."""
+        return CANDIDATE_COUNT[self.candidates]
+
+    @property
+    def single_number(self) -> int | None:
+        """Returns the only possible number for this cell, if there is exactly one."""
+        return SINGLE_CANDIDATE[self.candidates]
 
     @staticmethod
     def create() -> "EmptyCell":
-        """Creates a new empty cell with no eliminated numbers."""
-        return EmptyCell(set())
+        """Returns an empty cell with no eliminated numbers."""
+        return _EMPTY_CELLS[ALL_CANDIDATES]
+
+    @staticmethod
+    def frommask(candidates: int) -> "EmptyCell":
+        """Returns the empty cell with the given mask of candidate numbers."""
+        if candidates < 0 or candidates > ALL_CANDIDATES:
+            raise ValueError("Candidates must be a mask between 0 and 511")
+        return _EMPTY_CELLS[candidates]
+
+
+_EMPTY_CELLS: tuple[EmptyCell, ...] = tuple(
+    EmptyCell(mask) for mask in range(ALL_CANDIDATES + 1)
+)
 
 
 @dataclass(frozen=True)
@@ -1,20 +1,33 @@
 """Module representing a collection of Sudoku cells."""
 
+from collections.abc import Sequence
+from operator import itemgetter
+
 from src.cell import Cell, FullCell
 
 
 class CellCollection:
-    """Abstract base class for a collection of Sudoku cells."""
+    """Base class for a view on nine cells of a Sudoku puzzle.
+
+    The collection does not copy any cells. It keeps a reference to the cell storage
+    it was created from and the indexes of its cells in that storage.
+    """
+
+    def __init__(self, cells: Sequence[Cell], slots: tuple[int, ...]) -> None:
+        if len(slots) != 9:
+            raise ValueError("A collection must contain exactly 9 cells")
+        self._cells: Sequence[Cell] = cells
+        self._slots: tuple[int, ...] = slots
 
     @property
-    def cells(self) -> list[Cell]:
-        """When implemented by a type, returns the list of cells in the collection."""
-        raise NotImplementedError(
-            "property 'cells' must be implemented by derived type"
-        )
+    def cells(self) -> tuple[Cell, ...]:
+        """Returns the cells in the collection in order."""
+        return itemgetter(*self._slots)(self._cells)
 
     def contains(self, number: int) -> bool:
         """Checks if the collection contains a cell with the given number."""
-        return number in [
-            cell.value for cell in self.cells if isinstance(cell, FullCell)
-        ]
+        cells = self._cells
+        return any(
+            isinstance(cell := cells[index], FullCell) and cell.value == number
+            for index in self._slots
+        )
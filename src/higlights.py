@@ -1,5 +1,7 @@
 """Module defining a highlight that points to a specific cell in the Sudoku grid."""
 
+from functools import cache
+
 from termcolor import colored
 
 
@@ -9,14 +11,29 @@ class FieldPointer:
     def __init__(self, position: tuple[int, int]) -> None:
         self._position = position
 
+    @property
+    def position(self) -> tuple[int, int]:
+        """Gets the position of the cell the pointer points to."""
+        return self._position
+
     def get_before(self, position: tuple[int, int]) -> str | None:
         """Gets the highlight before the cell if it matches the pointer's position."""
         if position == self._position:
-            return colored(">", "light_green")
+            return marker(">")
         return None
 
     def get_after(self, position: tuple[int, int]) -> str | None:
         """Gets the highlight after the cell if it matches the pointer's position."""
         if position == self._position:
-            return colored("<", "light_green")
+            return marker("<")
         return None
+
+
+@cache
+def marker(symbol: str) -> str:
+    """Colors a marker symbol.
+
+    Since termcolor 2.4, whether the terminal supports colors is decided once per
+    process, so the colored string can be reused for every highlight.
+    """
+    return colored(symbol, "light_green")
@@ -0,0 +1,147 @@
+"""Module for caching the hints of Sudoku states that were seen before.
+
+A state is identified by a hash of every cell, including the candidates of empty
+cells, so two states with the same givens but different eliminations are cached
+separately. The newest states are kept in memory and the oldest are evicted first.
+With a path, every state is also written to a shelve file, so the cache survives
+restarts. With ``canonical`` set, states are first turned into their canonical
+form, so puzzles that only differ by a symmetry share one entry. Finding it takes
+tens of milliseconds for most puzzles and up to about a second for some, far more
+than running the rules, so it only pays off when equivalent puzzles recur often.
+"""
+
+import shelve
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from types import TracebackType
+
+from src.sudoku import Sudoku
+from src.sudokucanonical import canonical_form
+from src.sudokuhints import find_hints
+from src.zobrist import cell_code
+
+type Positions = list[tuple[int, int]]
+
+
+def state_key(sudoku: Sudoku) -> bytes:
+    """Hashes the values and candidates of every cell of a Sudoku."""
+    codes = [cell_code(cell) for _, cell in sudoku.cells]
+    return blake2b(struct.pack("<81H", *codes), digest_size=16).digest()
+
+
+@dataclass
+class CacheStats:
+    """Counts how often the cache could answer a request."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Returns the total number of requests."""
+        return self.hits + self.disk_hits + self.misses
+
+    def report(self) -> str:
+        """Describes the counts in one line."""
+        return (
+            f"cache: {self.hits} hits, {self.disk_hits} disk hits, {self.misses} misses"
+        )
+
+
+class HintCache:
+    """A least recently used cache of hint positions keyed by Sudoku state."""
+
+    def __init__(
+        self, maxsize: int = 4096, path: str | None = None, canonical: bool = False
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self._maxsize = maxsize
+        self._canonical = canonical
+        self._entries: OrderedDict[bytes, Positions] = OrderedDict()
+        self._store: shelve.Shelf[Positions] | None = (
+            shelve.open(path) if path is not None else None
+        )
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "HintCache":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def find_hints(self, sudoku: Sudoku) -> Positions:
+        """Returns the hint positions of a Sudoku, running the rules on a miss.
+
+        The positions are a new list every time, so changing them leaves the cache
+        untouched.
+        """
+        if self._canonical:
+            return self._find_canonical_hints(sudoku)
+        key = state_key(sudoku)
+        positions = self.get(key)
+        if positions is None:
+            positions = find_hints(sudoku).positions
+            self.put(key, positions)
+        return list(positions)
+
+    def _find_canonical_hints(self, sudoku: Sudoku) -> Positions:
+        """Looks up the hints of the canonical form and maps them back."""
+        (canonical, transform) = canonical_form(sudoku)
+        key = state_key(canonical)
+        positions = self.get(key)
+        if positions is None:
+            positions = find_hints(canonical).positions
+            self.put(key, positions)
+        return sorted(
+            (transform.to_original_position(position) for position in positions),
+            key=lambda position: position[::-1],
+        )
+
+    def get(self, key: bytes) -> Positions | None:
+        """Looks up a state in memory first and on disk second."""
+        positions = self._entries.get(key)
+        if positions is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return positions
+
+        if self._store is not None:
+            positions = self._store.get(key.hex())
+            if positions is not None:
+                self._remember(key, positions)
+                self.stats.disk_hits += 1
+                return positions
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: bytes, positions: Positions) -> None:
+        """Stores the hint positions of a state in memory and on disk."""
+        self._remember(key, positions)
+        if self._store is not None:
+            self._store[key.hex()] = positions
+
+    def close(self) -> None:
+        """Writes the disk store and closes it."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _remember(self, key: bytes, positions: Positions) -> None:
+        """Adds a state to memory, evicting the least recently used one if full."""
+        self._entries[key] = positions
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,145 @@
+"""Module for measuring how much work every rule does.
+
+Rules are wrapped with the ``instrumented`` decorator. While instrumentation is
+disabled, which is the default, the wrapper only checks a flag before calling the
+rule. When it is enabled, every call records its wall time, the number of units it
+examined, the candidates it eliminated and the hints it produced.
+"""
+
+import inspect
+import json
+import time
+from collections.abc import Callable, Iterable, Sized
+from dataclasses import asdict, dataclass
+from functools import wraps
+
+from src.candidates import CANDIDATE_COUNT
+from src.cell import EmptyCell
+from src.sudoku import Sudoku
+
+
+@dataclass
+class RuleStats:
+    """The work done by one rule, summed over all its calls."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    units: int = 0
+    eliminations: int = 0
+    hints: int = 0
+
+    def merge(self, other: "RuleStats") -> None:
+        """Adds the counts of another RuleStats to this one."""
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.units += other.units
+        self.eliminations += other.eliminations
+        self.hints += other.hints
+
+
+class Instrumentation:
+    """Collects the statistics of every instrumented rule."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.rules: dict[str, RuleStats] = {}
+
+    def reset(self) -> None:
+        """Forgets every recorded statistic."""
+        self.rules = {}
+
+    def record(self, name: str) -> RuleStats:
+        """Gets the statistics of a rule, creating them on the first call."""
+        stats = self.rules.get(name)
+        if stats is None:
+            stats = self.rules[name] = RuleStats()
+        return stats
+
+    def merge(self, rules: dict[str, RuleStats]) -> None:
+        """Adds statistics collected elsewhere, for example in another process."""
+        for name, stats in rules.items():
+            self.record(name).merge(stats)
+
+    def tojson(self) -> str:
+        """Dumps the statistics as a JSON object keyed by rule name."""
+        return json.dumps(
+            {name: asdict(stats) for name, stats in sorted(self.rules.items())},
+            indent=2,
+        )
+
+    def totable(self) -> str:
+        """Dumps the statistics as a table with one row per rule."""
+        header = (
+            f"{'rule':<56} {'calls':>8} {'time':>10} {'units':>8} "
+            f"{'elims':>8} {'hints':>8}"
+        )
+        rows = [
+            f"{name:<56} {stats.calls:>8} {stats.seconds * 1e3:>8.2f}ms "
+            f"{stats.units:>8} {stats.eliminations:>8} {stats.hints:>8}"
+            for name, stats in sorted(self.rules.items())
+        ]
+        return "\n".join([header, "-" * len(header), *rows])
+
+
+INSTRUMENTATION = Instrumentation()
+"""The statistics of the current process."""
+
+
+def instrumented[**P, R](
+    units: Callable[..., int] | int = 0,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Wraps a rule so its work is recorded while instrumentation is enabled.
+
+    ``units`` is the number of units the rule examines, or a function that computes
+    it from the arguments of the call. Lists and sets returned by the rule are
+    counted as hints. When the rule takes a Sudoku and returns one, alone or first in
+    a tuple, the candidates that disappeared between them are counted as
+    eliminations.
+    """
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        name = f"{function.__module__.removeprefix('src.')}.{function.__name__}"
+        signature = inspect.signature(function)
+
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not INSTRUMENTATION.enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - start
+
+            bound = signature.bind(*args, **kwargs)
+            stats = INSTRUMENTATION.record(name)
+            stats.calls += 1
+            stats.seconds += seconds
+            if callable(units):
+                stats.units += units(*bound.args, **bound.kwargs)
+            else:
+                stats.units += units
+            if isinstance(result, (list, set)):
+                stats.hints += len(result)
+            before = next(iter(bound.arguments.values()), None)
+            after = result[0] if isinstance(result, tuple) and result else result
+            if isinstance(before, Sudoku) and isinstance(after, Sudoku):
+                stats.eliminations += count_candidates(before) - count_candidates(after)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def count_indexes(sudoku: Sudoku, indexes: Iterable[int] = range(1, 10)) -> int:
+    """Counts the line indexes passed to a rule, if they can be counted."""
+    return len(indexes) if isinstance(indexes, Sized) else 0
+
+
+def count_candidates(sudoku: Sudoku) -> int:
+    """Counts the candidates left in all empty cells of a Sudoku."""
+    return sum(
+        CANDIDATE_COUNT[cell.candidates]
+        for _, cell in sudoku.cells
+        if isinstance(cell, EmptyCell)
+    )
@@ -1,18 +1,29 @@
 """Module representing a line (row or column) in a Sudoku puzzle."""
 
+from collections.abc import Sequence
+
 from src.cellcollection import CellCollection
 
-from .cell import Cell, EmptyCell
+from .cell import Cell
+
+LINE_SLOTS: tuple[int, ...] = tuple(range(9))
+"""Slots of a line that is stored on its own, ordered by local index."""
 
 
 class Line(CellCollection):
-    """Abstract base class for a line (row or column) in a Sudoku puzzle."""
+    """Base class for a line (row or column) in a Sudoku puzzle.
+
+    A line is a view: ``slots`` maps the local indexes 1 to 9 onto ``cells``, which
+    is either the storage of a whole Sudoku or just the nine cells of the line.
+    """
 
-    def __init__(self, index: int, cells: dict[int, Cell]) -> None:
+    def __init__(
+        self, index: int, cells: Sequence[Cell], slots: tuple[int, ...] = LINE_SLOTS
+    ) -> None:
         if index < 1 or index > 9:
             raise ValueError("Index must be a value between 1 and 9")
 
-        self._cells: dict[int, Cell] = cells
+        super().__init__(cells, slots)
         self._index = index
 
     def get(self, index: int) -> Cell:
@@ -20,11 +31,7 @@ class Line(CellCollection):
         if index < 1 or index > 9:
             raise ValueError("Index must be a value between 1 and 9")
 
-        return self._cells[index] if index in self._cells else EmptyCell.create()
-
-    @property
-    def cells(self) -> list[Cell]:
-        return list(self._cells.values())
+        return self._cells[self._slots[index - 1]]
 
     @property
     def index(self) -> int:
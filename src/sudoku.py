@@ -1,23 +1,76 @@
 """Module representing a Sudoku puzzle and its operations."""
 
-import itertools
+from collections.abc import Iterable, Iterator, Sequence
 
 from src.block import Block
+from src.candidates import ALL_CANDIDATES, CANDIDATE_NUMBERS
+from src.units import (
+    BLOCKS,
+    CELL_BLOCK,
+    CELL_UNIT_SLOTS,
+    CELL_UNITS,
+    COLUMNS,
+    LINE_TO_BLOCK,
+    PEERS,
+    POSITIONS,
+    ROWS,
+    UNITS,
+    block_number,
+)
+from src.zobrist import FULL_CELL_CODE, ZOBRIST_KEYS, cell_code, zobrist_hash
 
 from .cell import Cell, EmptyCell, FullCell
 from .line import Column, Row
 
 
 class Sudoku:
-    """Represents a Sudoku puzzle."""
+    """Represents a Sudoku puzzle.
+
+    A Sudoku is immutable: every change returns a new instance. Cells are immutable
+    too, so a new version shares every cell it did not change with the old one and
+    only the 81-slot index is copied.
+
+    Two Sudokus are equal when all their values and candidates are. They are hashed
+    with a Zobrist hash of their cells, so unequal states are almost always told
+    apart without comparing their cells.
+    """
+
+    def __init__(self, cells: tuple[Cell, ...]) -> None:
+        if len(cells) != 81:
+            raise ValueError("A Sudoku must have exactly 81 cells")
+        self._cells: tuple[Cell, ...] = cells
+        self._locations: tuple[int, ...] | None = None
+        self._zobrist: int | None = None
+
+    def __hash__(self) -> int:
+        return self.zobrist
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sudoku):
+            return NotImplemented
+        if self is other:
+            return True
+        return self.zobrist == other.zobrist and self._cells == other._cells
 
-    def __init__(self, cells: dict[tuple[int, int], Cell]) -> None:
-        self._cells: dict[tuple[int, int], Cell] = cells
+    @property
+    def zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the values and candidates.
+
+        Like the locations, the hash is computed on first use and then kept up to
+        date by every change, at the cost of two lookups per changed cell.
+        """
+        if self._zobrist is None:
+            self._zobrist = zobrist_hash(self._cells)
+        return self._zobrist
 
     @property
     def cells(self) -> list[tuple[tuple[int, int], Cell]]:
         """Returns a list of all cells in the Sudoku puzzle with their positions."""
-        return [(position, self._cells[position]) for position in self._cells]
+        return list(zip(POSITIONS, self._cells, strict=True))
+
+    def itercells(self) -> Iterator[tuple[tuple[int, int], Cell]]:
+        """Yields the cells with their positions one at a time, in reading order."""
+        return zip(POSITIONS, self._cells, strict=True)
 
     def set(self, x: int, y: int, number: int | Cell) -> "Sudoku":
         """Creates a copy with the specified cell set to the given number."""
@@ -28,102 +81,288 @@ class Sudoku:
         if isinstance(number, FullCell):
             ensure_no_collisions(self, x, y, number)
 
-        new_cells = self._cells.copy()
+        changes: dict[int, Cell] = {}
         if isinstance(number, FullCell):
-            new_cells = new_cells | self.eliminate_row(y, number.value)
-            new_cells = new_cells | self.eliminate_column(x, number.value)
-            new_cells = new_cells | self.eliminate_block(x, y, number.value)
+            cells = self._cells
+            for peer in PEERS[position_to_index(x, y)]:
+                cell = cells[peer]
+                if isinstance(cell, EmptyCell) and cell.couldbe(number.value):
+                    changes[peer] = cell.eliminate(number.value)
 
-        new_cells[(x, y)] = number
-        return Sudoku(new_cells)
+        changes[position_to_index(x, y)] = number
+        return self._replace(changes)
+
+    @property
+    def locations(self) -> tuple[int, ...]:
+        """Returns for every unit and number the slots where the number can still go.
+
+        The entry for a number in ``UNITS[unit]`` is at ``unit * 9 + number - 1``. It
+        is a mask in which bit ``k`` is set if the empty cell at slot ``k`` of the
+        unit could be the number. The index is built on first use and then kept up
+        to date by every change, so a new version only pays for the changed cells.
+        """
+        if self._locations is None:
+            self._locations = build_locations(self._cells)
+        return self._locations
+
+    def _replace(self, changes: dict[int, Cell]) -> "Sudoku":
+        """Creates a copy in which only the cells at the given indexes are replaced."""
+        old_cells = self._cells
+        new_cells = list(old_cells)
+        for index, cell in changes.items():
+            new_cells[index] = cell
+
+        zobrist = self._zobrist
+        if zobrist is not None:
+            for index, cell in changes.items():
+                keys = ZOBRIST_KEYS[index]
+                zobrist ^= keys[cell_code(old_cells[index])] ^ keys[cell_code(cell)]
+
+        locations = None
+        if self._locations is not None:
+            locations = list(self._locations)
+            for index, cell in changes.items():
+                changed = candidates_of(old_cells[index]) ^ candidates_of(cell)
+                toggle_locations(locations, index, changed)
+            locations = tuple(locations)
+
+        return Sudoku._fromcells(tuple(new_cells), locations, zobrist)
+
+    def transaction(self) -> "SudokuTransaction":
+        """Starts a transaction that applies many eliminations in one copy."""
+        return SudokuTransaction(self)
+
+    def eliminate_all(
+        self, eliminations: Iterable[tuple[tuple[int, int], Iterable[int]]]
+    ) -> "Sudoku":
+        """Eliminates numbers from many cells at once.
+
+        Takes pairs of a position and the numbers to eliminate from that position.
+        Returns this same instance if no candidate was actually eliminated.
+        """
+        transaction = self.transaction()
+        for (x, y), numbers in eliminations:
+            for number in numbers:
+                transaction.eliminate(x, y, number)
+        return transaction.commit()
 
     def eliminate_row(self, y: int, number: int) -> dict[tuple[int, int], Cell]:
         """Eliminates the given number from all empty cells in the specified row."""
-        row = self.getrow(y)
-        row_cells = [(x, row.get(x)) for x in range(1, 10)]
-        return {
-            (x, y): cell.eliminate(number)
-            for x, cell in row_cells
-            if isinstance(cell, EmptyCell)
-        }
+        return self._eliminate_unit(ROWS[y - 1], number)
 
     def eliminate_column(self, x: int, number: int) -> dict[tuple[int, int], Cell]:
         """Eliminates the given number from all empty cells in the specified column."""
-        column = self.getcolumn(x)
-        column_cells = [(y, column.get(y)) for y in range(1, 10)]
-        return {
-            (x, y): cell.eliminate(number)
-            for y, cell in column_cells
-            if isinstance(cell, EmptyCell)
-        }
+        return self._eliminate_unit(COLUMNS[x - 1], number)
 
     def eliminate_block(
         self, x: int, y: int, number: int
     ) -> dict[tuple[int, int], Cell]:
         """Eliminates the given number from all empty cells in the specified block."""
-        block = self.getblockfromcell(x, y)
-        cells = [
-            (blockx, blocky, block.get(blockx, blocky))
-            for blockx, blocky in itertools.product(range(1, 4), range(1, 4))
-        ]
+        return self._eliminate_unit(BLOCKS[CELL_BLOCK[position_to_index(x, y)]], number)
+
+    def _eliminate_unit(
+        self, unit: tuple[int, ...], number: int
+    ) -> dict[tuple[int, int], Cell]:
+        """Eliminates the given number from all empty cells in the given unit."""
         return {
-            block.local_to_global(blockx, blocky): cell.eliminate(number)
-            for blockx, blocky, cell in cells
-            if isinstance(cell, EmptyCell)
+            POSITIONS[index]: cell.eliminate(number)
+            for index in unit
+            if isinstance(cell := self._cells[index], EmptyCell)
         }
 
     def getrow(self, index: int) -> Row:
-        """Gets a row from the Sudoku puzzle."""
-        row = {x: self._cells[(x, y)] for x, y in self._cells.keys() if y == index}
-        return Row(index, row)
+        """Gets a view on a row of the Sudoku puzzle."""
+        ensure_y_inside_bounds(index)
+        return Row(index, self._cells, ROWS[index - 1])
 
     def getcolumn(self, index: int) -> Column:
-        """Gets a column from the Sudoku puzzle."""
-        column = {y: self._cells[(x, y)] for x, y in self._cells.keys() if x == index}
-        return Column(index, column)
+        """Gets a view on a column of the Sudoku puzzle."""
+        ensure_x_inside_bounds(index)
+        return Column(index, self._cells, COLUMNS[index - 1])
 
     def getblock(self, x: int, y: int) -> Block:
-        """Gets a 3x3 block from the Sudoku puzzle."""
+        """Gets a view on a 3x3 block of the Sudoku puzzle."""
         if x < 1 or x > 3:
             raise ValueError("x must be between 1 and 3")
         if y < 1 or y > 3:
             raise ValueError("y must be between 1 and 3")
 
-        min_x = x * 3 - 2
-        min_y = y * 3 - 2
-        max_x = min_x + 3
-        max_y = min_y + 3
-        block = {
-            (x - min_x + 1, y - min_y + 1): self._cells[(x, y)]
-            for x, y in self._cells.keys()
-            if min_x <= x < max_x and min_y <= y < max_y
-        }
-        return Block((min_x - 1, min_y - 1), block)
+        return Block((x * 3 - 3, y * 3 - 3), self._cells, BLOCKS[block_number(x, y)])
 
     def getblockfromcell(self, x: int, y: int) -> Block:
         """Gets the block that contains the specified cell."""
-        blockx = ((x - 1) // 3) + 1
-        blocky = ((y - 1) // 3) + 1
-        return self.getblock(blockx, blocky)
+        return self.getblock(LINE_TO_BLOCK[x], LINE_TO_BLOCK[y])
 
     def get(self, x: int, y: int) -> Cell:
         """Gets a cell from the Sudoku puzzle using global coordinates."""
-        return self._cells[(x, y)] if (x, y) in self._cells else EmptyCell.create()
+        ensure_position_inside_bounds(x, y)
+        return self._cells[position_to_index(x, y)]
+
+    @staticmethod
+    def _fromcells(
+        cells: tuple[Cell, ...],
+        locations: tuple[int, ...] | None = None,
+        zobrist: int | None = None,
+    ) -> "Sudoku":
+        """Wraps cell storage that is already known to be valid."""
+        sudoku = object.__new__(Sudoku)
+        sudoku._cells = cells
+        sudoku._locations = locations
+        sudoku._zobrist = zobrist
+        return sudoku
 
     @staticmethod
     def empty() -> "Sudoku":
         """Creates an empty Sudoku puzzle."""
-        return Sudoku({})
+        return _EMPTY_SUDOKU
 
     @staticmethod
     def fromarray(values: list[list[int | None]]) -> "Sudoku":
         """Creates a Sudoku puzzle from a 2D array representation."""
         result = Sudoku.empty()
-        for x, y in itertools.product(range(0, 9), range(0, 9)):
-            if input_is_number(values, x, y):
-                result = result.set(x + 1, y + 1, FullCell(values[y][x]))
+        for x, y in POSITIONS:
+            if input_is_number(values, x - 1, y - 1):
+                result = result.set(x, y, FullCell(values[y - 1][x - 1]))
         return result
 
+    @staticmethod
+    def fromdigits(digits: Sequence[int]) -> "Sudoku":
+        """Creates a Sudoku puzzle from 81 numbers in reading order, 0 for empty.
+
+        Works in a single pass over the givens: the numbers of every unit are
+        collected as masks, which both detects collisions and gives the candidates
+        of the empty cells, instead of placing the givens one at a time.
+        """
+        if len(digits) != 81:
+            raise ValueError("A Sudoku must have exactly 81 cells")
+        used = [0] * 27
+        for index, digit in enumerate(digits):
+            if digit:
+                if digit > 9:
+                    raise ValueError("Value must be between 1 and 9")
+                bit = 1 << (digit - 1)
+                (row, column, block) = CELL_UNITS[index]
+                if (used[row] | used[column] | used[block]) & bit:
+                    raise ValueError(collision_message(used, index, bit))
+                used[row] |= bit
+                used[column] |= bit
+                used[block] |= bit
+
+        cells = tuple(
+            FULL_CELLS[digit - 1]
+            if digit
+            else EmptyCell.frommask(
+                ALL_CANDIDATES & ~(used[row] | used[column] | used[block])
+            )
+            for digit, (row, column, block) in zip(digits, CELL_UNITS, strict=True)
+        )
+        return Sudoku._fromcells(cells)
+
+    @staticmethod
+    def fromcodes(codes: Sequence[int]) -> "Sudoku":
+        """Restores a Sudoku from the code of every cell, as given by ``cell_code``.
+
+        The codes hold the candidates of empty cells as well as the values, so every
+        elimination is restored. The cells are not checked for collisions: this is
+        meant for states that were saved from a valid Sudoku, and takes a single
+        lookup per cell.
+        """
+        if len(codes) != 81:
+            raise ValueError("A Sudoku must have exactly 81 cells")
+        try:
+            return Sudoku._fromcells(tuple(map(CODE_CELLS.__getitem__, codes)))
+        except KeyError as error:
+            raise ValueError(f"Invalid cell code {error.args[0]}") from None
+
+
+class SudokuTransaction:
+    """Collects eliminations on a Sudoku and applies them in a single copy."""
+
+    def __init__(self, sudoku: Sudoku) -> None:
+        self._sudoku = sudoku
+        self._changes: dict[int, Cell] = {}
+
+    def eliminate(self, x: int, y: int, number: int) -> None:
+        """Eliminates a number from the cell at the given position.
+
+        Eliminating a number from a full cell or from a cell that already could not
+        be that number is allowed and does not change anything.
+        """
+        ensure_position_inside_bounds(x, y)
+        index = position_to_index(x, y)
+        cell = self._changes.get(index, self._sudoku._cells[index])
+        if isinstance(cell, EmptyCell) and cell.couldbe(number):
+            self._changes[index] = cell.eliminate(number)
+        elif number < 1 or number > 9:
+            raise ValueError("Number must be between 1 and 9")
+
+    @property
+    def changed(self) -> bool:
+        """Checks if committing the transaction would change the Sudoku."""
+        return len(self._changes) > 0
+
+    @property
+    def changed_positions(self) -> list[tuple[int, int]]:
+        """Returns the positions of the cells that committing would change."""
+        return [POSITIONS[index] for index in self._changes]
+
+    def commit(self) -> Sudoku:
+        """Returns the Sudoku with all eliminations applied.
+
+        Returns the original instance if nothing changed.
+        """
+        if not self._changes:
+            return self._sudoku
+        return self._sudoku._replace(self._changes)
+
+
+_EMPTY_SUDOKU = Sudoku((EmptyCell.create(),) * 81)
+
+FULL_CELLS: tuple[FullCell, ...] = tuple(FullCell(number) for number in range(1, 10))
+"""A shared full cell for every number, at the index of the number minus one."""
+
+CODE_CELLS: dict[int, Cell] = {
+    **{mask: EmptyCell.frommask(mask) for mask in range(FULL_CELL_CODE)},
+    **{FULL_CELL_CODE + cell.value: cell for cell in FULL_CELLS},
+}
+"""The shared cell of every code given by ``cell_code``."""
+
+COLLISIONS = (
+    "Same number is already present in this row",
+    "Same number is already present in this column",
+    "Same number is already present in this block",
+)
+"""The error for a number that is already present in a row, column or block."""
+
+
+def candidates_of(cell: Cell) -> int:
+    """Returns the candidate mask of a cell, which is empty for a full cell."""
+    return cell.candidates if isinstance(cell, EmptyCell) else 0
+
+
+def build_locations(cells: tuple[Cell, ...]) -> tuple[int, ...]:
+    """Builds the index of slots per unit and number from scratch."""
+    locations = [0] * 243
+    for index, cell in enumerate(cells):
+        toggle_locations(locations, index, candidates_of(cell))
+    return tuple(locations)
+
+
+def toggle_locations(locations: list[int], index: int, numbers: int) -> None:
+    """Toggles a cell in the index of slots for every number in the given mask."""
+    if not numbers:
+        return
+    for unit, slot in zip(CELL_UNITS[index], CELL_UNIT_SLOTS[index], strict=True):
+        bit = 1 << slot
+        base = unit * 9 - 1
+        for number in CANDIDATE_NUMBERS[numbers]:
+            locations[base + number] ^= bit
+
+
+def position_to_index(x: int, y: int) -> int:
+    """Converts a position in the Sudoku grid to an index in the cell storage."""
+    return (y - 1) * 9 + (x - 1)
+
 
 def input_is_number(values: list[list[int | None]], x: int, y: int) -> bool:
     """Checks if the input at the given coordinates is a number."""
@@ -132,12 +371,25 @@ def input_is_number(values: list[list[int | None]], x: int, y: int) -> bool:
 
 def ensure_no_collisions(sudoku: Sudoku, x: int, y: int, number: FullCell) -> None:
     """Ensure that it is valid to place the given number at the specified position."""
-    if sudoku.getrow(y).contains(number.value):
-        raise ValueError("Same number is already present in this row")
-    if sudoku.getcolumn(x).contains(number.value):
-        raise ValueError("Same number is already present in this column")
-    if sudoku.getblockfromcell(x, y).contains(number.value):
-        raise ValueError("Same number is already present in this block")
+    for unit, message in zip(
+        CELL_UNITS[position_to_index(x, y)], COLLISIONS, strict=True
+    ):
+        if unit_contains(sudoku, unit, number):
+            raise ValueError(message)
+
+
+def collision_message(used: list[int], index: int, bit: int) -> str:
+    """Describes which unit of a cell already contains a number."""
+    for unit, message in zip(CELL_UNITS[index], COLLISIONS, strict=True):
+        if used[unit] & bit:
+            return message
+    raise ValueError("The number does not collide")
+
+
+def unit_contains(sudoku: Sudoku, unit: int, number: FullCell) -> bool:
+    """Checks if the given unit already contains the given number."""
+    cells = sudoku._cells
+    return any(cells[index] == number for index in UNITS[unit])
 
 
 def ensure_number_is_cell(number: int | Cell) -> Cell:
@@ -0,0 +1,300 @@
+"""Module for analysing large batches of Sudoku puzzles with NumPy.
+
+A batch of N puzzles is stored as two ``(N, 81)`` arrays: the digits, with 0 for
+empty cells, and the candidates of every cell as a 9-bit mask, with 0 for full
+cells. The rules run on the whole batch at once by gathering the cells of all 27
+units through precomputed index arrays, so there is no Python loop over puzzles or
+cells. NumPy is an optional dependency, installed with the ``array`` extra.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from src.candidates import ALL_CANDIDATES, CANDIDATE_COUNT
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.units import (
+    BLOCK_UNITS,
+    CELL_UNITS,
+    COLUMN_UNITS,
+    INTERSECTIONS,
+    POSITIONS,
+    ROW_UNITS,
+    UNITS,
+)
+
+type Digits = npt.NDArray[np.uint8]
+type Candidates = npt.NDArray[np.uint16]
+type Mask = npt.NDArray[np.bool_]
+
+UNIT_INDEXES: npt.NDArray[np.intp] = np.array(UNITS, dtype=np.intp)
+"""The cell indexes of the 27 units, shaped ``(27, 9)``."""
+
+CELL_UNIT_INDEXES: npt.NDArray[np.intp] = np.array(CELL_UNITS, dtype=np.intp)
+"""The row, column and block unit of every cell, shaped ``(81, 3)``."""
+
+CANDIDATE_COUNTS: npt.NDArray[np.uint8] = np.array(CANDIDATE_COUNT, dtype=np.uint8)
+"""The number of candidates in every mask."""
+
+MASK_TO_NUMBER: npt.NDArray[np.uint8] = np.array(
+    [mask.bit_length() if mask.bit_count() == 1 else 0 for mask in range(512)],
+    dtype=np.uint8,
+)
+"""The only number in every mask, or 0 if the mask has zero or several numbers."""
+
+NUMBER_TO_MASK: npt.NDArray[np.uint16] = np.array(
+    [0] + [1 << (number - 1) for number in range(1, 10)], dtype=np.uint16
+)
+"""The mask of every number, with 0 for an empty cell."""
+
+INTERSECTION_CELLS: npt.NDArray[np.intp] = np.array(
+    [intersection.cells for intersection in INTERSECTIONS], dtype=np.intp
+)
+"""The three cells of each of the 54 line and block intersections."""
+
+INTERSECTION_LINE_REST: npt.NDArray[np.intp] = np.array(
+    [intersection.line_rest for intersection in INTERSECTIONS], dtype=np.intp
+)
+"""The six cells of the line outside the block, for each intersection."""
+
+INTERSECTION_BLOCK_REST: npt.NDArray[np.intp] = np.array(
+    [intersection.block_rest for intersection in INTERSECTIONS], dtype=np.intp
+)
+"""The six cells of the block outside the line, for each intersection."""
+
+
+def _intersections_with_rest(rest: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+    """For every cell, lists the intersections that have the cell in their rest."""
+    return np.array(
+        [np.flatnonzero((rest == index).any(axis=1)) for index in range(81)],
+        dtype=np.intp,
+    )
+
+
+CELL_IN_LINE_REST: npt.NDArray[np.intp] = _intersections_with_rest(
+    INTERSECTION_LINE_REST
+)
+"""The four intersections that have each cell in the rest of their line."""
+
+CELL_IN_BLOCK_REST: npt.NDArray[np.intp] = _intersections_with_rest(
+    INTERSECTION_BLOCK_REST
+)
+"""The four intersections that have each cell in the rest of their block."""
+
+EMPTY_CHARACTERS = b".0"
+
+
+class SudokuArray:
+    """A batch of Sudoku puzzles stored as NumPy arrays.
+
+    Like a Sudoku, a SudokuArray is never changed: every rule returns a new batch.
+    """
+
+    def __init__(self, digits: Digits, candidates: Candidates) -> None:
+        if digits.ndim != 2 or digits.shape[1] != 81:
+            raise ValueError("Digits must be shaped (N, 81)")
+        if candidates.shape != digits.shape:
+            raise ValueError("Candidates must have the same shape as the digits")
+        self.digits: Digits = digits.astype(np.uint8, copy=False)
+        self.candidates: Candidates = candidates.astype(np.uint16, copy=False)
+
+    def __len__(self) -> int:
+        return self.digits.shape[0]
+
+    def eliminate_peers(self) -> "SudokuArray":
+        """Removes the numbers that are already placed in a unit from its cells."""
+        used = unit_masks(self.digits)
+        taken = np.bitwise_or.reduce(used[:, CELL_UNIT_INDEXES], axis=2)
+        candidates = self.candidates & ~taken
+        candidates[self.digits != 0] = 0
+        return SudokuArray(self.digits, candidates)
+
+    def naked_singles(self) -> Mask:
+        """Marks the empty cells that have only one possible number."""
+        return (self.digits == 0) & (CANDIDATE_COUNTS[self.candidates] == 1)
+
+    def hidden_single_numbers(self, units: range) -> Candidates:
+        """Returns, for every cell, the numbers that fit nowhere else in one of the
+        given units."""
+        unit_candidates = self.candidates[:, UNIT_INDEXES[units.start : units.stop]]
+        once = np.zeros(unit_candidates.shape[:2], dtype=np.uint16)
+        twice = np.zeros_like(once)
+        for slot in range(9):
+            twice |= once & unit_candidates[:, :, slot]
+            once |= unit_candidates[:, :, slot]
+        unique = unit_candidates & (once & ~twice)[:, :, np.newaxis]
+
+        numbers = np.zeros_like(self.candidates)
+        numbers[:, UNIT_INDEXES[units.start : units.stop].ravel()] = unique.reshape(
+            len(self), -1
+        )
+        return numbers
+
+    def hidden_singles(self, units: range) -> Mask:
+        """Marks the cells that have a number that fits nowhere else in one of the
+        given units."""
+        return self.hidden_single_numbers(units) != 0
+
+    def hints(self) -> Mask:
+        """Marks every naked single and every hidden single in a row, column or
+        block, like the finders of sudokufinder do for a single Sudoku."""
+        return (
+            self.naked_singles()
+            | self.hidden_singles(ROW_UNITS)
+            | self.hidden_singles(COLUMN_UNITS)
+            | self.hidden_singles(BLOCK_UNITS)
+        )
+
+    def place_singles(self) -> "SudokuArray":
+        """Places every naked and hidden single, then eliminates the new digits from
+        their peers.
+
+        A cell with more than one hidden number is a contradiction and is left
+        empty, so contradictions can still find it.
+        """
+        hidden = (
+            self.hidden_single_numbers(ROW_UNITS)
+            | self.hidden_single_numbers(COLUMN_UNITS)
+            | self.hidden_single_numbers(BLOCK_UNITS)
+        )
+        singles = np.where(hidden != 0, hidden, self.candidates)
+        numbers = np.where(self.digits == 0, MASK_TO_NUMBER[singles], 0)
+        digits = np.where(numbers != 0, numbers, self.digits).astype(np.uint8)
+        return SudokuArray(digits, self.candidates).eliminate_peers()
+
+    def propagate(self) -> "SudokuArray":
+        """Places singles until no puzzle in the batch changes any more."""
+        batch = self.eliminate_peers()
+        while True:
+            placed = batch.place_singles()
+            if np.array_equal(placed.digits, batch.digits):
+                return placed
+            batch = placed
+
+    def line_into_block_eliminations(self) -> Candidates:
+        """Returns, for every cell, the numbers that a line confines to the block
+        of the cell without passing through the cell.
+
+        A number that can only be in the intersection of a line and a block must be
+        in that intersection, so it is removed from the rest of the block.
+        """
+        (inside, line_rest, block_rest) = self._intersection_masks()
+        confined = inside & ~line_rest & block_rest
+        return np.bitwise_or.reduce(confined[:, CELL_IN_BLOCK_REST], axis=2)
+
+    def block_into_line_eliminations(self) -> Candidates:
+        """Returns, for every cell, the numbers that a block confines to the line of
+        the cell without passing through the cell.
+
+        A number that can only be in the intersection of a block and a line must be
+        in that intersection, so it is removed from the rest of the line.
+        """
+        (inside, line_rest, block_rest) = self._intersection_masks()
+        confined = inside & ~block_rest & line_rest
+        return np.bitwise_or.reduce(confined[:, CELL_IN_LINE_REST], axis=2)
+
+    def eliminate(self, numbers: Candidates) -> "SudokuArray":
+        """Removes the given numbers from the candidates of every cell."""
+        return SudokuArray(self.digits, self.candidates & ~numbers)
+
+    def extrapolate_until_stable(self) -> "SudokuArray":
+        """Applies line into block and block into line eliminations until no
+        puzzle in the batch changes any more."""
+        batch = self
+        while True:
+            eliminations = (
+                batch.line_into_block_eliminations()
+                | batch.block_into_line_eliminations()
+            ) & batch.candidates
+            if not eliminations.any():
+                return batch
+            batch = batch.eliminate(eliminations)
+
+    def _intersection_masks(self) -> tuple[Candidates, Candidates, Candidates]:
+        """Returns the candidates in every intersection, in the rest of its line and
+        in the rest of its block, each shaped ``(N, 54)``."""
+        candidates = self.candidates
+        return (
+            np.bitwise_or.reduce(candidates[:, INTERSECTION_CELLS], axis=2),
+            np.bitwise_or.reduce(candidates[:, INTERSECTION_LINE_REST], axis=2),
+            np.bitwise_or.reduce(candidates[:, INTERSECTION_BLOCK_REST], axis=2),
+        )
+
+    def contradictions(self) -> Mask:
+        """Marks the puzzles that have an empty cell without candidates or a number
+        twice in a unit."""
+        empty_without_candidates = (self.digits == 0) & (self.candidates == 0)
+        filled = (self.digits[:, UNIT_INDEXES] != 0).sum(axis=2)
+        distinct = CANDIDATE_COUNTS[unit_masks(self.digits)]
+        return empty_without_candidates.any(axis=1) | (filled != distinct).any(axis=1)
+
+    def solved(self) -> Mask:
+        """Marks the puzzles in which every cell is filled."""
+        return (self.digits != 0).all(axis=1)
+
+    def tosudoku(self, index: int) -> Sudoku:
+        """Converts one puzzle of the batch to a Sudoku."""
+        cells: list[Cell] = [
+            FullCell(int(digit)) if digit else EmptyCell.frommask(int(candidates))
+            for digit, candidates in zip(
+                self.digits[index], self.candidates[index], strict=True
+            )
+        ]
+        return Sudoku(tuple(cells))
+
+    def tosudokus(self) -> list[Sudoku]:
+        """Converts every puzzle of the batch to a Sudoku."""
+        return [self.tosudoku(index) for index in range(len(self))]
+
+    @staticmethod
+    def fromstrings(puzzles: Iterable[str]) -> "SudokuArray":
+        """Reads a batch from puzzles of 81 characters, with ``.`` or ``0`` for empty
+        cells, and eliminates the given digits from their peers."""
+        lines = [puzzle.strip().encode("ascii") for puzzle in puzzles]
+        if any(len(line) != 81 for line in lines):
+            raise ValueError("A Sudoku line must contain exactly 81 characters")
+        characters = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(-1, 81)
+
+        is_digit = (characters >= ord("1")) & (characters <= ord("9"))
+        is_empty = np.isin(characters, np.frombuffer(EMPTY_CHARACTERS, dtype=np.uint8))
+        if not (is_digit | is_empty).all():
+            raise ValueError("A Sudoku line may only contain digits and '.'")
+
+        digits = np.where(is_digit, characters - ord("0"), 0).astype(np.uint8)
+        candidates = np.where(is_digit, 0, ALL_CANDIDATES).astype(np.uint16)
+        return SudokuArray(digits, candidates).eliminate_peers()
+
+    @staticmethod
+    def fromsudokus(sudokus: Iterable[Sudoku]) -> "SudokuArray":
+        """Builds a batch from Sudokus, keeping the candidates they have left."""
+        cells = [[cell for _, cell in sudoku.cells] for sudoku in sudokus]
+        digits = np.array(
+            [[cell_digit(cell) for cell in row] for row in cells], dtype=np.uint8
+        ).reshape(-1, 81)
+        candidates = np.array(
+            [[cell_candidates(cell) for cell in row] for row in cells],
+            dtype=np.uint16,
+        ).reshape(-1, 81)
+        return SudokuArray(digits, candidates)
+
+
+def unit_masks(digits: Digits) -> Candidates:
+    """Returns the mask of the numbers placed in every unit, shaped ``(N, 27)``."""
+    return np.bitwise_or.reduce(NUMBER_TO_MASK[digits][:, UNIT_INDEXES], axis=2)
+
+
+def cell_digit(cell: Cell) -> int:
+    """Returns the value of a full cell, or 0 for an empty cell."""
+    return cell.value if isinstance(cell, FullCell) else 0
+
+
+def cell_candidates(cell: Cell) -> int:
+    """Returns the candidates of an empty cell, or 0 for a full cell."""
+    return cell.candidates if isinstance(cell, EmptyCell) else 0
+
+
+def mask_to_positions(mask: Mask) -> list[tuple[int, int]]:
+    """Converts a mask of one puzzle's cells to positions in reading order."""
+    return [POSITIONS[index] for index in np.flatnonzero(mask)]
@@ -0,0 +1,173 @@
+"""Module for running the hint pipeline or a solver over many puzzles in parallel.
+
+Puzzles travel between processes as 81 character strings, and results come back
+as strings too, which is much cheaper to pickle than a Sudoku with its cells. The
+puzzles are sent in chunks so the cost of every round trip is shared by many
+puzzles, and only a few chunks are in flight at a time, so memory stays flat on
+corpora of any size. Results are yielded in input order.
+"""
+
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+
+from src.hintcache import HintCache
+from src.instrumentation import INSTRUMENTATION, RuleStats
+from src.sudokuhints import find_hints
+from src.sudokureader import sudoku_from_string
+from src.sudokusolver import solve
+from src.sudokuwriter import positions_to_string, sudoku_to_string
+
+type Task = Callable[[str], str]
+
+ERROR_PREFIX = "error: "
+"""Starts the result of a puzzle that could not be read."""
+
+
+def hint_puzzle(puzzle: str) -> str:
+    """Returns the puzzle and the positions of its hints, separated by a tab."""
+    hints = find_hints(sudoku_from_string(puzzle))
+    return puzzle + "\t" + positions_to_string(hints.positions)
+
+
+def run_task(task: Task, puzzle: str) -> str:
+    """Runs a task on a puzzle, turning a malformed puzzle into an error result.
+
+    A bad line in a large corpus then only costs its own result, instead of
+    stopping the whole batch.
+    """
+    try:
+        return task(puzzle)
+    except ValueError as error:
+        return puzzle + "\t" + ERROR_PREFIX + str(error)
+
+
+def cached_hint_task(cache: HintCache) -> Task:
+    """Returns a task like hint_puzzle that looks up every puzzle in a cache.
+
+    The task holds on to the cache, so it can only run in this process.
+    """
+
+    def hint_cached_puzzle(puzzle: str) -> str:
+        positions = cache.find_hints(sudoku_from_string(puzzle))
+        return puzzle + "\t" + positions_to_string(positions)
+
+    return hint_cached_puzzle
+
+
+def solve_puzzle(puzzle: str) -> str:
+    """Returns the puzzle and its solution, separated by a tab.
+
+    The solution is left empty if the puzzle cannot be solved.
+    """
+    solution = solve(sudoku_from_string(puzzle))
+    return puzzle + "\t" + (sudoku_to_string(solution) if solution else "")
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    """The results of one chunk, and the worker process that computed them."""
+
+    worker: int
+    seconds: float
+    results: list[str]
+    rules: dict[str, RuleStats] = field(default_factory=dict)
+
+
+def run_chunk(
+    task: Task, puzzles: tuple[str, ...], instrument: bool = False
+) -> ChunkResult:
+    """Runs a task on every puzzle of a chunk inside a worker process.
+
+    With instrument, the statistics of the rules used for this chunk are sent back
+    with the results.
+    """
+    INSTRUMENTATION.enabled = instrument
+    INSTRUMENTATION.reset()
+    start = time.perf_counter()
+    results = [run_task(task, puzzle) for puzzle in puzzles]
+    seconds = time.perf_counter() - start
+    return ChunkResult(os.getpid(), seconds, results, INSTRUMENTATION.rules)
+
+
+@dataclass
+class BatchStats:
+    """Counts the puzzles processed in a batch and the time spent on them."""
+
+    puzzles: int = 0
+    seconds: float = 0.0
+    worker_puzzles: dict[int, int] = field(default_factory=dict)
+    worker_seconds: dict[int, float] = field(default_factory=dict)
+
+    def add(self, chunk: ChunkResult) -> None:
+        """Adds the results of a chunk to the counts of its worker."""
+        self.puzzles += len(chunk.results)
+        self.worker_puzzles[chunk.worker] = self.worker_puzzles.get(
+            chunk.worker, 0
+        ) + len(chunk.results)
+        self.worker_seconds[chunk.worker] = (
+            self.worker_seconds.get(chunk.worker, 0.0) + chunk.seconds
+        )
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of puzzles processed per second of wall time."""
+        return self.puzzles / self.seconds if self.seconds else 0.0
+
+    def report(self) -> str:
+        """Describes the overall throughput and the throughput of every worker."""
+        lines = [
+            f"{self.puzzles} puzzles in {self.seconds:.2f}s "
+            f"({self.throughput:.1f} puzzles/s)"
+        ]
+        for worker, puzzles in sorted(self.worker_puzzles.items()):
+            seconds = self.worker_seconds[worker]
+            rate = puzzles / seconds if seconds else 0.0
+            lines.append(f"  worker {worker}: {puzzles} puzzles ({rate:.1f} puzzles/s)")
+        return "\n".join(lines)
+
+
+class BatchRunner:
+    """Runs a task over a stream of puzzles on a pool of worker processes.
+
+    If instrumentation is enabled when the batch starts, the workers record the
+    statistics of their rules too, and these are added to the statistics of this
+    process.
+    """
+
+    def __init__(
+        self, task: Task, workers: int | None = None, chunksize: int = 64
+    ) -> None:
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._task = task
+        self._workers = workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+        self.stats = BatchStats()
+
+    def run(self, puzzles: Iterable[str]) -> Iterator[str]:
+        """Yields the result of the task for every puzzle, in input order."""
+        start = time.perf_counter()
+        instrument = INSTRUMENTATION.enabled
+        pending: deque[Future[ChunkResult]] = deque()
+        with ProcessPoolExecutor(self._workers) as executor:
+            for chunk in batched(puzzles, self._chunksize, strict=False):
+                pending.append(
+                    executor.submit(run_chunk, self._task, chunk, instrument)
+                )
+                if len(pending) >= self._workers * 2:
+                    yield from self._collect(pending.popleft(), start)
+            while pending:
+                yield from self._collect(pending.popleft(), start)
+
+    def _collect(self, future: Future[ChunkResult], start: float) -> list[str]:
+        """Waits for a chunk and adds it to the statistics."""
+        chunk = future.result()
+        self.stats.add(chunk)
+        INSTRUMENTATION.merge(chunk.rules)
+        self.stats.seconds = time.perf_counter() - start
+        return chunk.results
@@ -0,0 +1,225 @@
+"""Module for storing Sudoku puzzles in a compact binary file.
+
+A file starts with an 8-byte header: the magic ``SDKB``, a version, flags and two
+reserved bytes. Every puzzle then takes a record of the same size, so the record
+of puzzle ``i`` starts at ``HEADER.size + i * record_size`` and can be read
+without scanning the file. A record holds the values of the 81 cells packed two
+per byte, 4 bits each, in 41 bytes. With the ``HAS_CANDIDATES`` flag it is
+followed by the 9-bit candidate masks of all cells packed into 92 bytes, so the
+eliminations made so far are kept too.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import BinaryIO
+
+from src.cell import EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.sudokureader import digits_from_file
+from src.zobrist import FULL_CELL_CODE
+
+MAGIC = b"SDKB"
+VERSION = 1
+HAS_CANDIDATES = 1
+"""The flag of files whose records include the candidates of every cell."""
+
+HEADER = struct.Struct("<4sBB2x")
+"""The magic, version and flags at the start of every file."""
+
+VALUES_SIZE = 41
+"""The size of 81 values packed 4 bits each."""
+
+CANDIDATES_SIZE = 92
+"""The size of 81 candidate masks packed 9 bits each."""
+
+LOW_NIBBLES = bytes(byte & 0xF for byte in range(256))
+HIGH_NIBBLES = bytes(byte >> 4 for byte in range(256))
+
+TEXT_TABLE = bytes.maketrans(bytes(range(10)), b".123456789")
+"""Translates the numbers of cells to the characters of the text format."""
+
+
+def record_size(candidates: bool) -> int:
+    """Returns the size of a record, with or without candidates."""
+    return VALUES_SIZE + CANDIDATES_SIZE if candidates else VALUES_SIZE
+
+
+def pack_values(digits: bytes) -> bytes:
+    """Packs 81 numbers from 0 to 9 into 41 bytes, the first cell in the low bits.
+
+    Every number fits in 4 bits, so shifting the odd cells as one big integer moves
+    each of them into the high half of its byte without touching the others.
+    """
+    low = int.from_bytes(digits[0::2], "little")
+    high = int.from_bytes(digits[1::2], "little")
+    return (low | high << 4).to_bytes(VALUES_SIZE, "little")
+
+
+def unpack_values(packed: bytes | memoryview) -> bytes:
+    """Unpacks the 81 numbers held by the first 41 bytes of a record."""
+    values = bytes(packed[:VALUES_SIZE])
+    digits = bytearray(VALUES_SIZE * 2)
+    digits[0::2] = values.translate(LOW_NIBBLES)
+    digits[1::2] = values.translate(HIGH_NIBBLES)
+    return bytes(digits[:81])
+
+
+def pack_candidates(sudoku: Sudoku) -> bytes:
+    """Packs the candidate masks of all cells into 92 bytes, 0 for full cells."""
+    packed = 0
+    for shift, (_, cell) in zip(range(0, 729, 9), sudoku.cells, strict=True):
+        if isinstance(cell, EmptyCell):
+            packed |= cell.candidates << shift
+    return packed.to_bytes(CANDIDATES_SIZE, "little")
+
+
+def unpack_candidates(packed: bytes | memoryview) -> list[int]:
+    """Unpacks 92 bytes into the candidate masks of all cells."""
+    masks = int.from_bytes(packed, "little")
+    return [(masks >> shift) & 0x1FF for shift in range(0, 729, 9)]
+
+
+def pack_sudoku(sudoku: Sudoku, candidates: bool = False) -> bytes:
+    """Packs a Sudoku into a record, with or without its candidates."""
+    digits = bytes(
+        cell.value if isinstance(cell, FullCell) else 0 for _, cell in sudoku.cells
+    )
+    if not candidates:
+        return pack_values(digits)
+    return pack_values(digits) + pack_candidates(sudoku)
+
+
+def unpack_sudoku(record: bytes | memoryview) -> Sudoku:
+    """Unpacks a record into a Sudoku.
+
+    Without candidates, the grid is built from the values and checked for
+    collisions. With candidates, the cells are restored exactly as they were
+    written, without checking them again.
+    """
+    digits = unpack_values(record)
+    if len(record) == VALUES_SIZE:
+        return Sudoku.fromdigits(digits)
+
+    masks = unpack_candidates(record[VALUES_SIZE:])
+    return Sudoku.fromcodes(
+        [
+            FULL_CELL_CODE + digit if digit else mask
+            for digit, mask in zip(digits, masks, strict=True)
+        ]
+    )
+
+
+def write_header(file: BinaryIO, candidates: bool) -> None:
+    """Writes the header of a file, with or without candidates."""
+    file.write(HEADER.pack(MAGIC, VERSION, HAS_CANDIDATES if candidates else 0))
+
+
+def write_sudokus(
+    filename: str, sudokus: Iterable[Sudoku], candidates: bool = False
+) -> int:
+    """Writes Sudokus to a binary file and returns how many were written."""
+    count = 0
+    with open(filename, "wb") as file:
+        write_header(file, candidates)
+        for sudoku in sudokus:
+            file.write(pack_sudoku(sudoku, candidates))
+            count += 1
+    return count
+
+
+def text_to_binary(source: str, target: str, candidates: bool = False) -> int:
+    """Converts a text file that the reader understands into a binary file.
+
+    Without candidates, the values are packed as they are read, so collisions are
+    only detected when a puzzle is unpacked. With candidates, every puzzle is built
+    first to find them.
+    """
+    count = 0
+    with open(target, "wb") as file:
+        write_header(file, candidates)
+        for digits in digits_from_file(source):
+            if candidates:
+                file.write(pack_sudoku(Sudoku.fromdigits(digits), candidates))
+            else:
+                file.write(pack_values(digits))
+            count += 1
+    return count
+
+
+def binary_to_text(source: str, target: str) -> int:
+    """Converts a binary file into a text file with one puzzle per line.
+
+    Only the values are written, since the text format has no candidates.
+    """
+    count = 0
+    with PackedSudokus(source) as puzzles, open(target, "w", encoding="utf-8") as file:
+        for digits in map(unpack_values, puzzles.records()):
+            file.write(digits.translate(TEXT_TABLE).decode("ascii") + "\n")
+            count += 1
+    return count
+
+
+class PackedSudokus:
+    """A binary file of Sudokus opened through a memory map for random access."""
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, "rb") as file:
+            if file.seek(0, 2) < HEADER.size:
+                raise ValueError("A binary Sudoku file must start with a header")
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, flags) = HEADER.unpack_from(self._map)
+        self.candidates = bool(flags & HAS_CANDIDATES)
+        self._size = record_size(self.candidates)
+        (self._count, rest) = divmod(len(self._map) - HEADER.size, self._size)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError("Not a binary Sudoku file of a supported version")
+        if rest:
+            self._map.close()
+            raise ValueError("A binary Sudoku file must end with a whole record")
+        self._view = memoryview(self._map)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Sudoku:
+        return unpack_sudoku(self.record(index))
+
+    def __iter__(self) -> Iterator[Sudoku]:
+        return map(unpack_sudoku, self.records())
+
+    def __enter__(self) -> "PackedSudokus":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def record(self, index: int) -> memoryview:
+        """Returns the record of a puzzle as a view on the file, without copying."""
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Puzzle index out of range")
+        start = HEADER.size + index * self._size
+        return self._view[start : start + self._size]
+
+    def records(self) -> Iterator[memoryview]:
+        """Iterates over the records of all puzzles as views on the file."""
+        for start in range(HEADER.size, len(self._view), self._size):
+            yield self._view[start : start + self._size]
+
+    def close(self) -> None:
+        """Closes the memory map.
+
+        Like any memory map, it cannot be closed while views on its records are
+        still referenced.
+        """
+        self._view.release()
+        self._map.close()
@@ -0,0 +1,251 @@
+"""Module for finding the canonical form of a Sudoku under its symmetries.
+
+Relabelling the numbers, swapping bands or stacks, swapping rows inside a band,
+swapping columns inside a stack and transposing the grid all turn a puzzle into an
+equivalent one. The canonical form is the equivalent grid whose values, read row
+by row with 0 for empty cells and the numbers relabelled in order of appearance,
+are the smallest.
+
+The search picks the rows one at a time for both the grid and its transpose,
+keeping only the choices that give the smallest rows so far. The column order is
+left open while every row placed so far is empty, and the first row with values
+fixes it to the orders that put its empty cells first. Choices that leave exactly
+the same rows to place are merged, because they lead to the same results.
+"""
+
+from dataclasses import dataclass
+from itertools import permutations, product
+
+from src.candidates import CANDIDATE_NUMBERS
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku
+
+type Grid = tuple[tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class SudokuTransform:
+    """A symmetry that turns a Sudoku into its canonical form.
+
+    Cell ``(x, y)`` of the canonical form comes from row ``rows[y - 1]`` and column
+    ``columns[x - 1]`` of the original grid, which is transposed first if
+    ``transposed`` is set. ``numbers[n]`` is the canonical label of number ``n``.
+    """
+
+    transposed: bool
+    rows: tuple[int, ...]
+    columns: tuple[int, ...]
+    numbers: tuple[int, ...]
+
+    def to_original_position(self, position: tuple[int, int]) -> tuple[int, int]:
+        """Converts a position in the canonical form to the original Sudoku."""
+        (x, y) = position
+        (row, column) = (self.rows[y - 1], self.columns[x - 1])
+        return (row + 1, column + 1) if self.transposed else (column + 1, row + 1)
+
+    def to_canonical_position(self, position: tuple[int, int]) -> tuple[int, int]:
+        """Converts a position in the original Sudoku to the canonical form."""
+        (x, y) = position
+        (row, column) = (x - 1, y - 1) if self.transposed else (y - 1, x - 1)
+        return (self.columns.index(column) + 1, self.rows.index(row) + 1)
+
+    def apply(self, sudoku: Sudoku) -> Sudoku:
+        """Turns a Sudoku into its canonical form, candidates included."""
+        cells: list[Cell] = []
+        for y in range(1, 10):
+            for x in range(1, 10):
+                cell = sudoku.get(*self.to_original_position((x, y)))
+                cells.append(self.relabel(cell))
+        return Sudoku(tuple(cells))
+
+    def relabel(self, cell: Cell) -> Cell:
+        """Relabels the value or the candidates of a cell."""
+        if isinstance(cell, FullCell):
+            return FullCell(self.numbers[cell.value])
+        mask = 0
+        for number in CANDIDATE_NUMBERS[cell.candidates]:
+            mask |= 1 << (self.numbers[number] - 1)
+        return EmptyCell.frommask(mask)
+
+
+@dataclass(frozen=True)
+class _Choice:
+    """A partial canonical form: the rows placed so far and the labels they used.
+
+    The columns are None while every row placed so far is empty, because then any
+    column order is as good as any other.
+    """
+
+    transposed: bool
+    columns: tuple[int, ...] | None
+    rows: tuple[int, ...]
+    numbers: tuple[int, ...]
+
+
+def canonical_form(sudoku: Sudoku) -> tuple[Sudoku, SudokuTransform]:
+    """Finds the canonical form of a Sudoku and the transform that leads to it."""
+    grids = to_grids(sudoku)
+    choices = [_Choice(transposed, None, (), (0,) * 10) for transposed in (False, True)]
+    for _ in range(9):
+        choices = next_row_choices(grids, choices)
+
+    best = min(
+        choices,
+        key=lambda choice: (choice.transposed, choice.rows, choice.columns or ()),
+    )
+    transform = SudokuTransform(
+        best.transposed,
+        best.rows,
+        best.columns or tuple(range(9)),
+        complete_labels(best.numbers),
+    )
+    return (transform.apply(sudoku), transform)
+
+
+def canonical_string(sudoku: Sudoku) -> str:
+    """Returns the givens of the canonical form as 81 characters."""
+    (canonical, _) = canonical_form(sudoku)
+    return "".join(
+        str(cell.value) if isinstance(cell, FullCell) else "."
+        for _, cell in canonical.cells
+    )
+
+
+def to_grids(sudoku: Sudoku) -> tuple[Grid, Grid]:
+    """Returns the values of the Sudoku by row, as is and transposed."""
+    values = [
+        cell.value if isinstance(cell, FullCell) else 0 for _, cell in sudoku.cells
+    ]
+    grid = tuple(tuple(values[row * 9 : row * 9 + 9]) for row in range(9))
+    transposed = tuple(
+        tuple(grid[row][column] for row in range(9)) for column in range(9)
+    )
+    return (grid, transposed)
+
+
+def best_column_orders(grid: Grid, row: int) -> list[tuple[int, ...]]:
+    """Lists every column order that makes a row the smallest, before any number
+    is labelled.
+
+    Such a row always reads as 0 for its empty cells and 1, 2, 3 and so on for its
+    full cells, so it is smallest with the emptiest stacks first and the empty
+    cells of every stack first. Orders that only swap identical columns give the
+    same grid, so only one of them is listed.
+    """
+    values = grid[row]
+    stacks = [range(stack * 3, stack * 3 + 3) for stack in range(3)]
+    counts = [sum(1 for column in stack if values[column]) for stack in stacks]
+    within = [
+        [
+            empty + full
+            for empty in permutations(column for column in stack if not values[column])
+            for full in permutations(column for column in stack if values[column])
+        ]
+        for stack in stacks
+    ]
+    contents = tuple(zip(*grid, strict=True))
+    orders: dict[tuple[tuple[int, ...], ...], tuple[int, ...]] = {}
+    for stack_order in permutations(range(3)):
+        if [counts[stack] for stack in stack_order] != sorted(counts):
+            continue
+        for parts in product(*(within[stack] for stack in stack_order)):
+            columns = tuple(column for part in parts for column in part)
+            orders.setdefault(tuple(contents[column] for column in columns), columns)
+    return list(orders.values())
+
+
+def next_row_choices(grids: tuple[Grid, Grid], choices: list[_Choice]) -> list[_Choice]:
+    """Adds every allowed row to every choice and keeps the smallest results."""
+    best: tuple[int, ...] | None = None
+    result: dict[tuple[object, ...], _Choice] = {}
+    for choice in choices:
+        grid = grids[choice.transposed]
+        for row in allowed_rows(choice.rows):
+            for columns in column_orders(choice, grid, row):
+                (values, numbers) = relabel_row(grid[row], columns, choice.numbers)
+                if best is None or values < best:
+                    best = values
+                    result = {}
+                if values == best:
+                    extended = _Choice(
+                        choice.transposed,
+                        None if choice.columns is None and not any(values) else columns,
+                        (*choice.rows, row),
+                        numbers,
+                    )
+                    result.setdefault(remaining_key(grid, extended), extended)
+    return list(result.values())
+
+
+def column_orders(choice: _Choice, grid: Grid, row: int) -> list[tuple[int, ...]]:
+    """Lists the column orders to try for the next row of a choice."""
+    if choice.columns is not None:
+        return [choice.columns]
+    if not any(grid[row]):
+        return [tuple(range(9))]
+    return best_column_orders(grid, row)
+
+
+def allowed_rows(rows: tuple[int, ...]) -> list[int]:
+    """Lists the rows that can come next without splitting a band."""
+    if len(rows) % 3:
+        band = rows[-1] // 3
+        return [row for row in range(band * 3, band * 3 + 3) if row not in rows]
+    used = {row // 3 for row in rows}
+    return [row for row in range(9) if row // 3 not in used]
+
+
+def relabel_row(
+    values: tuple[int, ...], columns: tuple[int, ...], numbers: tuple[int, ...]
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Reads a row in the given column order, labelling new numbers as they appear."""
+    labels = list(numbers)
+    next_label = max(labels) + 1
+    result = []
+    for column in columns:
+        value = values[column]
+        if value and not labels[value]:
+            labels[value] = next_label
+            next_label += 1
+        result.append(labels[value])
+    return (tuple(result), tuple(labels))
+
+
+def remaining_key(grid: Grid, choice: _Choice) -> tuple[object, ...]:
+    """Describes the rows that are left to place, as seen by a choice.
+
+    Two choices with the same description lead to the same smallest rows, so only
+    one of them needs to be kept. Choices with free columns read the rows in their
+    original order, and are only merged with each other.
+    """
+    columns = tuple(range(9)) if choice.columns is None else choice.columns
+
+    def read(row: int) -> tuple[int, ...]:
+        return tuple(
+            choice.numbers[value] or (value + 10 if value else 0)
+            for value in (grid[row][column] for column in columns)
+        )
+
+    rows = choice.rows
+    rest_of_band = (
+        tuple(sorted(read(row) for row in allowed_rows(rows))) if len(rows) % 3 else ()
+    )
+    used = {row // 3 for row in rows}
+    other_bands = tuple(
+        sorted(
+            tuple(sorted(read(row) for row in range(band * 3, band * 3 + 3)))
+            for band in range(3)
+            if band not in used
+        )
+    )
+    return (choice.columns is None, rest_of_band, other_bands)
+
+
+def complete_labels(numbers: tuple[int, ...]) -> tuple[int, ...]:
+    """Gives the numbers that never appear the labels that are left, in order."""
+    labels = list(numbers)
+    unused = iter(sorted(set(range(1, 10)) - set(labels)))
+    for number in range(1, 10):
+        if not labels[number]:
+            labels[number] = next(unused)
+    return tuple(labels)
@@ -0,0 +1,109 @@
+"""Module for solving a Sudoku puzzle as an exact cover problem with Algorithm X.
+
+Every candidate, a number in a cell, is a row of the exact cover matrix. It covers
+four of the 324 columns: its cell, and its number in its row, column and block. A
+solution picks exactly one row for every column. Only the candidates that are still
+possible in the Sudoku become rows, so eliminations already made shrink the search.
+"""
+
+from collections.abc import Iterator
+
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.units import CELL_UNITS
+
+type Columns = dict[int, set[int]]
+type Rows = dict[int, tuple[int, int, int, int]]
+
+
+def solve_exact_cover(sudoku: Sudoku) -> Sudoku | None:
+    """Returns the first solution of the Sudoku, or None if it has no solution."""
+    return next(exact_cover_solutions(sudoku), None)
+
+
+def exact_cover_solutions(sudoku: Sudoku) -> Iterator[Sudoku]:
+    """Generates every solution of the Sudoku."""
+    cells = [cell for _, cell in sudoku.cells]
+    rows: Rows = {
+        index * 9 + number - 1: candidate_columns(index, number)
+        for index, cell in enumerate(cells)
+        for number in cell_numbers(cell)
+    }
+    columns: Columns = {column: set() for column in range(324)}
+    for row, row_columns in rows.items():
+        for column in row_columns:
+            columns[column].add(row)
+
+    solution: list[int] = []
+    for index, cell in enumerate(cells):
+        if isinstance(cell, FullCell):
+            row = index * 9 + cell.value - 1
+            if any(column not in columns for column in rows[row]):
+                return
+            select(columns, rows, row)
+            solution.append(row)
+
+    for rows_in_solution in search(columns, rows, solution):
+        yield tosudoku(rows_in_solution)
+
+
+def cell_numbers(cell: Cell) -> tuple[int, ...]:
+    """Returns the numbers that a cell can still hold."""
+    return (cell.value,) if isinstance(cell, FullCell) else cell.possible_numbers
+
+
+def candidate_columns(index: int, number: int) -> tuple[int, int, int, int]:
+    """Returns the four constraint columns that a candidate covers."""
+    (row, column, block) = CELL_UNITS[index]
+    offset = number - 1
+    return (
+        index,
+        81 + row * 9 + offset,
+        162 + (column - 9) * 9 + offset,
+        243 + (block - 18) * 9 + offset,
+    )
+
+
+def search(columns: Columns, rows: Rows, solution: list[int]) -> Iterator[list[int]]:
+    """Searches for exact covers, always branching on the column with fewest rows."""
+    if not columns:
+        yield list(solution)
+        return
+
+    column = min(columns, key=lambda key: len(columns[key]))
+    for row in list(columns[column]):
+        solution.append(row)
+        removed = select(columns, rows, row)
+        yield from search(columns, rows, solution)
+        deselect(columns, rows, row, removed)
+        solution.pop()
+
+
+def select(columns: Columns, rows: Rows, row: int) -> list[set[int]]:
+    """Covers every column of a row and removes the rows that conflict with it."""
+    removed: list[set[int]] = []
+    for column in rows[row]:
+        for other in columns[column]:
+            for other_column in rows[other]:
+                if other_column != column:
+                    columns[other_column].discard(other)
+        removed.append(columns.pop(column))
+    return removed
+
+
+def deselect(columns: Columns, rows: Rows, row: int, removed: list[set[int]]) -> None:
+    """Undoes a call to select, restoring the columns in reverse order."""
+    for column in reversed(rows[row]):
+        columns[column] = removed.pop()
+        for other in columns[column]:
+            for other_column in rows[other]:
+                if other_column != column:
+                    columns[other_column].add(other)
+
+
+def tosudoku(solution: list[int]) -> Sudoku:
+    """Builds a solved Sudoku from the rows of an exact cover."""
+    cells: list[Cell] = [EmptyCell.create()] * 81
+    for row in solution:
+        cells[row // 9] = FullCell(row % 9 + 1)
+    return Sudoku(tuple(cells))
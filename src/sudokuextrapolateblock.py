@@ -1,10 +1,18 @@
+"""Module for eliminating possible numbers by extrapolating blocks into lines."""
+
 from dataclasses import dataclass
 
 from src.block import Block
+from src.cell import EmptyCell
+from src.instrumentation import instrumented
+from src.sudoku import Sudoku, SudokuTransaction
+from src.units import BLOCK_COORDINATES, BLOCK_LOCAL_POSITIONS, LINE_TO_BLOCK
 
 
 @dataclass(frozen=True)
 class BlockIntoRowExtrapolation:
+    """The block and row that were matched with extrapolation"""
+
     row_index: int
     block_index: tuple[int, int]
     number: int
@@ -12,12 +20,103 @@ class BlockIntoRowExtrapolation:
 
 @dataclass(frozen=True)
 class BlockIntoColumnExtrapolation:
+    """The block and column that were matched with extrapolation"""
+
     column_index: int
     block_index: tuple[int, int]
     number: int
 
 
+type BlockExtrapolation = BlockIntoRowExtrapolation | BlockIntoColumnExtrapolation
+
+
+@instrumented(units=9)
+def find_extrapolations_from_blocks(sudoku: Sudoku) -> list[BlockExtrapolation]:
+    """Finds all extrapolations from blocks into lines that eliminate a number."""
+    return [
+        result
+        for block_index in BLOCK_COORDINATES
+        for result in find_extrapolations_from_single_block(
+            sudoku.getblock(*block_index)
+        )
+        if will_eliminate_block_numbers_in_line(sudoku, result)
+    ]
+
+
 def find_extrapolations_from_single_block(
     block: Block,
-) -> list[BlockIntoRowExtrapolation | BlockIntoColumnExtrapolation]:
-    return []
+) -> list[BlockExtrapolation]:
+    """Finds the numbers of a block that can only be in one of its rows or columns."""
+    (offset_x, offset_y) = block.origin
+    block_index = (LINE_TO_BLOCK[offset_x + 1], LINE_TO_BLOCK[offset_y + 1])
+
+    rows: dict[int, set[int]] = {number: set() for number in range(1, 10)}
+    columns: dict[int, set[int]] = {number: set() for number in range(1, 10)}
+    for (x, y), cell in zip(BLOCK_LOCAL_POSITIONS, block.cells, strict=True):
+        if isinstance(cell, EmptyCell):
+            for possible_number in cell.possible_numbers:
+                rows[possible_number].add(y + offset_y)
+                columns[possible_number].add(x + offset_x)
+
+    row_results: list[BlockExtrapolation] = [
+        BlockIntoRowExtrapolation(next(iter(rows[number])), block_index, number)
+        for number in rows
+        if len(rows[number]) == 1
+    ]
+    column_results: list[BlockExtrapolation] = [
+        BlockIntoColumnExtrapolation(next(iter(columns[number])), block_index, number)
+        for number in columns
+        if len(columns[number]) == 1
+    ]
+    return row_results + column_results
+
+
+def positions_outside_block(
+    extrapolation: BlockExtrapolation,
+) -> list[tuple[int, int]]:
+    """Gets the positions of the line of an extrapolation outside its block."""
+    if isinstance(extrapolation, BlockIntoRowExtrapolation):
+        (block_x, _) = extrapolation.block_index
+        return [
+            (x, extrapolation.row_index)
+            for x in range(1, 10)
+            if LINE_TO_BLOCK[x] != block_x
+        ]
+    (_, block_y) = extrapolation.block_index
+    return [
+        (extrapolation.column_index, y)
+        for y in range(1, 10)
+        if LINE_TO_BLOCK[y] != block_y
+    ]
+
+
+def will_eliminate_block_numbers_in_line(
+    sudoku: Sudoku, extrapolation: BlockExtrapolation
+) -> bool:
+    """Checks if the extrapolation will eliminate numbers in the line."""
+    return any(
+        isinstance(cell, EmptyCell) and cell.couldbe(extrapolation.number)
+        for cell in (
+            sudoku.get(x, y) for x, y in positions_outside_block(extrapolation)
+        )
+    )
+
+
+@instrumented()
+def eliminate_from_list_of_extrapolated_blocks(
+    sudoku: Sudoku, extrapolations: list[BlockExtrapolation]
+) -> Sudoku:
+    """Eliminates possible numbers from a list of block extrapolations."""
+    transaction = sudoku.transaction()
+    for extrapolation in extrapolations:
+        add_extrapolated_block_eliminations(transaction, extrapolation)
+
+    return transaction.commit()
+
+
+def add_extrapolated_block_eliminations(
+    transaction: SudokuTransaction, extrapolation: BlockExtrapolation
+) -> None:
+    """Adds the eliminations of an extrapolated block to a transaction."""
+    for x, y in positions_outside_block(extrapolation):
+        transaction.eliminate(x, y, extrapolation.number)
@@ -1,13 +1,18 @@
 """Module for eliminating possible numbers by extrapolating lines into blocks."""
 
-import itertools
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Callable
 
 from src.block import Block
 from src.cell import EmptyCell
+from src.instrumentation import count_indexes, instrumented
 from src.line import Column, Line, Row
-from src.sudoku import Sudoku
+from src.sudoku import Sudoku, SudokuTransaction
+from src.units import (
+    BLOCK_LOCAL_POSITIONS_OUTSIDE_COLUMN,
+    BLOCK_LOCAL_POSITIONS_OUTSIDE_ROW,
+    LINE_TO_BLOCK,
+)
 
 
 @dataclass(frozen=True)
@@ -28,11 +33,14 @@ class ColumnIntoBlockExtrapolation:
     number: int
 
 
-def find_extrapolations_from_rows(sudoku: Sudoku) -> list[RowIntoBlockExtrapolation]:
-    """Finds all extrapolations from rows into blocks."""
+@instrumented(units=count_indexes)
+def find_extrapolations_from_rows(
+    sudoku: Sudoku, indexes: Iterable[int] = range(1, 10)
+) -> list[RowIntoBlockExtrapolation]:
+    """Finds all extrapolations from rows into blocks, optionally only some rows."""
     potential_result = [
         result
-        for index in range(1, 10)
+        for index in indexes
         for result in find_extrapolations_from_single_row(sudoku.getrow(index))
     ]
     return [
@@ -44,13 +52,14 @@ def find_extrapolations_from_rows(sudoku: Sudoku) -> list[RowIntoBlockExtrapolat
     ]
 
 
+@instrumented(units=count_indexes)
 def find_extrapolations_from_columns(
-    sudoku: Sudoku,
+    sudoku: Sudoku, indexes: Iterable[int] = range(1, 10)
 ) -> list[ColumnIntoBlockExtrapolation]:
-    """Finds all extrapolations from columns into blocks."""
+    """Finds all extrapolations from columns into blocks, optionally only some."""
     potential_result = [
         result
-        for index in range(1, 10)
+        for index in indexes
         for result in find_extrapolations_from_single_column(sudoku.getcolumn(index))
     ]
     return [
@@ -62,10 +71,53 @@ def find_extrapolations_from_columns(
     ]
 
 
+def extrapolate_lines_until_stable(sudoku: Sudoku) -> Sudoku:
+    """Keeps eliminating numbers by extrapolating lines until nothing changes.
+
+    After the first round, only the rows and columns that contain a cell changed by
+    the previous round are examined again. A line whose cells did not change cannot
+    produce a new extrapolation, so the loop stops when no line is left to examine.
+
+    This driver is not instrumented itself, since its time is the time of the rules
+    it calls, which record their own work.
+    """
+    rows: set[int] = set(range(1, 10))
+    columns: set[int] = set(range(1, 10))
+    while rows or columns:
+        (sudoku, changed) = eliminate_from_extrapolated_lines(
+            sudoku,
+            find_extrapolations_from_rows(sudoku, sorted(rows)),
+            find_extrapolations_from_columns(sudoku, sorted(columns)),
+        )
+        rows = {y for _, y in changed}
+        columns = {x for x, _ in changed}
+
+    return sudoku
+
+
+@instrumented()
+def eliminate_from_extrapolated_lines(
+    sudoku: Sudoku,
+    row_extrapolations: list[RowIntoBlockExtrapolation],
+    column_extrapolations: list[ColumnIntoBlockExtrapolation],
+) -> tuple[Sudoku, list[tuple[int, int]]]:
+    """Eliminates possible numbers from row and column extrapolations at once.
+
+    Returns the new Sudoku and the positions of the cells that changed.
+    """
+    transaction = sudoku.transaction()
+    for row_extrapolation in row_extrapolations:
+        add_extrapolated_row_eliminations(transaction, sudoku, row_extrapolation)
+    for column_extrapolation in column_extrapolations:
+        add_extrapolated_column_eliminations(transaction, sudoku, column_extrapolation)
+    return (transaction.commit(), transaction.changed_positions)
+
+
 def find_extrapolations_from_single_row(row: Row) -> list[RowIntoBlockExtrapolation]:
     """Finds all extrapolations from a single row into blocks."""
+    block_y = LINE_TO_BLOCK[row.index]
     numbers_and_blocks = get_blocks_by_number_from_line(
-        row, lambda x: (line_to_block_index(x), line_to_block_index(row.index))
+        row, lambda x: (LINE_TO_BLOCK[x], block_y)
     )
     return [
         RowIntoBlockExtrapolation(row.index, next(iter(numbers_and_blocks[key])), key)
@@ -78,8 +130,9 @@ def find_extrapolations_from_single_column(
     column: Column,
 ) -> list[ColumnIntoBlockExtrapolation]:
     """Finds all extrapolations from a single column into blocks."""
+    block_x = LINE_TO_BLOCK[column.index]
     numbers_and_blocks = get_blocks_by_number_from_line(
-        column, lambda y: (line_to_block_index(column.index), line_to_block_index(y))
+        column, lambda y: (block_x, LINE_TO_BLOCK[y])
     )
     return [
         ColumnIntoBlockExtrapolation(
@@ -97,9 +150,10 @@ def get_blocks_by_number_from_line(
     numbers_and_blocks: dict[int, set[tuple[int, int]]] = {
         number: set() for number in range(1, 10)
     }
-    cells = [(index, line.get(index)) for index in range(1, 10)]
     empty_cells = [
-        (index, cell) for index, cell in cells if isinstance(cell, EmptyCell)
+        (index, cell)
+        for index, cell in enumerate(line.cells, 1)
+        if isinstance(cell, EmptyCell)
     ]
     for x, cell in empty_cells:
         block_index = index_to_block_index(x)
@@ -110,7 +164,7 @@ def get_blocks_by_number_from_line(
 
 def line_to_block_index(index: int) -> int:
     """Converts a line index to a block index."""
-    return ((index - 1) // 3) + 1
+    return LINE_TO_BLOCK[index]
 
 
 def will_eliminate_row_numbers_in_block(
@@ -119,9 +173,7 @@ def will_eliminate_row_numbers_in_block(
     """Checks if the extrapolation will eliminate numbers in the block."""
     block_row = block.global_to_local_row(result.row_index)
     cells_to_check = [
-        block.get(x, y)
-        for x, y in itertools.product(range(1, 4), range(1, 4))
-        if y != block_row
+        block.get(x, y) for x, y in BLOCK_LOCAL_POSITIONS_OUTSIDE_ROW[block_row - 1]
     ]
     return any(
         isinstance(cell, EmptyCell) and cell.couldbe(result.number)
@@ -136,8 +188,7 @@ def will_eliminate_column_numbers_in_block(
     block_column = block.global_to_local_column(result.column_index)
     cells_to_check = [
         block.get(x, y)
-        for x, y in itertools.product(range(1, 4), range(1, 4))
-        if x != block_column
+        for x, y in BLOCK_LOCAL_POSITIONS_OUTSIDE_COLUMN[block_column - 1]
     ]
     return any(
         isinstance(cell, EmptyCell) and cell.couldbe(result.number)
@@ -145,69 +196,65 @@ def will_eliminate_column_numbers_in_block(
     )
 
 
+@instrumented()
 def eliminate_from_list_of_extrapolated_rows(
     sudoku: Sudoku, extrapolations: list[RowIntoBlockExtrapolation]
 ) -> Sudoku:
     """Eliminates possible numbers from a list of row extrapolations."""
+    transaction = sudoku.transaction()
     for extrapolation in extrapolations:
-        sudoku = eliminate_from_extrapolated_row(sudoku, extrapolation)
+        add_extrapolated_row_eliminations(transaction, sudoku, extrapolation)
 
-    return sudoku
+    return transaction.commit()
 
 
 def eliminate_from_extrapolated_row(
     sudoku: Sudoku, extrapolation: RowIntoBlockExtrapolation
 ) -> Sudoku:
     """Eliminates possible numbers from an extrapolated row."""
-    block = sudoku.getblock(*extrapolation.block_index)
-    block_row = block.global_to_local_row(extrapolation.row_index)
+    return eliminate_from_list_of_extrapolated_rows(sudoku, [extrapolation])
 
-    cells_to_update = [
-        (block.local_to_global(x, y), block.get(x, y))
-        for x, y in itertools.product(range(1, 4), range(1, 4))
-        if y != block_row
-    ]
-    cells_to_update = [
-        (position, cell)
-        for position, cell in cells_to_update
-        if isinstance(cell, EmptyCell)
-    ]
 
-    for position, cell in cells_to_update:
-        sudoku = sudoku.set(*position, cell.eliminate(extrapolation.number))
+def add_extrapolated_row_eliminations(
+    transaction: SudokuTransaction,
+    sudoku: Sudoku,
+    extrapolation: RowIntoBlockExtrapolation,
+) -> None:
+    """Adds the eliminations of an extrapolated row to a transaction."""
+    block = sudoku.getblock(*extrapolation.block_index)
+    block_row = block.global_to_local_row(extrapolation.row_index)
 
-    return sudoku
+    for x, y in BLOCK_LOCAL_POSITIONS_OUTSIDE_ROW[block_row - 1]:
+        transaction.eliminate(*block.local_to_global(x, y), extrapolation.number)
 
 
+@instrumented()
 def eliminate_from_list_of_extrapolated_columns(
     sudoku: Sudoku, extrapolations: list[ColumnIntoBlockExtrapolation]
 ) -> Sudoku:
     """Eliminates possible numbers from a list of column extrapolations."""
+    transaction = sudoku.transaction()
     for extrapolation in extrapolations:
-        sudoku = eliminate_from_extrapolated_column(sudoku, extrapolation)
+        add_extrapolated_column_eliminations(transaction, sudoku, extrapolation)
 
-    return sudoku
+    return transaction.commit()
 
 
 def eliminate_from_extrapolated_column(
     sudoku: Sudoku, extrapolation: ColumnIntoBlockExtrapolation
 ) -> Sudoku:
     """Eliminates possible numbers from an extrapolated column."""
-    block = sudoku.getblock(*extrapolation.block_index)
-    block_column = block.global_to_local_column(extrapolation.column_index)
+    return eliminate_from_list_of_extrapolated_columns(sudoku, [extrapolation])
 
-    cells_to_update = [
-        (block.local_to_global(x, y), block.get(x, y))
-        for x, y in itertools.product(range(1, 4), range(1, 4))
-        if x != block_column
-    ]
-    cells_to_update = [
-        (position, cell)
-        for position, cell in cells_to_update
-        if isinstance(cell, EmptyCell)
-    ]
 
-    for position, cell in cells_to_update:
-        sudoku = sudoku.set(*position, cell.eliminate(extrapolation.number))
+def add_extrapolated_column_eliminations(
+    transaction: SudokuTransaction,
+    sudoku: Sudoku,
+    extrapolation: ColumnIntoBlockExtrapolation,
+) -> None:
+    """Adds the eliminations of an extrapolated column to a transaction."""
+    block = sudoku.getblock(*extrapolation.block_index)
+    block_column = block.global_to_local_column(extrapolation.column_index)
 
-    return sudoku
+    for x, y in BLOCK_LOCAL_POSITIONS_OUTSIDE_COLUMN[block_column - 1]:
+        transaction.eliminate(*block.local_to_global(x, y), extrapolation.number)
@@ -1,36 +1,54 @@
-"""Module for finding cells in a Sudoku puzzle that can be filled."""
+"""Module for finding cells in a Sudoku puzzle that can be filled.
 
-import itertools
+The ``iter_cells_*`` generators find the same cells as the matching ``find_cells_*``
+functions, one at a time, so a caller that only needs a few cells can stop early.
+"""
+
+from collections.abc import Iterator
 
 from src.block import Block
+from src.candidates import SINGLE_CANDIDATE
 from src.cell import Cell, EmptyCell
+from src.instrumentation import instrumented
 from src.line import Column, Line, Row
 from src.sudoku import Sudoku
+from src.units import (
+    BLOCK_LOCAL_POSITIONS,
+    BLOCK_UNITS,
+    COLUMN_UNITS,
+    POSITIONS,
+    ROW_UNITS,
+    UNITS,
+)
 
 
+@instrumented()
 def find_cells_with_single_option(sudoku: Sudoku) -> list[tuple[int, int]]:
     """Finds all cells in the Sudoku puzzle that have only one possible number."""
-    return [
+    return list(iter_cells_with_single_option(sudoku))
+
+
+def iter_cells_with_single_option(sudoku: Sudoku) -> Iterator[tuple[int, int]]:
+    """Yields the cells that have only one possible number in reading order."""
+    return (
         position
-        for position, cell in sudoku.cells
+        for position, cell in sudoku.itercells()
         if cell_has_one_possible_number(cell)
-    ]
+    )
 
 
 def cell_has_one_possible_number(cell: Cell) -> bool:
     """Checks if a cell has only one possible number."""
-    return isinstance(cell, EmptyCell) and len(cell.possible_numbers) == 1
+    return isinstance(cell, EmptyCell) and cell.possible_count == 1
 
 
+@instrumented(units=9)
 def find_cells_with_unique_number_in_rows(sudoku: Sudoku) -> list[tuple[int, int]]:
     """Finds all cells that have a unique possible number in their row."""
-    return [
-        position
-        for y in range(1, 10)
-        for position in find_cells_with_unique_number_in_single_row(sudoku.getrow(y))
-    ]
+    return find_cells_with_unique_number_in_units(sudoku, ROW_UNITS)
 
 
+@instrumented(units=1)
 def find_cells_with_unique_number_in_single_row(row: Row) -> list[tuple[int, int]]:
     """Finds all cells that have a unique possible number in a single row."""
     return [
@@ -38,17 +56,13 @@ def find_cells_with_unique_number_in_single_row(row: Row) -> list[tuple[int, int
     ]
 
 
+@instrumented(units=9)
 def find_cells_with_unique_number_in_columns(sudoku: Sudoku) -> list[tuple[int, int]]:
     """Finds all cells that have a unique possible number in their column."""
-    return [
-        position
-        for x in range(1, 10)
-        for position in find_cells_with_unique_number_in_single_column(
-            sudoku.getcolumn(x)
-        )
-    ]
+    return find_cells_with_unique_number_in_units(sudoku, COLUMN_UNITS)
 
 
+@instrumented(units=1)
 def find_cells_with_unique_number_in_single_column(
     column: Column,
 ) -> list[tuple[int, int]]:
@@ -62,7 +76,7 @@ def find_cells_with_unique_number_in_single_column(
 def find_indexes_for_unique_numbers_in_line(line: Line) -> list[int]:
     """Finds indexes of cells that have a unique possible number in a line."""
     numbers = {key: [] for key in range(1, 10)}
-    for index, cell in [(index, line.get(index)) for index in range(1, 10)]:
+    for index, cell in enumerate(line.cells, 1):
         if isinstance(cell, EmptyCell):
             for possible_number in cell.possible_numbers:
                 numbers[possible_number].append(index)
@@ -75,26 +89,67 @@ def find_indexes_for_unique_numbers_in_line(line: Line) -> list[int]:
     ]
 
 
+@instrumented(units=9)
 def find_cells_with_unique_number_in_blocks(sudoku: Sudoku) -> list[tuple[int, int]]:
     """Finds all cells that have a unique possible number in their block."""
-    return [
-        position
-        for (x, y) in itertools.product(range(1, 4), range(1, 4))
-        for position in find_cells_with_unique_number_in_single_block(
-            sudoku.getblock(x, y)
+    return find_cells_with_unique_number_in_units(sudoku, BLOCK_UNITS)
+
+
+def find_cells_with_unique_number_in_units(
+    sudoku: Sudoku, units: range
+) -> list[tuple[int, int]]:
+    """Finds all cells that have a unique possible number in one of the given units.
+
+    Reads the index of slots per unit and number that the Sudoku keeps up to date,
+    so a number is unique in a unit when its mask of slots has a single bit.
+    """
+    return list(iter_cells_with_unique_number_in_units(sudoku, units))
+
+
+def iter_cells_with_unique_number_in_units(
+    sudoku: Sudoku, units: range
+) -> Iterator[tuple[int, int]]:
+    """Yields the cells that have a unique possible number in one of the given
+    units, unit by unit."""
+    locations = sudoku.locations
+    return (
+        POSITIONS[UNITS[unit][slot - 1]]
+        for unit in units
+        for slot in map(
+            SINGLE_CANDIDATE.__getitem__, locations[unit * 9 : unit * 9 + 9]
         )
-    ]
+        if slot is not None
+    )
+
+
+def iter_cells_with_unique_number_in_rows(
+    sudoku: Sudoku,
+) -> Iterator[tuple[int, int]]:
+    """Yields the cells that have a unique possible number in their row."""
+    return iter_cells_with_unique_number_in_units(sudoku, ROW_UNITS)
+
+
+def iter_cells_with_unique_number_in_columns(
+    sudoku: Sudoku,
+) -> Iterator[tuple[int, int]]:
+    """Yields the cells that have a unique possible number in their column."""
+    return iter_cells_with_unique_number_in_units(sudoku, COLUMN_UNITS)
+
+
+def iter_cells_with_unique_number_in_blocks(
+    sudoku: Sudoku,
+) -> Iterator[tuple[int, int]]:
+    """Yields the cells that have a unique possible number in their block."""
+    return iter_cells_with_unique_number_in_units(sudoku, BLOCK_UNITS)
 
 
+@instrumented(units=1)
 def find_cells_with_unique_number_in_single_block(
     block: Block,
 ) -> list[tuple[int, int]]:
     """Finds all cells that have a unique possible number in a single block."""
     numbers = {key: [] for key in range(1, 10)}
-    for x, y, cell in [
-        (x, y, block.get(x, y))
-        for (x, y) in itertools.product(range(1, 4), range(1, 4))
-    ]:
+    for (x, y), cell in zip(BLOCK_LOCAL_POSITIONS, block.cells, strict=True):
         if isinstance(cell, EmptyCell):
             for possible_number in cell.possible_numbers:
                 numbers[possible_number].append((x, y))
@@ -0,0 +1,88 @@
+"""Module combining the extrapolation and finder rules into a single hint pipeline."""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from src.instrumentation import instrumented
+from src.sudoku import Sudoku
+from src.sudokuextrapolateline import extrapolate_lines_until_stable
+from src.sudokufinder import (
+    find_cells_with_single_option,
+    find_cells_with_unique_number_in_blocks,
+    find_cells_with_unique_number_in_columns,
+    find_cells_with_unique_number_in_rows,
+    iter_cells_with_single_option,
+    iter_cells_with_unique_number_in_blocks,
+    iter_cells_with_unique_number_in_columns,
+    iter_cells_with_unique_number_in_rows,
+)
+
+type Finder = Callable[[Sudoku], Iterator[tuple[int, int]]]
+
+FINDERS_BY_COST: tuple[Finder, ...] = (
+    iter_cells_with_single_option,
+    iter_cells_with_unique_number_in_blocks,
+    iter_cells_with_unique_number_in_rows,
+    iter_cells_with_unique_number_in_columns,
+)
+"""The finders in the order they are asked for hints, cheapest first."""
+
+
+@dataclass(frozen=True)
+class Hints:
+    """The cells that can be filled in, and the extrapolated Sudoku they are in."""
+
+    sudoku: Sudoku
+    positions: list[tuple[int, int]]
+
+
+def find_hints(sudoku: Sudoku) -> Hints:
+    """Extrapolates the Sudoku and finds every cell that can be filled in.
+
+    The positions are sorted in reading order.
+    """
+    sudoku = extrapolate_lines_until_stable(sudoku)
+
+    positions: set[tuple[int, int]] = set()
+    positions = positions | set(find_cells_with_single_option(sudoku))
+    positions = positions | set(find_cells_with_unique_number_in_rows(sudoku))
+    positions = positions | set(find_cells_with_unique_number_in_columns(sudoku))
+    positions = positions | set(find_cells_with_unique_number_in_blocks(sudoku))
+
+    return Hints(sudoku, sorted(positions, key=lambda position: position[::-1]))
+
+
+def find_first_hints(sudoku: Sudoku, count: int = 1) -> Hints:
+    """Finds up to ``count`` cells that can be filled in, doing as little as possible.
+
+    The finders are asked one at a time, cheapest first, and stop as soon as there
+    are enough hints. Only when the Sudoku as given has too few hints are the lines
+    extrapolated and the finders asked again. Every hint is also found by
+    ``find_hints``. The positions are in the order they were found, and the Sudoku
+    of the result is extrapolated only if that was needed.
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+
+    positions = first_positions(sudoku, count)
+    if len(positions) < count:
+        sudoku = extrapolate_lines_until_stable(sudoku)
+        positions = first_positions(sudoku, count)
+
+    return Hints(sudoku, positions)
+
+
+@instrumented()
+def first_positions(sudoku: Sudoku, count: int) -> list[tuple[int, int]]:
+    """Asks the finders in order of cost for up to ``count`` distinct positions.
+
+    The finders are generators that do their work while they are read, so their
+    time and hints are recorded here.
+    """
+    positions: dict[tuple[int, int], None] = {}
+    for finder in FINDERS_BY_COST:
+        for position in finder(sudoku):
+            positions[position] = None
+            if len(positions) == count:
+                return list(positions)
+    return list(positions)
@@ -1,85 +1,98 @@
-""" ""Module for printing Sudoku puzzles to the console."""
+"""Module for printing Sudoku puzzles to the console.
+
+Every cell takes two characters: a marker slot and its value. The slot before a
+cell shows the ``<`` of a highlight on the cell to its left, or else the ``>`` of
+a highlight on the cell itself. The last cell of a stack has one more slot for
+its own ``<``. Highlights are indexed by position once per board, so a row only
+looks up its own cells, and rows without highlights are filled into a template.
+"""
+
+from collections.abc import Iterable
+from typing import TextIO
 
 from src.higlights import FieldPointer
 
-from .cell import Cell, EmptyCell
-from .line import Row
+from .cell import FullCell
 from .sudoku import Sudoku
 
 SUDOKU_TOP = "┏━━━━━━━┳━━━━━━━┳━━━━━━━┓"
 SUDOKU_MIDDLE = "┣━━━━━━━╋━━━━━━━╋━━━━━━━┫"
 SUDOKU_BOTTOM = "┗━━━━━━━┻━━━━━━━┻━━━━━━━┛"
 
+ROW_TEMPLATE = "┃ {} {} {} ┃ {} {} {} ┃ {} {} {} ┃"
+"""A row without highlights, to be filled in with the nine cells."""
+
+type Markers = dict[tuple[int, int], str]
+
 
 def print_sudoku(sudoku: Sudoku, highlights: list[FieldPointer]) -> str:
     """Prints the Sudoku puzzle as a string."""
-    result = SUDOKU_TOP + "\n"
+    (before, after) = index_highlights(highlights)
+    marked_rows = {y for _, y in before} | {y for _, y in after}
+    values = [
+        str(cell.value) if isinstance(cell, FullCell) else " "
+        for _, cell in sudoku.cells
+    ]
+
+    lines = [SUDOKU_TOP]
     for y in range(1, 10):
-        result = result + print_sudoku_row(sudoku.getrow(y), y, highlights) + "\n"
-        if y < 9 and (y % 3) == 0:
-            result = result + SUDOKU_MIDDLE + "\n"
+        row = values[y * 9 - 9 : y * 9]
+        if y in marked_rows:
+            lines.append(print_sudoku_row(row, y, before, after))
+        else:
+            lines.append(ROW_TEMPLATE.format(*row))
+        if y < 9 and y % 3 == 0:
+            lines.append(SUDOKU_MIDDLE)
+    lines.append(SUDOKU_BOTTOM)
+    return "\n".join(lines)
 
-    result = result + SUDOKU_BOTTOM
-    return result
 
+def index_highlights(highlights: list[FieldPointer]) -> tuple[Markers, Markers]:
+    """Finds the markers before and after every highlighted position.
 
-def print_sudoku_row(row: Row, y: int, highlight: list[FieldPointer]) -> str:
-    """Prints a single row of the Sudoku puzzle as a string."""
-    result: str = ""
-    for x in range(1, 10):
-        cell = row.get(x)
-        position = (x, y)
+    When several highlights point to the same position, the first one wins.
+    """
+    before: Markers = {}
+    after: Markers = {}
+    for highlight in highlights:
+        position = highlight.position
+        marker = highlight.get_before(position)
+        if marker is not None:
+            before.setdefault(position, marker)
+        marker = highlight.get_after(position)
+        if marker is not None:
+            after.setdefault(position, marker)
+    return (before, after)
+
+
+def print_sudoku_row(row: list[str], y: int, before: Markers, after: Markers) -> str:
+    """Prints a single row of the Sudoku puzzle with its markers as a string."""
+    parts: list[str] = []
+    for x, value in enumerate(row, 1):
         if x % 3 == 1:
-            result = result + "┃"
-        result = result + print_sudoku_before_cell(position, highlight)
-        result = result + print_sudoku_cell(cell)
+            parts.append("┃")
+            marker = before.get((x, y), " ")
+        else:
+            marker = after.get((x - 1, y)) or before.get((x, y), " ")
+        parts.append(marker)
+        parts.append(value)
         if x % 3 == 0:
-            result = result + print_sudoku_after_cell(position, highlight)
-    result = result + "┃"
-    return result
-
-
-def print_sudoku_before_cell(
-    position: tuple[int, int], highlights: list[FieldPointer]
-) -> str:
-    """Prints any highlight before a cell in the Sudoku puzzle as a string."""
-    (x, y) = position
-    value = None
-    if x % 3 != 1:
-        value = next(
-            (
-                val
-                for val in [highlight.get_after((x - 1, y)) for highlight in highlights]
-                if val is not None
-            ),
-            None,
-        )
-    if value is None:
-        value = next(
-            (
-                val
-                for val in [highlight.get_before(position) for highlight in highlights]
-                if val is not None
-            ),
-            None,
-        )
-    return value if value is not None else " "
-
-
-def print_sudoku_cell(cell: Cell) -> str:
-    """Prints a single cell of the Sudoku puzzle as a string."""
-    return " " if isinstance(cell, EmptyCell) else str(cell.value)
-
-
-def print_sudoku_after_cell(
-    position: tuple[int, int], highlights: list[FieldPointer]
-) -> str:
-    """Prints any highlight after a cell in the Sudoku puzzle as a string."""
-    return next(
-        (
-            val
-            for val in [highlight.get_after(position) for highlight in highlights]
-            if val is not None
-        ),
-        " ",
-    )
+            parts.append(after.get((x, y), " "))
+    parts.append("┃")
+    return "".join(parts)
+
+
+def write_sudokus(
+    output: TextIO, boards: Iterable[tuple[Sudoku, list[FieldPointer]]]
+) -> int:
+    """Prints many Sudoku puzzles with their highlights to a stream.
+
+    Every board is written as soon as it is printed, followed by an empty line, so
+    the boards never need to be kept in memory together. Returns the number of
+    boards written.
+    """
+    count = 0
+    for sudoku, highlights in boards:
+        output.write(print_sudoku(sudoku, highlights) + "\n\n")
+        count += 1
+    return count
@@ -0,0 +1,240 @@
+"""Module for propagating constraints through a Sudoku puzzle with a work queue.
+
+Instead of running every rule over the whole board until nothing changes, the
+propagator only looks at the cells and units that changed. Placing a number
+eliminates it from the peers of the cell. An elimination that leaves a cell with a
+single candidate queues a naked single for that cell. An elimination also queues a
+hidden single check for the units of the cell and a line into block check for its
+row and column. The propagator runs until the queue is empty.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+from src.candidates import SINGLE_CANDIDATE
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku, toggle_locations
+from src.units import (
+    CELL_UNITS,
+    COLUMN_INTERSECTIONS,
+    PEERS,
+    POSITIONS,
+    ROW_INTERSECTIONS,
+    UNITS,
+)
+
+
+class Rule(Enum):
+    """A rule that the propagator can apply."""
+
+    NAKED_SINGLE = "naked single"
+    HIDDEN_SINGLE = "hidden single"
+    LINE_INTO_BLOCK = "line into block"
+
+
+@dataclass(frozen=True)
+class Placement:
+    """A number that was placed in a cell by a rule."""
+
+    rule: Rule
+    position: tuple[int, int]
+    number: int
+
+
+@dataclass(frozen=True)
+class Elimination:
+    """A number that was eliminated from a cell by a rule.
+
+    Eliminations from the peers of a placed number are not recorded, because they
+    follow directly from the placement.
+    """
+
+    rule: Rule
+    position: tuple[int, int]
+    number: int
+
+
+@dataclass(frozen=True)
+class PropagationResult:
+    """The Sudoku after propagation and the deductions that led to it."""
+
+    sudoku: Sudoku
+    deductions: list[Placement | Elimination]
+
+
+class ContradictionError(ValueError):
+    """Raised when propagation proves that the Sudoku has no solution."""
+
+
+LINE_INTERSECTIONS: tuple[tuple[tuple[int, tuple[int, ...]], ...], ...] = tuple(
+    tuple(
+        (
+            sum(1 << UNITS[item.line].index(index) for index in item.cells),
+            item.block_rest,
+        )
+        for item in intersections
+    )
+    for intersections in ROW_INTERSECTIONS + COLUMN_INTERSECTIONS
+)
+"""For each line, the mask of its slots inside each block and the rest of the block."""
+
+
+def propagate(sudoku: Sudoku) -> PropagationResult:
+    """Applies singles and line into block extrapolation until nothing changes."""
+    return Propagator(sudoku).run()
+
+
+class Propagator:
+    """Work queue based constraint propagation over the candidates of a Sudoku."""
+
+    def __init__(self, sudoku: Sudoku) -> None:
+        cells = [cell for _, cell in sudoku.cells]
+        self._values: list[int] = [
+            cell.value if isinstance(cell, FullCell) else 0 for cell in cells
+        ]
+        self._candidates: list[int] = [
+            cell.candidates if isinstance(cell, EmptyCell) else 0 for cell in cells
+        ]
+        self._locations: list[int] = list(sudoku.locations)
+        self._placed: list[int] = [0] * 27
+        self._queue: deque[tuple[Rule, int]] = deque()
+        self._queued: set[tuple[Rule, int]] = set()
+        self._deductions: list[Placement | Elimination] = []
+
+        for index, value in enumerate(self._values):
+            if value:
+                self._mark_placed(index, value)
+        for index, value in enumerate(self._values):
+            if value:
+                self._eliminate_from_peers(index, value)
+        for index in range(81):
+            self._enqueue(Rule.NAKED_SINGLE, index)
+        for unit in range(27):
+            self._enqueue(Rule.HIDDEN_SINGLE, unit)
+        for line in range(18):
+            self._enqueue(Rule.LINE_INTO_BLOCK, line)
+
+    def run(self) -> PropagationResult:
+        """Processes the work queue until it is empty."""
+        queue = self._queue
+        while queue:
+            event = queue.popleft()
+            self._queued.discard(event)
+            (rule, target) = event
+            if rule is Rule.NAKED_SINGLE:
+                self._check_naked_single(target)
+            elif rule is Rule.HIDDEN_SINGLE:
+                self._check_hidden_singles(target)
+            else:
+                self._check_line_into_block(target)
+
+        return PropagationResult(self._tosudoku(), self._deductions)
+
+    def _enqueue(self, rule: Rule, target: int) -> None:
+        """Adds an event to the work queue, unless it is already waiting."""
+        event = (rule, target)
+        if event not in self._queued:
+            self._queued.add(event)
+            self._queue.append(event)
+
+    def _check_naked_single(self, index: int) -> None:
+        """Places the only candidate of a cell, if it has exactly one."""
+        if self._values[index]:
+            return
+        if not self._candidates[index]:
+            raise ContradictionError(f"No candidates left at {POSITIONS[index]}")
+        number = SINGLE_CANDIDATE[self._candidates[index]]
+        if number is not None:
+            self._place(index, number, Rule.NAKED_SINGLE)
+
+    def _check_hidden_singles(self, unit: int) -> None:
+        """Places every number that fits in only one cell of the unit."""
+        for number in range(1, 10):
+            if self._placed[unit] & (1 << (number - 1)):
+                continue
+            slots = self._locations[unit * 9 + number - 1]
+            if not slots:
+                raise ContradictionError(f"Number {number} does not fit in unit {unit}")
+            slot = SINGLE_CANDIDATE[slots]
+            if slot is not None:
+                self._place(UNITS[unit][slot - 1], number, Rule.HIDDEN_SINGLE)
+
+    def _check_line_into_block(self, line: int) -> None:
+        """Eliminates numbers confined to one block of a line from that block."""
+        for number in range(1, 10):
+            slots = self._locations[line * 9 + number - 1]
+            if not slots:
+                continue
+            for inside, block_rest in LINE_INTERSECTIONS[line]:
+                if slots & ~inside == 0:
+                    for index in block_rest:
+                        if self._eliminate(index, number):
+                            self._deductions.append(
+                                Elimination(
+                                    Rule.LINE_INTO_BLOCK, POSITIONS[index], number
+                                )
+                            )
+                    break
+
+    def _place(self, index: int, number: int, rule: Rule) -> None:
+        """Places a number in a cell and eliminates it from all peers."""
+        if self._values[index] == number:
+            return
+        if self._values[index] or not self._candidates[index] & (1 << (number - 1)):
+            raise ContradictionError(
+                f"Number {number} cannot be placed at {POSITIONS[index]}"
+            )
+
+        self._deductions.append(Placement(rule, POSITIONS[index], number))
+        self._values[index] = number
+        toggle_locations(self._locations, index, self._candidates[index])
+        self._candidates[index] = 0
+        self._mark_placed(index, number)
+        self._eliminate_from_peers(index, number)
+
+    def _mark_placed(self, index: int, number: int) -> None:
+        """Records that a number is placed in each of the units of a cell."""
+        bit = 1 << (number - 1)
+        for unit in CELL_UNITS[index]:
+            if self._placed[unit] & bit:
+                raise ContradictionError(
+                    f"Number {number} appears twice in unit {unit}"
+                )
+            self._placed[unit] |= bit
+
+    def _eliminate_from_peers(self, index: int, number: int) -> None:
+        """Eliminates a placed number from every peer of its cell."""
+        for peer in PEERS[index]:
+            self._eliminate(peer, number)
+
+    def _eliminate(self, index: int, number: int) -> bool:
+        """Eliminates a candidate from a cell and queues the checks it affects."""
+        bit = 1 << (number - 1)
+        candidates = self._candidates[index]
+        if not candidates & bit:
+            return False
+
+        candidates &= ~bit
+        if not candidates:
+            raise ContradictionError(f"No candidates left at {POSITIONS[index]}")
+        self._candidates[index] = candidates
+        toggle_locations(self._locations, index, bit)
+
+        (row, column, block) = CELL_UNITS[index]
+        if SINGLE_CANDIDATE[candidates] is not None:
+            self._enqueue(Rule.NAKED_SINGLE, index)
+        self._enqueue(Rule.HIDDEN_SINGLE, row)
+        self._enqueue(Rule.HIDDEN_SINGLE, column)
+        self._enqueue(Rule.HIDDEN_SINGLE, block)
+        self._enqueue(Rule.LINE_INTO_BLOCK, row)
+        self._enqueue(Rule.LINE_INTO_BLOCK, column)
+        return True
+
+    def _tosudoku(self) -> Sudoku:
+        """Builds a Sudoku from the current state of the propagator."""
+        cells: list[Cell] = [
+            FullCell(value) if value else EmptyCell.frommask(candidates)
+            for value, candidates in zip(self._values, self._candidates, strict=True)
+        ]
+        return Sudoku(tuple(cells))
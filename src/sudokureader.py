@@ -1,16 +1,47 @@
-"""Module for reading Sudoku puzzles from files."""
+"""Module for reading Sudoku puzzles from files.
+
+Large files are read through a memory map. Their lines are decoded in blocks with
+``bytes.translate``, which turns every character into the number of its cell in
+one call for many puzzles at once.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 
 from src.sudoku import Sudoku
 
+INVALID_CHARACTER = 0xFF
+"""The number that DIGIT_TABLE gives every character that is not part of a puzzle."""
+
+DIGIT_TABLE = bytes(
+    0 if char == "." else int(char) if char in "0123456789" else INVALID_CHARACTER
+    for char in map(chr, range(256))
+)
+"""Translates the characters of a puzzle to the numbers of its cells, 0 for empty."""
+
+PUZZLE_RECORD = struct.Struct("81s")
+"""The layout of decoded puzzles written back to back."""
+
+BLOCK_SIZE = 1 << 20
+"""The approximate number of bytes decoded at once."""
+
 
 def sudoku_from_file(filename: str) -> Sudoku:
-    """Reads a Sudoku puzzle from a file."""
-    lines: list[list[int | None]] = []
+    """Reads a Sudoku puzzle from a file with nine lines of nine characters.
+
+    Every character that is not a digit from 1 to 9 is an empty cell, and missing
+    lines and characters are empty too.
+    """
+    digits = [0] * 81
     with open(filename, encoding="utf-8") as file:
-        while line := file.readline():
-            lines.append(sudoku_line_to_list(line))
+        for y, line in zip(range(0, 81, 9), file, strict=False):
+            for x, char in enumerate(line[:9]):
+                if char.isdigit():
+                    digits[y + x] = int(char)
 
-    return Sudoku.fromarray(lines)
+    return Sudoku.fromdigits(digits)
 
 
 def sudoku_line_to_list(line: str) -> list[int | None]:
@@ -21,3 +52,136 @@ def sudoku_line_to_list(line: str) -> list[int | None]:
 def sudoku_character_to_number(char: str) -> int | None:
     """Converts a character from the Sudoku file into a number."""
     return int(char) if char.isdigit() else None
+
+
+def sudoku_from_string(value: str) -> Sudoku:
+    """Reads a Sudoku puzzle written as a single line of 81 characters.
+
+    The cells are listed row by row. Empty cells are written as ``.`` or ``0``.
+    """
+    line = value.strip().encode()
+    if len(line) != 81:
+        raise ValueError("A Sudoku line must contain exactly 81 characters")
+    return Sudoku.fromdigits(decode_line(line))
+
+
+def read_sudokus(lines: Iterable[str]) -> Iterator[Sudoku]:
+    """Reads Sudoku puzzles one at a time from lines of 81 characters.
+
+    Blank lines and lines starting with ``#`` are skipped. Since only one line is
+    read at a time, this works on files and stdin of any size.
+    """
+    for line in puzzle_lines(lines):
+        yield sudoku_from_string(line)
+
+
+def puzzle_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Strips the lines and skips the blank lines and ``#`` comments."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def sudokus_from_file(filename: str) -> Iterator[Sudoku]:
+    """Reads Sudoku puzzles one at a time from a file in either format."""
+    for digits in digits_from_file(filename):
+        yield Sudoku.fromdigits(digits)
+
+
+def digits_from_file(filename: str) -> Iterator[bytes]:
+    """Decodes every puzzle of a file through a memory map.
+
+    See ``decode_puzzles`` for the formats that are understood.
+    """
+    with open(filename, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from decode_puzzles(data)
+
+
+def puzzles_from_file(filename: str) -> Iterator[str]:
+    """Reads every puzzle of a file through a memory map as a line of 81 characters.
+
+    The file is split like ``digits_from_file``, so both formats are understood,
+    but the puzzles are not decoded. A malformed puzzle is passed on as it was
+    written, to fail on its own when it is read, and the rest of the file is still
+    read.
+    """
+    with open(filename, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for puzzles in puzzle_blocks(data, strict=False):
+                for puzzle in puzzles:
+                    yield puzzle.decode("utf-8", "replace")
+
+
+def decode_puzzles(data: bytes | mmap.mmap) -> Iterator[bytes]:
+    """Decodes every puzzle in a buffer into 81 bytes with the numbers of its cells.
+
+    See ``puzzle_blocks`` for the formats that are understood.
+    """
+    for puzzles in puzzle_blocks(data):
+        yield from decode_block(b"".join(puzzles))
+
+
+def puzzle_blocks(
+    data: bytes | mmap.mmap, strict: bool = True
+) -> Iterator[list[bytes]]:
+    """Splits a buffer into blocks of puzzles of 81 characters, without decoding them.
+
+    A puzzle is either one line of 81 characters or nine consecutive lines of nine
+    characters. Empty cells are written as ``.`` or ``0``. Blank lines and lines
+    starting with ``#`` are skipped. The buffer is split in blocks that end at a
+    line break, so a memory-mapped file is never read into memory as a whole.
+
+    Without ``strict``, a line that is not part of a puzzle is kept as a puzzle of
+    its own instead of raising, and so are the rows of an unfinished grid.
+    """
+    rows: list[bytes] = []
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + BLOCK_SIZE)
+        end = len(data) if end < 0 else end + 1
+        puzzles: list[bytes] = []
+        for line in data[start:end].splitlines():
+            line = line.strip()
+            if line.startswith(b"#") or not (line or rows):
+                continue
+            if len(line) == 81 and not rows:
+                puzzles.append(line)
+            elif len(line) == 9:
+                rows.append(line)
+                if len(rows) == 9:
+                    puzzles.append(b"".join(rows))
+                    rows = []
+            elif strict:
+                raise ValueError("A puzzle must be one line of 81 or 9 lines of 9")
+            else:
+                if rows:
+                    puzzles.append(b"".join(rows))
+                    rows = []
+                if line:
+                    puzzles.append(line)
+        yield puzzles
+        start = end
+
+    if rows and strict:
+        raise ValueError("A puzzle must be one line of 81 or 9 lines of 9")
+    if rows:
+        yield [b"".join(rows)]
+
+
+def decode_block(block: bytes) -> Iterator[bytes]:
+    """Checks and decodes puzzles written back to back, 81 characters each."""
+    return map(itemgetter(0), PUZZLE_RECORD.iter_unpack(decode_line(block)))
+
+
+def decode_line(line: bytes) -> bytes:
+    """Translates characters to the numbers of their cells, checking every one."""
+    digits = line.translate(DIGIT_TABLE)
+    if INVALID_CHARACTER in digits:
+        raise ValueError("A Sudoku line may only contain digits and '.'")
+    return digits
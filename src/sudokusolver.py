@@ -0,0 +1,171 @@
+"""Module for solving Sudoku puzzles with a bitmask backtracking search.
+
+The numbers used in every row, column and block are kept as 9-bit masks, so the
+candidates of a cell are a few bitwise operations away. Before branching, the search
+places every cell with a single candidate. It then branches on the empty cell with
+the fewest candidates. The candidates of the Sudoku seed the search, so numbers that
+were already eliminated are never tried.
+"""
+
+from src.candidates import CANDIDATE_COUNT, CANDIDATE_NUMBERS, SINGLE_CANDIDATE
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.units import CELL_BLOCK, CELL_COLUMN, CELL_ROW, UNITS
+
+
+def solve(sudoku: Sudoku) -> Sudoku | None:
+    """Returns a solution of the Sudoku, or None if it has no solution."""
+    solutions = BacktrackingSearch(sudoku).run(limit=1)
+    return solutions[0] if solutions else None
+
+
+def count_solutions(sudoku: Sudoku, limit: int = 2) -> int:
+    """Counts the solutions of the Sudoku, stopping as soon as ``limit`` are found."""
+    return len(BacktrackingSearch(sudoku).run(limit))
+
+
+def has_unique_solution(sudoku: Sudoku) -> bool:
+    """Checks if the Sudoku has exactly one solution."""
+    return count_solutions(sudoku, limit=2) == 1
+
+
+class BacktrackingSearch:
+    """Depth-first search over the candidates of a Sudoku."""
+
+    def __init__(self, sudoku: Sudoku) -> None:
+        self._values: list[int] = [0] * 81
+        self._allowed: list[int] = [0] * 81
+        self._rows: list[int] = [0] * 9
+        self._columns: list[int] = [0] * 9
+        self._blocks: list[int] = [0] * 9
+        self._empty: list[int] = []
+        self._valid = True
+
+        for index, (_, cell) in enumerate(sudoku.cells):
+            if isinstance(cell, FullCell):
+                if self._used(index) & (1 << (cell.value - 1)):
+                    self._valid = False
+                self._place(index, cell.value)
+            else:
+                self._allowed[index] = cell.candidates
+                self._empty.append(index)
+
+    def run(self, limit: int) -> list[Sudoku]:
+        """Finds up to ``limit`` solutions."""
+        solutions: list[tuple[int, ...]] = []
+        if self._valid and limit > 0:
+            self._search(limit, solutions)
+        return [tosudoku(values) for values in solutions]
+
+    def _search(self, limit: int, solutions: list[tuple[int, ...]]) -> None:
+        """Places singles, then branches on the cell with the fewest candidates."""
+        values = self._values
+        allowed = self._allowed
+        rows = self._rows
+        columns = self._columns
+        blocks = self._blocks
+        candidates = [0] * 81
+        placed: list[int] = []
+
+        best = -1
+        progress = True
+        while progress:
+            progress = False
+            best = -1
+            best_count = 10
+            for index in self._empty:
+                if values[index]:
+                    continue
+                mask = allowed[index] & ~(
+                    rows[CELL_ROW[index]]
+                    | columns[CELL_COLUMN[index]]
+                    | blocks[CELL_BLOCK[index]]
+                )
+                count = CANDIDATE_COUNT[mask]
+                if count == 0:
+                    self._undo(placed)
+                    return
+                if count == 1:
+                    self._place(index, SINGLE_CANDIDATE[mask])
+                    placed.append(index)
+                    progress = True
+                    continue
+                candidates[index] = mask
+                if count < best_count:
+                    best = index
+                    best_count = count
+
+            if progress or best < 0:
+                continue
+            for unit in UNITS:
+                once = 0
+                twice = 0
+                for index in unit:
+                    mask = 0 if values[index] else candidates[index]
+                    twice |= once & mask
+                    once |= mask
+                    if values[index]:
+                        once |= 1 << (values[index] - 1)
+                        twice |= 1 << (values[index] - 1)
+                if once != 511:
+                    self._undo(placed)
+                    return
+                hidden = once & ~twice
+                for index in unit:
+                    if not values[index] and candidates[index] & hidden:
+                        number = SINGLE_CANDIDATE[candidates[index] & hidden]
+                        if number is None or self._used(index) & (1 << (number - 1)):
+                            self._undo(placed)
+                            return
+                        self._place(index, number)
+                        placed.append(index)
+                        progress = True
+
+        if best < 0:
+            solutions.append(tuple(values))
+        else:
+            for number in CANDIDATE_NUMBERS[candidates[best]]:
+                self._place(best, number)
+                self._search(limit, solutions)
+                self._remove(best)
+                if len(solutions) >= limit:
+                    break
+
+        self._undo(placed)
+
+    def _used(self, index: int) -> int:
+        """Returns the numbers already used in the units of a cell."""
+        return (
+            self._rows[CELL_ROW[index]]
+            | self._columns[CELL_COLUMN[index]]
+            | self._blocks[CELL_BLOCK[index]]
+        )
+
+    def _place(self, index: int, number: int) -> None:
+        """Places a number and marks it as used in the units of the cell."""
+        bit = 1 << (number - 1)
+        self._values[index] = number
+        self._rows[CELL_ROW[index]] |= bit
+        self._columns[CELL_COLUMN[index]] |= bit
+        self._blocks[CELL_BLOCK[index]] |= bit
+
+    def _remove(self, index: int) -> None:
+        """Removes a placed number and frees it in the units of the cell."""
+        mask = ~(1 << (self._values[index] - 1))
+        self._values[index] = 0
+        self._rows[CELL_ROW[index]] &= mask
+        self._columns[CELL_COLUMN[index]] &= mask
+        self._blocks[CELL_BLOCK[index]] &= mask
+
+    def _undo(self, placed: list[int]) -> None:
+        """Removes the numbers placed in the given cells."""
+        for index in reversed(placed):
+            self._remove(index)
+
+
+def tosudoku(values: tuple[int, ...]) -> Sudoku:
+    """Builds a solved Sudoku from the values of every cell."""
+    cells: list[Cell] = [
+        FullCell(value) if value else EmptyCell.create() for value in values
+    ]
+    return Sudoku(tuple(cells))
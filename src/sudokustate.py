@@ -0,0 +1,125 @@
+"""Module for saving and restoring the complete state of a Sudoku.
+
+The state includes the candidates left in every empty cell, so the eliminations
+made so far survive a restart or a handoff to another process without running
+the rules again. It is kept either as a binary record with candidates, in the
+layout of ``sudokubinary``, or as a text grid that people can read and edit, in
+which every empty cell lists its candidates in brackets. Restoring either form
+takes one lookup per cell and does not check the state again.
+"""
+
+from src.candidates import numbers_to_mask
+from src.cell import FullCell
+from src.sudoku import Sudoku
+from src.sudokubinary import (
+    CANDIDATES_SIZE,
+    HAS_CANDIDATES,
+    HEADER,
+    MAGIC,
+    VALUES_SIZE,
+    VERSION,
+    pack_sudoku,
+    unpack_sudoku,
+    write_header,
+)
+from src.zobrist import FULL_CELL_CODE
+
+STATE_SIZE = VALUES_SIZE + CANDIDATES_SIZE
+"""The size of a state in its binary form."""
+
+SEPARATORS = "|-+"
+"""The characters of the lines between bands and stacks in the text form."""
+
+
+def state_to_bytes(sudoku: Sudoku) -> bytes:
+    """Packs the values and candidates of every cell into 133 bytes."""
+    return pack_sudoku(sudoku, candidates=True)
+
+
+def state_from_bytes(data: bytes) -> Sudoku:
+    """Restores a Sudoku from the binary form of its state."""
+    if len(data) != STATE_SIZE:
+        raise ValueError(f"A Sudoku state must be exactly {STATE_SIZE} bytes")
+    return unpack_sudoku(data)
+
+
+def state_to_text(sudoku: Sudoku) -> str:
+    """Writes the values and candidates of every cell as a text grid.
+
+    Full cells are written as their value and empty cells as their candidates in
+    brackets, so ``[]`` is a cell without candidates. The columns are aligned and
+    the bands and stacks are separated by lines.
+    """
+    tokens = [
+        str(cell.value)
+        if isinstance(cell, FullCell)
+        else "[" + "".join(map(str, cell.possible_numbers)) + "]"
+        for _, cell in sudoku.cells
+    ]
+    width = max(map(len, tokens))
+    lines: list[str] = []
+    for y in range(9):
+        if y and y % 3 == 0:
+            lines.append("+".join(["-" * (width * 3 + 4)] * 3))
+        row = tokens[y * 9 : y * 9 + 9]
+        stacks = [
+            " ".join(token.ljust(width) for token in row[x : x + 3])
+            for x in range(0, 9, 3)
+        ]
+        lines.append(" " + " | ".join(stacks).rstrip())
+    return "\n".join(lines) + "\n"
+
+
+def state_from_text(text: str) -> Sudoku:
+    """Restores a Sudoku from the text form of its state.
+
+    Only the tokens matter, so the spacing and the separator lines can be changed
+    freely.
+    """
+    tokens = [token for token in text.split() if token.strip(SEPARATORS)]
+    if len(tokens) != 81:
+        raise ValueError("A Sudoku state must list exactly 81 cells")
+    return Sudoku.fromcodes([token_to_code(token) for token in tokens])
+
+
+def token_to_code(token: str) -> int:
+    """Converts a cell of the text form to its cell code."""
+    if len(token) == 1 and token in "123456789":
+        return FULL_CELL_CODE + int(token)
+    numbers = token[1:-1]
+    if (
+        token[:1] != "["
+        or token[-1:] != "]"
+        or any(char not in "123456789" for char in numbers)
+        or len(set(numbers)) != len(numbers)
+    ):
+        raise ValueError(f"Invalid cell {token!r} in Sudoku state")
+    return numbers_to_mask(map(int, numbers))
+
+
+def save_state(filename: str, sudoku: Sudoku, binary: bool = False) -> None:
+    """Saves the state of a Sudoku to a file, as text or as a binary file.
+
+    A binary file is a ``sudokubinary`` file with a single record, so it can also
+    be opened with ``PackedSudokus``.
+    """
+    if binary:
+        with open(filename, "wb") as file:
+            write_header(file, candidates=True)
+            file.write(state_to_bytes(sudoku))
+    else:
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(state_to_text(sudoku))
+
+
+def load_state(filename: str) -> Sudoku:
+    """Restores the state of a Sudoku from a file in either form."""
+    with open(filename, "rb") as file:
+        data = file.read()
+    if not data.startswith(MAGIC):
+        return state_from_text(data.decode("utf-8"))
+
+    (_, version, flags) = HEADER.unpack_from(data)
+    if version != VERSION or not flags & HAS_CANDIDATES:
+        raise ValueError("A binary Sudoku state must be a record with candidates")
+    return state_from_bytes(data[HEADER.size :])
@@ -0,0 +1,18 @@
+"""Module for writing Sudoku puzzles as text."""
+
+from src.cell import FullCell
+from src.sudoku import Sudoku
+
+
+def sudoku_to_string(sudoku: Sudoku) -> str:
+    """Writes a Sudoku puzzle as a single line of 81 characters, using ``.`` for
+    empty cells."""
+    return "".join(
+        str(cell.value) if isinstance(cell, FullCell) else "."
+        for _, cell in sudoku.cells
+    )
+
+
+def positions_to_string(positions: list[tuple[int, int]]) -> str:
+    """Writes a list of positions as space separated ``x,y`` pairs."""
+    return " ".join(f"{x},{y}" for x, y in positions)
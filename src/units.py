@@ -0,0 +1,152 @@
+"""Module with precomputed tables describing the geometry of a Sudoku grid.
+
+A unit is a row, column or block: a group of nine cells that must contain every
+number exactly once. Cells are addressed by their index in the cell storage of a
+Sudoku, which is ``(y - 1) * 9 + (x - 1)`` for the cell at ``(x, y)``. All tables
+are built once when the module is imported.
+"""
+
+from dataclasses import dataclass
+
+POSITIONS: tuple[tuple[int, int], ...] = tuple(
+    (index % 9 + 1, index // 9 + 1) for index in range(81)
+)
+"""The global ``(x, y)`` position of each cell index."""
+
+LINE_TO_BLOCK: tuple[int, ...] = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3)
+"""The block coordinate of each line index between 1 and 9."""
+
+BLOCK_COORDINATES: tuple[tuple[int, int], ...] = tuple(
+    (x, y) for y in range(1, 4) for x in range(1, 4)
+)
+"""The ``(x, y)`` coordinates of the nine blocks, in reading order."""
+
+BLOCK_LOCAL_POSITIONS: tuple[tuple[int, int], ...] = BLOCK_COORDINATES
+"""The local ``(x, y)`` positions inside a block, in reading order."""
+
+BLOCK_LOCAL_POSITIONS_OUTSIDE_ROW: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple((x, y) for x, y in BLOCK_LOCAL_POSITIONS if y != row) for row in range(1, 4)
+)
+"""For each local block row, the six local positions in the block outside it."""
+
+BLOCK_LOCAL_POSITIONS_OUTSIDE_COLUMN: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple((x, y) for x, y in BLOCK_LOCAL_POSITIONS if x != column)
+    for column in range(1, 4)
+)
+"""For each local block column, the six local positions in the block outside it."""
+
+ROWS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((y - 1) * 9 + (x - 1) for x in range(1, 10)) for y in range(1, 10)
+)
+"""The cell indexes of row ``y`` at ``ROWS[y - 1]``, ordered by x."""
+
+COLUMNS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((y - 1) * 9 + (x - 1) for y in range(1, 10)) for x in range(1, 10)
+)
+"""The cell indexes of column ``x`` at ``COLUMNS[x - 1]``, ordered by y."""
+
+BLOCKS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        (block_y * 3 + y - 4) * 9 + (block_x * 3 + x - 4)
+        for x, y in BLOCK_LOCAL_POSITIONS
+    )
+    for block_x, block_y in BLOCK_COORDINATES
+)
+"""The cell indexes of each block in reading order of blocks and cells."""
+
+UNITS: tuple[tuple[int, ...], ...] = ROWS + COLUMNS + BLOCKS
+"""All 27 units: the nine rows, then the nine columns, then the nine blocks."""
+
+ROW_UNITS = range(0, 9)
+COLUMN_UNITS = range(9, 18)
+BLOCK_UNITS = range(18, 27)
+
+
+def block_number(x: int, y: int) -> int:
+    """Converts block coordinates between 1 and 3 to an index into BLOCKS."""
+    return (y - 1) * 3 + (x - 1)
+
+
+CELL_ROW: tuple[int, ...] = tuple(y - 1 for _, y in POSITIONS)
+"""The index into ROWS of the row that contains each cell."""
+
+CELL_COLUMN: tuple[int, ...] = tuple(x - 1 for x, _ in POSITIONS)
+"""The index into COLUMNS of the column that contains each cell."""
+
+CELL_BLOCK: tuple[int, ...] = tuple(
+    block_number(LINE_TO_BLOCK[x], LINE_TO_BLOCK[y]) for x, y in POSITIONS
+)
+"""The index into BLOCKS of the block that contains each cell."""
+
+CELL_UNITS: tuple[tuple[int, int, int], ...] = tuple(
+    (row, 9 + column, 18 + block)
+    for row, column, block in zip(CELL_ROW, CELL_COLUMN, CELL_BLOCK, strict=True)
+)
+"""The indexes into UNITS of the row, column and block of each cell."""
+
+CELL_UNIT_SLOTS: tuple[tuple[int, int, int], ...] = tuple(
+    tuple(UNITS[unit].index(index) for unit in CELL_UNITS[index]) for index in range(81)
+)
+"""The position of each cell inside its row, column and block units."""
+
+PEERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sorted({peer for unit in CELL_UNITS[index] for peer in UNITS[unit]} - {index})
+    )
+    for index in range(81)
+)
+"""The 20 other cells that share a row, column or block with each cell."""
+
+
+@dataclass(frozen=True)
+class Intersection:
+    """The three cells shared by a line (row or column) and a block.
+
+    ``line`` and ``block`` index into UNITS. ``line_rest`` and ``block_rest`` are
+    the six cells of the line outside the block and of the block outside the line.
+    """
+
+    line: int
+    block: int
+    cells: tuple[int, ...]
+    line_rest: tuple[int, ...]
+    block_rest: tuple[int, ...]
+
+
+def _intersect(line: int, block: int) -> Intersection:
+    """Builds the intersection between a line and a block."""
+    line_cells = UNITS[line]
+    block_cells = UNITS[block]
+    return Intersection(
+        line,
+        block,
+        tuple(index for index in line_cells if index in block_cells),
+        tuple(index for index in line_cells if index not in block_cells),
+        tuple(index for index in block_cells if index not in line_cells),
+    )
+
+
+ROW_INTERSECTIONS: tuple[tuple[Intersection, ...], ...] = tuple(
+    tuple(
+        _intersect(row, 18 + block_number(block_x, LINE_TO_BLOCK[row + 1]))
+        for block_x in range(1, 4)
+    )
+    for row in ROW_UNITS
+)
+"""The three intersections of row ``y`` at ``ROW_INTERSECTIONS[y - 1]``."""
+
+COLUMN_INTERSECTIONS: tuple[tuple[Intersection, ...], ...] = tuple(
+    tuple(
+        _intersect(column, 18 + block_number(LINE_TO_BLOCK[column - 8], block_y))
+        for block_y in range(1, 4)
+    )
+    for column in COLUMN_UNITS
+)
+"""The three intersections of column ``x`` at ``COLUMN_INTERSECTIONS[x - 1]``."""
+
+INTERSECTIONS: tuple[Intersection, ...] = tuple(
+    intersection
+    for intersections in ROW_INTERSECTIONS + COLUMN_INTERSECTIONS
+    for intersection in intersections
+)
+"""All 54 intersections between a line and a block."""
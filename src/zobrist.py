@@ -0,0 +1,54 @@
+"""Module with the Zobrist keys used to hash the state of a Sudoku.
+
+Every feature of a cell, a value it holds or a number that is still a candidate,
+has a fixed random 64-bit key. The hash of a state is the exclusive or of the keys
+of all its features, so changing a cell only takes two lookups to update it. The
+keys come from a fixed seed, so hashes are the same in every process.
+"""
+
+from random import Random
+
+from src.candidates import ALL_CANDIDATES
+from src.cell import Cell, FullCell
+
+ZOBRIST_SEED = 20240917
+"""The seed of the random keys."""
+
+FULL_CELL_CODE = ALL_CANDIDATES + 1
+"""Added to the value of a full cell, so it never equals a mask of candidates."""
+
+
+def _build_keys() -> tuple[tuple[int, ...], ...]:
+    """Builds for every cell index the hash of every cell code."""
+    random = Random(ZOBRIST_SEED)
+    keys = []
+    for _ in range(81):
+        candidate_keys = [random.getrandbits(64) for _ in range(9)]
+        value_keys = [random.getrandbits(64) for _ in range(9)]
+        hashes = [0] * (FULL_CELL_CODE + 10)
+        for mask in range(1, FULL_CELL_CODE):
+            lowest = (mask & -mask).bit_length() - 1
+            hashes[mask] = hashes[mask & (mask - 1)] ^ candidate_keys[lowest]
+        for number in range(1, 10):
+            hashes[FULL_CELL_CODE + number] = value_keys[number - 1]
+        keys.append(tuple(hashes))
+    return tuple(keys)
+
+
+ZOBRIST_KEYS: tuple[tuple[int, ...], ...] = _build_keys()
+"""The hash of every cell code at every cell index."""
+
+
+def cell_code(cell: Cell) -> int:
+    """Returns the candidate mask of an empty cell or the coded value of a full one."""
+    return (
+        FULL_CELL_CODE + cell.value if isinstance(cell, FullCell) else cell.candidates
+    )
+
+
+def zobrist_hash(cells: tuple[Cell, ...]) -> int:
+    """Hashes the values and candidates of every cell from scratch."""
+    result = 0
+    for keys, cell in zip(ZOBRIST_KEYS, cells, strict=True):
+        result ^= keys[cell_code(cell)]
+    return result
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from bench.corpus import generated_puzzles, shuffled_grid, tier
+from bench.harness import Benchmark, measure, percentile
+from src.sudokureader import sudoku_from_string
+from src.sudokusolver import has_unique_solution
+from src.sudokuwriter import sudoku_to_string
+from src.units import UNITS
+
+
+def test_takes_percentile_by_nearest_rank():
+    samples = [float(value) for value in range(20, 0, -1)]
+
+    assert percentile(samples, 0.5) == 10.0
+    assert percentile(samples, 0.95) == 19.0
+    assert percentile([3.0], 0.95) == 3.0
+
+
+def test_rejects_percentile_of_no_samples():
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+
+def test_measures_time_per_puzzle():
+    benchmark = Benchmark("sum", "group", lambda: sum(range(100)), 4)
+
+    result = measure(benchmark, rounds=3, min_time=0.001)
+
+    assert result.name == "sum"
+    assert 0 < result.median <= result.p95
+    assert result.ops_per_second == pytest.approx(1 / result.median)
+
+
+def test_shuffled_grid_is_solved():
+    grid = shuffled_grid(random.Random(1))
+
+    assert all(
+        sorted(grid[index] for index in unit) == list("123456789") for unit in UNITS
+    )
+
+
+def test_generates_same_corpus_for_same_seed():
+    first = generated_puzzles(3, seed=7)
+    second = generated_puzzles(3, seed=7)
+
+    assert {
+        name: list(map(sudoku_to_string, puzzles)) for name, puzzles in first.items()
+    } == {
+        name: list(map(sudoku_to_string, puzzles)) for name, puzzles in second.items()
+    }
+    assert all(
+        has_unique_solution(sudoku) for puzzles in first.values() for sudoku in puzzles
+    )
+
+
+def test_puts_puzzle_that_needs_search_in_hardest_tier():
+    sudoku = sudoku_from_string(
+        "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    )
+
+    assert tier(sudoku) == "search"
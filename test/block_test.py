@@ -1,18 +1,52 @@
+import pytest
+
 from src.block import Block
-from src.cell import Cell, FullCell
+from src.cell import Cell, EmptyCell, FullCell
 
 
 def test_block_contains_number():
-    cells: dict[tuple[int, int], Cell] = {}
-    cells[(2, 2)] = FullCell(6)
+    cells: list[Cell] = [EmptyCell.create()] * 9
+    cells[4] = FullCell(6)
     block = Block((0, 0), cells)
 
     assert block.contains(6)
 
 
 def test_block_does_not_contain_number():
-    cells: dict[tuple[int, int], Cell] = {}
-    cells[(2, 2)] = FullCell(6)
+    cells: list[Cell] = [EmptyCell.create()] * 9
+    cells[4] = FullCell(6)
     block = Block((0, 0), cells)
 
     assert not block.contains(3)
+
+
+def test_get_returns_cell_at_local_position():
+    cells: list[Cell] = [EmptyCell.create()] * 9
+    cells[5] = FullCell(2)
+    block = Block((3, 6), cells)
+
+    assert block.get(3, 2).value == 2
+
+
+def test_block_is_view_on_given_slots():
+    storage: list[Cell] = [EmptyCell.create()] * 81
+    storage[40] = FullCell(8)
+    block = Block((3, 3), storage, (30, 31, 32, 39, 40, 41, 48, 49, 50))
+
+    assert block.get(2, 2).value == 8
+    assert block.cells[4] == FullCell(8)
+
+
+def test_origin_is_offset_of_local_positions():
+    block = Block((3, 6), [EmptyCell.create()] * 9)
+
+    assert block.origin == (3, 6)
+    assert block.local_to_global(1, 1) == (4, 7)
+
+
+@pytest.mark.parametrize("x,y", [(0, 1), (4, 1), (1, 0), (1, 4)])
+def test_cannot_get_cell_out_of_bounds(x: int, y: int):
+    block = Block((0, 0), [EmptyCell.create()] * 9)
+
+    with pytest.raises(ValueError):
+        block.get(x, y)
@@ -0,0 +1,34 @@
+import pytest
+
+from src.candidates import (
+    ALL_CANDIDATES,
+    CANDIDATE_COUNT,
+    CANDIDATE_NUMBERS,
+    SINGLE_CANDIDATE,
+    number_to_mask,
+    numbers_to_mask,
+)
+
+
+def test_all_candidates_contains_every_number():
+    assert CANDIDATE_NUMBERS[ALL_CANDIDATES] == (1, 2, 3, 4, 5, 6, 7, 8, 9)
+    assert CANDIDATE_COUNT[ALL_CANDIDATES] == 9
+
+
+@pytest.mark.parametrize("number", range(1, 10))
+def test_single_candidate_of_number_mask_is_number(number: int):
+    assert SINGLE_CANDIDATE[number_to_mask(number)] == number
+
+
+def test_single_candidate_is_none_for_multiple_candidates():
+    assert SINGLE_CANDIDATE[numbers_to_mask([3, 8])] is None
+
+
+def test_single_candidate_is_none_without_candidates():
+    assert SINGLE_CANDIDATE[0] is None
+
+
+def test_numbers_to_mask_round_trips_through_candidate_numbers():
+    mask = numbers_to_mask([9, 1, 4])
+
+    assert CANDIDATE_NUMBERS[mask] == (1, 4, 9)
@@ -88,3 +88,35 @@ def test_cannot_reconsider_number_out_of_bounds(number: int):
     cell = EmptyCell.create()
     with pytest.raises(ValueError):
         cell.reconsider(number)
+
+
+def test_possible_numbers_excludes_eliminated_numbers():
+    cell = EmptyCell.create().eliminate(2).eliminate(7)
+
+    assert list(cell.possible_numbers) == [1, 3, 4, 5, 6, 8, 9]
+    assert cell.possible_count == 7
+
+
+def test_single_number_is_only_possible_number():
+    cell = EmptyCell.frommask(0b000010000)
+
+    assert cell.single_number == 5
+
+
+def test_single_number_is_none_with_multiple_possible_numbers():
+    cell = EmptyCell.create().eliminate(5)
+
+    assert cell.single_number is None
+
+
+def test_empty_cells_with_same_candidates_are_shared():
+    cell = EmptyCell.create().eliminate(4)
+    othercell = EmptyCell.create().eliminate(4)
+
+    assert cell is othercell
+
+
+@pytest.mark.parametrize("mask", [-1, 512])
+def test_cannot_create_empty_cell_from_mask_out_of_bounds(mask: int):
+    with pytest.raises(ValueError):
+        EmptyCell.frommask(mask)
@@ -0,0 +1,125 @@
+from os import path
+
+import pytest
+
+from src.hintcache import HintCache, state_key
+from src.sudoku import Sudoku
+from src.sudokuhints import find_hints
+from src.sudokureader import sudoku_from_file, sudoku_from_string
+from src.sudokuwriter import sudoku_to_string
+
+
+def test_key_depends_on_candidates():
+    sudoku = Sudoku.empty()
+
+    assert state_key(sudoku) == state_key(Sudoku.empty())
+    assert state_key(sudoku) != state_key(sudoku.eliminate_all([((1, 1), [5])]))
+    assert state_key(sudoku) != state_key(sudoku.set(1, 1, 5))
+
+
+def test_returns_same_hints_as_pipeline():
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    cache = HintCache()
+
+    result = cache.find_hints(sudoku)
+
+    assert result == find_hints(sudoku).positions
+
+
+def test_counts_hits_and_misses():
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    cache = HintCache()
+
+    # when
+    cache.find_hints(sudoku)
+    cache.find_hints(sudoku)
+    cache.find_hints(Sudoku.empty())
+
+    # then
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cache.stats.requests == 3
+
+
+def test_repeated_request_skips_rules(monkeypatch):
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    cache = HintCache()
+    expected = cache.find_hints(sudoku)
+    monkeypatch.setattr("src.hintcache.find_hints", pytest.fail)
+
+    # when
+    result = cache.find_hints(sudoku)
+
+    # then
+    assert result == expected
+    assert cache.stats.hits == 1
+
+
+def test_changing_returned_hints_leaves_cache_untouched():
+    # given
+    sudoku = sudoku_from_file("puzzles/35.txt")
+    cache = HintCache()
+    cache.find_hints(sudoku).clear()
+
+    # when
+    result = cache.find_hints(sudoku)
+
+    # then
+    assert result == find_hints(sudoku).positions
+
+
+def test_evicts_least_recently_used_state():
+    # given
+    first = Sudoku.empty()
+    second = first.set(1, 1, 1)
+    third = first.set(1, 1, 2)
+    cache = HintCache(maxsize=2)
+
+    # when
+    cache.find_hints(first)
+    cache.find_hints(second)
+    cache.find_hints(first)
+    cache.find_hints(third)
+
+    # then
+    assert len(cache) == 2
+    assert cache.get(state_key(first)) is not None
+    assert cache.get(state_key(second)) is None
+
+
+def test_rejects_empty_cache():
+    with pytest.raises(ValueError):
+        HintCache(maxsize=0)
+
+
+def test_keeps_hints_on_disk_across_restarts(tmp_path):
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    filename = path.join(tmp_path, "hints")
+    with HintCache(path=filename) as cache:
+        expected = cache.find_hints(sudoku)
+
+    # when
+    with HintCache(path=filename) as cache:
+        result = cache.find_hints(sudoku)
+        stats = cache.stats
+
+    # then
+    assert result == expected
+    assert (stats.disk_hits, stats.misses) == (1, 0)
+
+
+def test_canonical_cache_shares_hints_between_equivalent_puzzles():
+    # given
+    puzzle = sudoku_to_string(sudoku_from_file("puzzles/17.txt"))
+    transposed = "".join(puzzle[y * 9 + x] for x in range(9) for y in range(9))
+    cache = HintCache(canonical=True)
+    cache.find_hints(sudoku_from_string(puzzle))
+
+    # when
+    result = cache.find_hints(sudoku_from_string(transposed))
+
+    # then
+    assert result == find_hints(sudoku_from_string(transposed)).positions
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
@@ -0,0 +1,141 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from src.instrumentation import INSTRUMENTATION, RuleStats, instrumented
+from src.sudoku import Sudoku
+from src.sudokuextrapolateline import (
+    eliminate_from_extrapolated_lines,
+    extrapolate_lines_until_stable,
+    find_extrapolations_from_rows,
+)
+from src.sudokufinder import find_cells_with_unique_number_in_rows
+from src.sudokuhints import find_first_hints
+from src.sudokureader import sudoku_from_file
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enabled = True
+    yield
+    INSTRUMENTATION.enabled = False
+    INSTRUMENTATION.reset()
+
+
+def test_records_nothing_while_disabled():
+    INSTRUMENTATION.reset()
+
+    find_cells_with_unique_number_in_rows(Sudoku.empty())
+
+    assert INSTRUMENTATION.rules == {}
+
+
+def test_records_calls_units_and_hints(enabled: None):
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+
+    # when
+    result = find_cells_with_unique_number_in_rows(sudoku)
+    find_cells_with_unique_number_in_rows(sudoku)
+
+    # then
+    stats = INSTRUMENTATION.rules["sudokufinder.find_cells_with_unique_number_in_rows"]
+    assert stats.calls == 2
+    assert stats.units == 18
+    assert stats.hints == 2 * len(result)
+    assert stats.seconds > 0
+
+
+def test_counts_examined_lines(enabled: None):
+    find_extrapolations_from_rows(Sudoku.empty(), [1, 5])
+
+    stats = INSTRUMENTATION.rules["sudokuextrapolateline.find_extrapolations_from_rows"]
+    assert stats.units == 2
+
+
+def test_counts_eliminated_candidates(enabled: None):
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+
+    # when
+    result = extrapolate_lines_until_stable(sudoku)
+
+    # then
+    stats = INSTRUMENTATION.rules[
+        "sudokuextrapolateline.eliminate_from_extrapolated_lines"
+    ]
+    expected = sum(
+        before.possible_count - after.possible_count
+        for (_, before), (_, after) in zip(sudoku.cells, result.cells, strict=True)
+        if hasattr(before, "possible_count")
+    )
+    assert stats.eliminations == expected > 0
+
+
+def test_records_only_the_rules_of_a_driver(enabled: None):
+    extrapolate_lines_until_stable(sudoku_from_file("puzzles/17.txt"))
+
+    assert sorted(INSTRUMENTATION.rules) == [
+        "sudokuextrapolateline.eliminate_from_extrapolated_lines",
+        "sudokuextrapolateline.find_extrapolations_from_columns",
+        "sudokuextrapolateline.find_extrapolations_from_rows",
+    ]
+
+
+def test_records_hints_of_lazy_finders(enabled: None):
+    result = find_first_hints(sudoku_from_file("puzzles/35.txt"), 2)
+
+    stats = INSTRUMENTATION.rules["sudokuhints.first_positions"]
+    assert stats.calls >= 1
+    assert stats.hints >= len(result.positions) > 0
+
+
+def test_counts_calls_by_keyword_like_positional_calls(enabled: None):
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    rows = "sudokuextrapolateline.find_extrapolations_from_rows"
+    eliminate = "sudokuextrapolateline.eliminate_from_extrapolated_lines"
+
+    # when
+    find_extrapolations_from_rows(sudoku=sudoku, indexes=[1, 5])
+    extrapolations = find_extrapolations_from_rows(sudoku=sudoku)
+    eliminate_from_extrapolated_lines(
+        sudoku=sudoku, row_extrapolations=extrapolations, column_extrapolations=[]
+    )
+
+    # then
+    assert INSTRUMENTATION.rules[rows].units == 2 + 9
+    assert INSTRUMENTATION.rules[eliminate].eliminations > 0
+
+
+def test_wraps_rule_without_changing_it():
+    @instrumented(units=3)
+    def rule(value: int) -> list[int]:
+        """Doubles a value."""
+        return [value * 2]
+
+    assert rule(4) == [8]
+    assert rule.__doc__ == "Doubles a value."
+
+
+def test_merges_statistics_from_elsewhere(enabled: None):
+    INSTRUMENTATION.merge({"rule": RuleStats(1, 0.5, 9, 2, 3)})
+    INSTRUMENTATION.merge({"rule": RuleStats(2, 0.5, 9, 0, 1)})
+
+    assert INSTRUMENTATION.rules["rule"] == RuleStats(3, 1.0, 18, 2, 4)
+
+
+def test_dumps_statistics(enabled: None):
+    INSTRUMENTATION.merge({"rule": RuleStats(1, 0.5, 9, 2, 3)})
+
+    assert json.loads(INSTRUMENTATION.tojson())["rule"]["hints"] == 3
+    assert INSTRUMENTATION.totable().splitlines()[-1].split() == [
+        "rule",
+        "1",
+        "500.00ms",
+        "9",
+        "2",
+        "3",
+    ]
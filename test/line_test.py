@@ -3,10 +3,12 @@ import pytest
 from src.cell import Cell, EmptyCell, FullCell
 from src.line import Line
 
+EMPTY_LINE: list[Cell] = [EmptyCell.create()] * 9
+
 
 def test_get_returns_cell_value():
-    cells: dict[int, Cell] = {}
-    cells[2] = FullCell(4)
+    cells = EMPTY_LINE.copy()
+    cells[1] = FullCell(4)
     row = Line(1, cells)
 
     result = row.get(2)
@@ -15,7 +17,7 @@ def test_get_returns_cell_value():
 
 
 def test_get_returns_empty_cell_by_default():
-    row = Line(1, {})
+    row = Line(1, EMPTY_LINE)
 
     result = row.get(4)
 
@@ -25,27 +27,36 @@ def test_get_returns_empty_cell_by_default():
 @pytest.mark.parametrize("index", [0, 10])
 def test_cannot_create_row_out_of_bounds(index: int):
     with pytest.raises(ValueError):
-        Line(index, {})
+        Line(index, EMPTY_LINE)
 
 
 @pytest.mark.parametrize("index", [0, 10])
 def test_cannot_get_row_out_of_bounds(index: int):
-    row = Line(1, {})
+    row = Line(1, EMPTY_LINE)
     with pytest.raises(ValueError):
         row.get(index)
 
 
 def test_can_check_if_number_in_line():
-    cells: dict[int, Cell] = {}
-    cells[4] = FullCell(6)
+    cells = EMPTY_LINE.copy()
+    cells[3] = FullCell(6)
     line = Line(1, cells)
 
     assert line.contains(6)
 
 
 def test_can_check_if_number_not_in_line():
-    cells: dict[int, Cell] = {}
-    cells[4] = FullCell(6)
+    cells = EMPTY_LINE.copy()
+    cells[3] = FullCell(6)
     line = Line(1, cells)
 
     assert not line.contains(3)
+
+
+def test_line_is_view_on_given_slots():
+    storage: list[Cell] = [EmptyCell.create()] * 81
+    storage[23] = FullCell(9)
+    column = Line(6, storage, (5, 14, 23, 32, 41, 50, 59, 68, 77))
+
+    assert column.get(3).value == 9
+    assert column.contains(9)
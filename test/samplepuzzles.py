@@ -0,0 +1,14 @@
+"""Puzzles shared by the tests, with empty cells written as ``.``."""
+
+EASY_PUZZLE = (
+    "..3.2.6..9..3.5..1..18.64....81.29..7.......8..67.82....26.95..8..2.3..9..5.1.3.."
+)
+EASY_SOLUTION = (
+    "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+)
+HARD_PUZZLE = (
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+)
+HARD_SOLUTION = (
+    "812753649943682175675491283154237896369845721287169534521974368438526917796318452"
+)
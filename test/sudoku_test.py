@@ -12,7 +12,8 @@ class TestSudokuConstructor:
         sudoku = Sudoku.empty()
 
         # then
-        for cell in sudoku.cells:
+        assert len(sudoku.cells) == 81
+        for _, cell in sudoku.cells:
             assert isinstance(cell, EmptyCell)
 
     @pytest.mark.parametrize("x,y,expected", [(1, 1, 1), (2, 3, 8), (5, 9, 4)])
@@ -150,6 +151,20 @@ class TestSudokuSet:
 
         assert isinstance(sudoku.get(3, 4), EmptyCell)
 
+    def test_set_shares_unchanged_cells_with_old_sudoku(self):
+        # given
+        givens = {(x, 1): FullCell(x) for x in range(1, 10)}
+        sudoku = Sudoku.empty()
+        for (x, y), cell in givens.items():
+            sudoku = sudoku.set(x, y, cell)
+
+        # when
+        new_sudoku = sudoku.set(9, 9, FullCell(3))
+
+        # then
+        assert all(new_sudoku.get(x, y) is cell for (x, y), cell in givens.items())
+        assert isinstance(sudoku.get(9, 9), EmptyCell)
+
     @pytest.mark.parametrize("x,y", [(8, 4), (3, 1), (2, 5)])
     def test_set_eliminates_number_from_empty_cells(self, x: int, y: int):
         sudoku = Sudoku.empty()
@@ -167,6 +182,29 @@ class TestSudokuGet:
         # then
         assert isinstance(sudoku.get(3, 4), EmptyCell)
 
+    def test_cells_lists_positions_in_reading_order(self):
+        sudoku = Sudoku.empty().set(2, 1, FullCell(6))
+
+        (position, cell) = sudoku.cells[1]
+
+        assert position == (2, 1)
+        assert cell == FullCell(6)
+
+    def test_itercells_yields_cells_one_at_a_time(self):
+        sudoku = Sudoku.empty().set(2, 1, FullCell(6))
+
+        cells = sudoku.itercells()
+
+        assert next(cells) == ((1, 1), sudoku.get(1, 1))
+        assert [next(cells), *cells] == sudoku.cells[1:]
+
+    @pytest.mark.parametrize("x,y", [(10, 5), (0, 5), (5, 10), (5, 0)])
+    def test_cannot_get_value_outside_of_bounds(self, x: int, y: int):
+        sudoku = Sudoku.empty()
+
+        with pytest.raises(ValueError):
+            sudoku.get(x, y)
+
 
 class TestSudokuGetRow:
     def test_getrow_returns_row_from_sudoku(self):
@@ -178,6 +216,17 @@ class TestSudokuGetRow:
         assert result.get(6).value == 8
 
 
+class TestSudokuGetBlock:
+    def test_getblock_returns_block_from_sudoku(self):
+        sudoku = Sudoku.empty().set(4, 5, FullCell(3)).set(6, 6, FullCell(2))
+
+        result = sudoku.getblock(2, 2)
+
+        assert result.get(1, 2).value == 3
+        assert result.get(3, 3).value == 2
+        assert result.local_to_global(1, 2) == (4, 5)
+
+
 class TestSudokuGetColumn:
     def test_getcolumn_returns_column_from_sudoku(self):
         sudoku = Sudoku.empty().set(4, 2, FullCell(7)).set(4, 6, FullCell(9))
@@ -186,3 +235,183 @@ class TestSudokuGetColumn:
 
         assert result.get(2).value == 7
         assert result.get(6).value == 9
+
+
+class TestSudokuEliminateAll:
+    def test_eliminates_numbers_from_every_position(self):
+        sudoku = Sudoku.empty()
+
+        sudoku = sudoku.eliminate_all([((1, 1), [3, 4]), ((9, 9), [3])])
+
+        assert not sudoku.get(1, 1).couldbe(3)
+        assert not sudoku.get(1, 1).couldbe(4)
+        assert not sudoku.get(9, 9).couldbe(3)
+        assert sudoku.get(9, 9).couldbe(4)
+
+    def test_returns_same_sudoku_if_nothing_changes(self):
+        sudoku = Sudoku.empty().set(1, 1, FullCell(3))
+
+        result = sudoku.eliminate_all([((1, 1), [4]), ((2, 1), [3])])
+
+        assert result is sudoku
+
+    def test_does_not_affect_old_sudoku(self):
+        sudoku = Sudoku.empty()
+
+        sudoku.eliminate_all([((5, 5), [5])])
+
+        assert sudoku.get(5, 5).couldbe(5)
+
+
+class TestSudokuTransaction:
+    def test_reports_no_change_before_eliminating(self):
+        transaction = Sudoku.empty().transaction()
+
+        assert not transaction.changed
+
+    def test_reports_change_after_eliminating(self):
+        transaction = Sudoku.empty().transaction()
+
+        transaction.eliminate(2, 3, 7)
+
+        assert transaction.changed
+
+    def test_combines_eliminations_on_same_cell(self):
+        transaction = Sudoku.empty().transaction()
+
+        transaction.eliminate(2, 3, 7)
+        transaction.eliminate(2, 3, 8)
+        sudoku = transaction.commit()
+
+        assert sudoku.get(2, 3).possible_numbers == (1, 2, 3, 4, 5, 6, 9)
+
+    @pytest.mark.parametrize("number", [0, 10])
+    def test_cannot_eliminate_number_out_of_bounds(self, number: int):
+        transaction = Sudoku.empty().transaction()
+
+        with pytest.raises(ValueError):
+            transaction.eliminate(2, 3, number)
+
+    @pytest.mark.parametrize("x,y", [(10, 5), (0, 5), (5, 10), (5, 0)])
+    def test_cannot_eliminate_outside_of_bounds(self, x: int, y: int):
+        transaction = Sudoku.empty().transaction()
+
+        with pytest.raises(ValueError):
+            transaction.eliminate(x, y, 3)
+
+
+class TestSudokuLocations:
+    def test_every_number_can_go_anywhere_in_empty_sudoku(self):
+        sudoku = Sudoku.empty()
+
+        assert sudoku.locations == (0b111111111,) * 243
+
+    def test_placed_number_removes_locations_in_its_units(self):
+        sudoku = Sudoku.empty()
+        assert len(sudoku.locations) == 243
+
+        sudoku = sudoku.set(2, 1, FullCell(5))
+
+        assert sudoku.locations[0 * 9 + 5 - 1] == 0
+        assert sudoku.locations[10 * 9 + 5 - 1] == 0
+        assert sudoku.locations[18 * 9 + 5 - 1] == 0
+        assert sudoku.locations[2 * 9 + 5 - 1] == 0b111111000
+
+    def test_incremental_locations_match_locations_built_from_scratch(self):
+        sudoku = Sudoku.empty()
+        assert len(sudoku.locations) == 243
+
+        sudoku = (
+            sudoku.set(2, 1, FullCell(5))
+            .set(7, 4, FullCell(5))
+            .set(3, 3, FullCell(8))
+            .eliminate_all([((9, 9), [1, 2]), ((4, 4), [8])])
+        )
+
+        assert (
+            sudoku.locations
+            == Sudoku(tuple(cell for _, cell in sudoku.cells)).locations
+        )
+
+
+class TestSudokuEquality:
+    def test_states_reached_in_different_orders_are_equal(self):
+        first = Sudoku.empty().set(2, 1, FullCell(5)).set(3, 3, FullCell(8))
+        second = Sudoku.empty().set(3, 3, FullCell(8)).set(2, 1, FullCell(5))
+
+        assert first is not second
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_states_with_different_candidates_are_not_equal(self):
+        sudoku = Sudoku.empty()
+
+        eliminated = sudoku.eliminate_all([((1, 1), [5])])
+
+        assert sudoku != eliminated
+        assert sudoku.zobrist != eliminated.zobrist
+
+    def test_incremental_hash_matches_hash_built_from_scratch(self):
+        sudoku = Sudoku.empty()
+        assert sudoku.zobrist == Sudoku((EmptyCell.create(),) * 81).zobrist
+
+        sudoku = (
+            sudoku.set(2, 1, FullCell(5))
+            .set(2, 1, EmptyCell.create())
+            .eliminate_all([((9, 9), [1, 2]), ((4, 4), [8])])
+        )
+
+        rebuilt = Sudoku(tuple(cell for _, cell in sudoku.cells))
+        assert sudoku._zobrist is not None
+
+        assert sudoku.zobrist == rebuilt.zobrist
+        assert sudoku == rebuilt
+
+    def test_is_not_equal_to_other_types(self):
+        assert Sudoku.empty() != "." * 81
+
+
+class TestSudokuFromDigits:
+    def test_matches_placing_numbers_one_at_a_time(self):
+        values = [[None] * 9 for _ in range(9)]
+        values[0][1] = 5
+        values[4][4] = 3
+        values[8][0] = 5
+        digits = [value or 0 for row in values for value in row]
+
+        result = Sudoku.fromdigits(digits)
+
+        assert result == Sudoku.fromarray(values)
+        assert result.locations == Sudoku.fromarray(values).locations
+
+    @pytest.mark.parametrize("second", [8, 9 * 8, 10])
+    def test_rejects_collisions(self, second: int):
+        digits = [0] * 81
+        digits[0] = digits[second] = 7
+
+        with pytest.raises(ValueError):
+            Sudoku.fromdigits(digits)
+
+    @pytest.mark.parametrize("digits", [[0] * 80, [10] + [0] * 80])
+    def test_rejects_invalid_digits(self, digits: list[int]):
+        with pytest.raises(ValueError):
+            Sudoku.fromdigits(digits)
+
+
+class TestSudokuFromCodes:
+    def test_restores_values_and_candidates(self):
+        sudoku = Sudoku.empty().set(1, 1, 5).eliminate_all([((9, 9), [1, 2])])
+        codes = [
+            512 + cell.value if isinstance(cell, FullCell) else cell.candidates
+            for _, cell in sudoku.cells
+        ]
+
+        result = Sudoku.fromcodes(codes)
+
+        assert result == sudoku
+        assert result.get(9, 9).possible_numbers == (3, 4, 5, 6, 7, 8, 9)
+
+    @pytest.mark.parametrize("codes", [[0] * 80, [512] + [0] * 80, [522] + [0] * 80])
+    def test_rejects_invalid_codes(self, codes: list[int]):
+        with pytest.raises(ValueError):
+            Sudoku.fromcodes(codes)
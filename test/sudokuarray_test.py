@@ -0,0 +1,158 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from samplepuzzles import EASY_PUZZLE, EASY_SOLUTION, HARD_PUZZLE  # noqa: E402
+
+from src.sudoku import Sudoku  # noqa: E402
+from src.sudokuarray import SudokuArray, mask_to_positions  # noqa: E402
+from src.sudokuextrapolateblock import (  # noqa: E402
+    eliminate_from_list_of_extrapolated_blocks,
+    find_extrapolations_from_blocks,
+)
+from src.sudokuextrapolateline import extrapolate_lines_until_stable  # noqa: E402
+from src.sudokufinder import (  # noqa: E402
+    find_cells_with_single_option,
+    find_cells_with_unique_number_in_blocks,
+    find_cells_with_unique_number_in_columns,
+    find_cells_with_unique_number_in_rows,
+)
+from src.sudokureader import sudoku_from_file, sudoku_from_string  # noqa: E402
+from src.sudokuwriter import sudoku_to_string  # noqa: E402
+
+PUZZLE_FILES = ["11", "13", "17", "34", "35"]
+
+
+def test_reads_batch_from_strings():
+    result = SudokuArray.fromstrings([EASY_PUZZLE, HARD_PUZZLE])
+
+    assert len(result) == 2
+    assert result.digits[0, 2] == 3
+    assert result.candidates[0, 2] == 0
+    assert result.tosudoku(0).cells == sudoku_from_string(EASY_PUZZLE).cells
+    assert result.tosudoku(1).cells == sudoku_from_string(HARD_PUZZLE).cells
+
+
+@pytest.mark.parametrize(
+    "input", [EASY_PUZZLE[:-1], EASY_PUZZLE[:-1] + "x", EASY_PUZZLE[:-1] + "é"]
+)
+def test_rejects_malformed_lines(input: str):
+    with pytest.raises(ValueError):
+        SudokuArray.fromstrings([EASY_PUZZLE, input])
+
+
+def test_rejects_wrongly_shaped_arrays():
+    with pytest.raises(ValueError):
+        SudokuArray(np.zeros((2, 80)), np.zeros((2, 80)))
+
+
+def test_keeps_candidates_of_sudokus():
+    # given
+    sudoku = Sudoku.empty().eliminate_all([((1, 1), [1, 2]), ((9, 9), [9])])
+
+    # when
+    result = SudokuArray.fromsudokus([sudoku, Sudoku.empty()])
+
+    # then
+    assert result.candidates[0, 0] == 0b111111100
+    assert result.tosudoku(0).cells == sudoku.cells
+    assert result.tosudoku(1).cells == Sudoku.empty().cells
+
+
+@pytest.mark.parametrize("name", PUZZLE_FILES)
+def test_finds_same_hints_as_finders(name: str):
+    # given
+    sudoku = extrapolate_lines_until_stable(sudoku_from_file(f"puzzles/{name}.txt"))
+    expected = (
+        set(find_cells_with_single_option(sudoku))
+        | set(find_cells_with_unique_number_in_rows(sudoku))
+        | set(find_cells_with_unique_number_in_columns(sudoku))
+        | set(find_cells_with_unique_number_in_blocks(sudoku))
+    )
+
+    # when
+    result = SudokuArray.fromsudokus([sudoku]).hints()
+
+    # then
+    assert set(mask_to_positions(result[0])) == expected
+
+
+def test_finds_same_hints_as_finders_in_batch():
+    # given
+    sudokus = [sudoku_from_string(EASY_PUZZLE), sudoku_from_string(HARD_PUZZLE)]
+    batch = SudokuArray.fromsudokus(sudokus)
+
+    # when
+    naked = batch.naked_singles()
+    rows = batch.hidden_singles(range(0, 9))
+
+    # then
+    for index, sudoku in enumerate(sudokus):
+        assert mask_to_positions(naked[index]) == find_cells_with_single_option(sudoku)
+        assert set(mask_to_positions(rows[index])) == set(
+            find_cells_with_unique_number_in_rows(sudoku)
+        )
+
+
+def test_propagates_easy_puzzle_to_solution():
+    result = SudokuArray.fromstrings([EASY_PUZZLE, HARD_PUZZLE]).propagate()
+
+    assert result.solved().tolist() == [True, False]
+    assert sudoku_to_string(result.tosudoku(0)) == EASY_SOLUTION
+    assert not result.contradictions().any()
+
+
+def test_detects_contradictions():
+    # given
+    wrong = "5" + EASY_PUZZLE[1:]
+
+    # when
+    result = SudokuArray.fromstrings([EASY_PUZZLE, wrong]).propagate()
+
+    # then
+    assert result.contradictions().tolist() == [False, True]
+
+
+@pytest.mark.parametrize("name", PUZZLE_FILES)
+def test_extrapolates_lines_like_single_sudoku(name: str):
+    # given
+    sudoku = sudoku_from_file(f"puzzles/{name}.txt")
+    batch = SudokuArray.fromsudokus([sudoku])
+
+    # when
+    while (
+        eliminations := batch.line_into_block_eliminations() & batch.candidates
+    ).any():
+        batch = batch.eliminate(eliminations)
+
+    # then
+    assert batch.tosudoku(0).cells == extrapolate_lines_until_stable(sudoku).cells
+
+
+@pytest.mark.parametrize("name", PUZZLE_FILES)
+def test_extrapolates_blocks_like_single_sudoku(name: str):
+    # given
+    sudoku = sudoku_from_file(f"puzzles/{name}.txt")
+    batch = SudokuArray.fromsudokus([sudoku])
+
+    # when
+    result = batch.eliminate(batch.block_into_line_eliminations())
+
+    # then
+    expected = eliminate_from_list_of_extrapolated_blocks(
+        sudoku, find_extrapolations_from_blocks(sudoku)
+    )
+    assert result.tosudoku(0).cells == expected.cells
+
+
+def test_extrapolates_batch_until_stable():
+    # given
+    batch = SudokuArray.fromstrings([HARD_PUZZLE, EASY_PUZZLE])
+
+    # when
+    result = batch.extrapolate_until_stable()
+
+    # then
+    assert not (result.line_into_block_eliminations() & result.candidates).any()
+    assert not (result.block_into_line_eliminations() & result.candidates).any()
+    assert ((result.candidates & ~batch.candidates) == 0).all()
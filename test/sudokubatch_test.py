@@ -0,0 +1,168 @@
+import io
+
+import pytest
+from samplepuzzles import EASY_PUZZLE, EASY_SOLUTION
+
+from src.__main__ import main, run_batch
+from src.instrumentation import INSTRUMENTATION
+from src.sudokubatch import (
+    BatchRunner,
+    BatchStats,
+    ChunkResult,
+    hint_puzzle,
+    solve_puzzle,
+)
+
+UNSOLVABLE_PUZZLE = "5" + EASY_PUZZLE[1:]
+COLLIDING_PUZZLE = "33" + EASY_PUZZLE[2:]
+
+
+def test_hints_puzzle_as_line():
+    result = hint_puzzle(EASY_PUZZLE)
+
+    assert result.startswith(EASY_PUZZLE + "\t2,1 4,1 6,1 ")
+
+
+def test_solves_puzzle_as_line():
+    assert solve_puzzle(EASY_PUZZLE) == EASY_PUZZLE + "\t" + EASY_SOLUTION
+
+
+def test_leaves_solution_empty_for_unsolvable_puzzle():
+    assert solve_puzzle(UNSOLVABLE_PUZZLE) == UNSOLVABLE_PUZZLE + "\t"
+
+
+def test_reports_malformed_puzzles_and_keeps_going():
+    # given
+    lines = [EASY_PUZZLE, COLLIDING_PUZZLE, "123", EASY_PUZZLE]
+    output = io.StringIO()
+
+    # when
+    run_batch(lines, output, hint_puzzle)
+
+    # then
+    result = output.getvalue().splitlines()
+    assert len(result) == 4
+    assert result[1] == (
+        COLLIDING_PUZZLE + "\terror: Same number is already present in this row"
+    )
+    assert result[2].startswith("123\terror: ")
+    assert result[3] == result[0]
+
+
+def test_parallel_batch_reports_malformed_puzzles_and_keeps_going():
+    # given
+    lines = [EASY_PUZZLE, COLLIDING_PUZZLE, EASY_PUZZLE]
+    sequential = io.StringIO()
+    parallel = io.StringIO()
+
+    # when
+    run_batch(lines, sequential, hint_puzzle)
+    run_batch(lines, parallel, hint_puzzle, jobs=2, chunksize=2)
+
+    # then
+    assert parallel.getvalue() == sequential.getvalue()
+
+
+@pytest.mark.parametrize(
+    "option", [["--jobs", "0"], ["--jobs", "-2"], ["--chunksize", "0"]]
+)
+def test_rejects_fewer_than_one_job_or_puzzle_per_chunk(option: list[str]):
+    with pytest.raises(SystemExit):
+        main(["--batch", "-", *option])
+
+
+def test_batch_file_reads_both_formats_and_reports_malformed_puzzles(tmp_path, capsys):
+    # given
+    grid = "".join(EASY_PUZZLE[y : y + 9] + "\n" for y in range(0, 81, 9))
+    filename = tmp_path / "puzzles.txt"
+    filename.write_text(f"{EASY_PUZZLE}\n123\n\n{grid}")
+
+    # when
+    main(["--batch", str(filename)])
+
+    # then
+    result = capsys.readouterr().out.splitlines()
+    assert result[0] == hint_puzzle(EASY_PUZZLE)
+    assert result[1].startswith("123\terror: ")
+    assert result[2] == result[0]
+
+
+@pytest.mark.parametrize("option", [["--solve"], ["--jobs", "2"], ["--chunksize", "8"]])
+def test_rejects_batch_options_without_batch(option: list[str]):
+    with pytest.raises(SystemExit):
+        main([*option, "puzzles/13.txt"])
+
+
+def test_rejects_cache_for_solutions(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["--batch", "-", "--solve", "--cache", str(tmp_path / "hints")])
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        BatchRunner(hint_puzzle, chunksize=0)
+
+
+def test_runs_in_parallel_in_input_order():
+    # given
+    puzzles = [EASY_PUZZLE, UNSOLVABLE_PUZZLE, "." * 81] * 4
+    runner = BatchRunner(solve_puzzle, workers=2, chunksize=2)
+
+    # when
+    result = list(runner.run(puzzles))
+
+    # then
+    assert result == [solve_puzzle(puzzle) for puzzle in puzzles]
+    assert runner.stats.puzzles == 12
+    assert sum(runner.stats.worker_puzzles.values()) == 12
+
+
+def test_parallel_batch_writes_same_output_as_sequential_batch():
+    # given
+    lines = [EASY_PUZZLE, "# comment", "", "." * 81, EASY_PUZZLE]
+    sequential = io.StringIO()
+    parallel = io.StringIO()
+
+    # when
+    run_batch(lines, sequential, hint_puzzle)
+    run_batch(lines, parallel, hint_puzzle, jobs=2, chunksize=1)
+
+    # then
+    assert parallel.getvalue() == sequential.getvalue()
+    assert len(parallel.getvalue().splitlines()) == 3
+
+
+def test_stats_count_puzzles_per_worker():
+    # given
+    stats = BatchStats(seconds=2.0)
+
+    # when
+    stats.add(ChunkResult(1, 1.0, ["a", "b"]))
+    stats.add(ChunkResult(2, 0.5, ["c"]))
+    stats.add(ChunkResult(1, 1.0, ["d"]))
+
+    # then
+    assert stats.puzzles == 4
+    assert stats.throughput == 2.0
+    assert stats.worker_puzzles == {1: 3, 2: 1}
+    assert "worker 2: 1 puzzles (2.0 puzzles/s)" in stats.report()
+
+
+def test_collects_rule_statistics_from_workers():
+    # given
+    runner = BatchRunner(hint_puzzle, workers=2, chunksize=1)
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enabled = True
+
+    # when
+    try:
+        list(runner.run([EASY_PUZZLE, EASY_PUZZLE, EASY_PUZZLE]))
+        rules = dict(INSTRUMENTATION.rules)
+    finally:
+        INSTRUMENTATION.enabled = False
+        INSTRUMENTATION.reset()
+
+    # then
+    assert rules["sudokufinder.find_cells_with_single_option"].calls == 3
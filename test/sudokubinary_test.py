@@ -0,0 +1,103 @@
+import pytest
+from samplepuzzles import EASY_PUZZLE
+
+from src.sudoku import Sudoku
+from src.sudokubinary import (
+    HEADER,
+    PackedSudokus,
+    binary_to_text,
+    pack_values,
+    text_to_binary,
+    unpack_values,
+    write_sudokus,
+)
+from src.sudokureader import sudoku_from_string
+
+
+def test_packs_values_into_41_bytes():
+    digits = bytes(range(10)) * 8 + b"\x09"
+
+    packed = pack_values(digits)
+
+    assert len(packed) == 41
+    assert packed[0] == 0x10
+    assert unpack_values(packed) == digits
+
+
+def test_converts_text_to_binary_and_back(tmp_path):
+    # given
+    (text, binary, back) = (tmp_path / "in.txt", tmp_path / "p.bin", tmp_path / "out")
+    text.write_text(f"# corpus\n{EASY_PUZZLE}\n{'.' * 81}\n")
+
+    # when
+    count = text_to_binary(str(text), str(binary))
+    binary_to_text(str(binary), str(back))
+
+    # then
+    assert count == 2
+    assert binary.stat().st_size == HEADER.size + 2 * 41
+    assert back.read_text() == f"{EASY_PUZZLE}\n{'.' * 81}\n"
+
+
+def test_reads_any_puzzle_by_index(tmp_path):
+    # given
+    filename = str(tmp_path / "puzzles.bin")
+    sudokus = [sudoku_from_string(EASY_PUZZLE), Sudoku.empty()] * 3
+    write_sudokus(filename, sudokus)
+
+    # when
+    with PackedSudokus(filename) as puzzles:
+        count = len(puzzles)
+        last = puzzles[-1]
+        fifth = puzzles[4]
+
+    # then
+    assert count == 6
+    assert last == Sudoku.empty()
+    assert fifth == sudokus[4]
+
+
+def test_keeps_candidates_when_asked(tmp_path):
+    # given
+    filename = str(tmp_path / "state.bin")
+    sudoku = sudoku_from_string(EASY_PUZZLE).eliminate_all([((1, 9), [4])])
+    write_sudokus(filename, [sudoku], candidates=True)
+
+    # when
+    with PackedSudokus(filename) as puzzles:
+        result = list(puzzles)
+        candidates = puzzles.candidates
+
+    # then
+    assert candidates
+    assert result == [sudoku]
+    assert result[0].get(1, 9).possible_numbers == (6,)
+
+
+def test_iterates_records_as_views(tmp_path):
+    filename = str(tmp_path / "puzzles.bin")
+    write_sudokus(filename, [Sudoku.empty()] * 4)
+
+    with PackedSudokus(filename) as puzzles:
+        sizes = [len(record) for record in puzzles.records()]
+
+    assert sizes == [41] * 4
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"SDKB", b"ABCD\x01\x00\x00\x00", b"SDKB\x01\x00\x00\x00\x00"]
+)
+def test_rejects_malformed_file(tmp_path, content: bytes):
+    filename = tmp_path / "bad.bin"
+    filename.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        PackedSudokus(str(filename))
+
+
+def test_rejects_index_out_of_range(tmp_path):
+    filename = str(tmp_path / "puzzles.bin")
+    write_sudokus(filename, [Sudoku.empty()])
+
+    with PackedSudokus(filename) as puzzles, pytest.raises(IndexError):
+        puzzles.record(1)
@@ -0,0 +1,125 @@
+from random import Random
+
+import pytest
+from samplepuzzles import EASY_PUZZLE
+
+from src.sudoku import Sudoku
+from src.sudokucanonical import canonical_form, canonical_string
+from src.sudokuhints import find_hints
+from src.sudokureader import sudoku_from_file, sudoku_from_string
+from src.sudokuwriter import sudoku_to_string
+
+PUZZLES = [
+    EASY_PUZZLE,
+    *(
+        sudoku_to_string(sudoku_from_file(f"puzzles/{n}.txt"))
+        for n in (11, 13, 17, 34, 35)
+    ),
+]
+
+
+def transform(puzzle: str, rows: list[int], columns: list[int], numbers: str) -> str:
+    """Moves the rows and columns of a puzzle and relabels its numbers."""
+    labels = dict(zip("123456789", numbers, strict=True)) | {".": "."}
+    return "".join(
+        labels[puzzle[row * 9 + column]] for row in rows for column in columns
+    )
+
+
+def transpose(puzzle: str) -> str:
+    return "".join(puzzle[row * 9 + column] for column in range(9) for row in range(9))
+
+
+def random_symmetry(puzzle: str, random: Random) -> str:
+    """Applies a random symmetry to a puzzle."""
+    (bands, stacks) = (random.sample(range(3), 3), random.sample(range(3), 3))
+    rows = [band * 3 + row for band in bands for row in random.sample(range(3), 3)]
+    columns = [
+        stack * 3 + column for stack in stacks for column in random.sample(range(3), 3)
+    ]
+    result = transform(puzzle, rows, columns, "".join(random.sample("123456789", 9)))
+    return transpose(result) if random.random() < 0.5 else result
+
+
+@pytest.mark.parametrize(
+    "equivalent",
+    [
+        transform(EASY_PUZZLE, list(range(9)), list(range(9)), "913456782"),
+        transform(
+            EASY_PUZZLE, [3, 4, 5, 0, 1, 2, 6, 7, 8], list(range(9)), "123456789"
+        ),
+        transform(
+            EASY_PUZZLE, list(range(9)), [2, 0, 1, 3, 4, 5, 8, 7, 6], "123456789"
+        ),
+        transpose(EASY_PUZZLE),
+        transform(
+            transpose(EASY_PUZZLE),
+            [8, 6, 7, 1, 2, 0, 4, 3, 5],
+            [5, 4, 3, 0, 1, 2, 7, 8, 6],
+            "597382614",
+        ),
+    ],
+)
+def test_equivalent_puzzles_have_same_canonical_form(equivalent):
+    assert canonical_string(sudoku_from_string(equivalent)) == canonical_string(
+        sudoku_from_string(EASY_PUZZLE)
+    )
+
+
+def test_different_puzzles_have_different_canonical_forms():
+    other = sudoku_to_string(sudoku_from_file("puzzles/17.txt"))
+
+    assert canonical_string(sudoku_from_string(other)) != canonical_string(
+        sudoku_from_string(EASY_PUZZLE)
+    )
+
+
+def test_canonical_form_of_empty_grid_is_empty():
+    assert canonical_string(Sudoku.empty()) == "." * 81
+
+
+def test_transform_turns_sudoku_into_canonical_form():
+    # given
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+
+    # when
+    (canonical, transform) = canonical_form(sudoku)
+
+    # then
+    assert transform.apply(sudoku) == canonical
+    for y in range(1, 10):
+        for x in range(1, 10):
+            position = transform.to_original_position((x, y))
+            assert transform.to_canonical_position(position) == (x, y)
+
+
+def test_hints_of_canonical_form_map_back_to_original():
+    # given
+    sudoku = sudoku_from_file("puzzles/17.txt")
+    (canonical, transform) = canonical_form(sudoku)
+
+    # when
+    positions = find_hints(canonical).positions
+
+    # then
+    assert sorted(transform.to_original_position(p) for p in positions) == sorted(
+        find_hints(sudoku).positions
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_symmetries_keep_canonical_form_and_hints(seed: int):
+    # given
+    random = Random(seed)
+    puzzle = random.choice(PUZZLES)
+    sudoku = sudoku_from_string(random_symmetry(puzzle, random))
+
+    # when
+    (canonical, transform) = canonical_form(sudoku)
+    positions = find_hints(canonical).positions
+
+    # then
+    assert canonical_string(sudoku) == canonical_string(sudoku_from_string(puzzle))
+    assert sorted(transform.to_original_position(p) for p in positions) == sorted(
+        find_hints(sudoku).positions
+    )
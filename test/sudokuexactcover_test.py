@@ -0,0 +1,83 @@
+import itertools
+
+from samplepuzzles import EASY_PUZZLE, HARD_PUZZLE
+
+from src.cell import FullCell
+from src.sudoku import Sudoku
+from src.sudokuexactcover import exact_cover_solutions, solve_exact_cover
+from src.sudokureader import sudoku_from_string
+from src.units import UNITS
+
+
+def is_solution(solution: Sudoku, puzzle: Sudoku) -> bool:
+    cells = [cell for _, cell in solution.cells]
+    givens = [cell for _, cell in puzzle.cells]
+    return (
+        all(isinstance(cell, FullCell) for cell in cells)
+        and all(
+            {cells[index].value for index in unit} == set(range(1, 10))
+            for unit in UNITS
+        )
+        and all(
+            not isinstance(given, FullCell) or given == cell
+            for given, cell in zip(givens, cells, strict=True)
+        )
+    )
+
+
+def test_solves_easy_puzzle():
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+
+    result = solve_exact_cover(sudoku)
+
+    assert result is not None
+    assert is_solution(result, sudoku)
+
+
+def test_solves_hard_puzzle():
+    sudoku = sudoku_from_string(HARD_PUZZLE)
+
+    result = solve_exact_cover(sudoku)
+
+    assert result is not None
+    assert is_solution(result, sudoku)
+    assert result.get(1, 1).value == 8
+    assert result.get(2, 1).value == 1
+
+
+def test_finds_single_solution_of_proper_puzzle():
+    sudoku = sudoku_from_string(HARD_PUZZLE)
+
+    result = list(exact_cover_solutions(sudoku))
+
+    assert len(result) == 1
+
+
+def test_finds_every_solution_of_ambiguous_puzzle():
+    sudoku = sudoku_from_string(HARD_PUZZLE[:-9] + "0" * 9)
+
+    result = list(itertools.islice(exact_cover_solutions(sudoku), 5))
+
+    assert len(result) == 5
+    assert all(is_solution(solution, sudoku) for solution in result)
+
+
+def test_returns_none_when_eliminations_rule_out_solution():
+    sudoku = sudoku_from_string(EASY_PUZZLE).eliminate_all([((1, 1), [4])])
+
+    result = solve_exact_cover(sudoku)
+
+    assert result is None
+
+
+def test_returns_none_for_conflicting_givens():
+    sudoku = Sudoku(
+        tuple(
+            FullCell(3) if position in [(1, 1), (9, 1)] else cell
+            for position, cell in Sudoku.empty().cells
+        )
+    )
+
+    result = solve_exact_cover(sudoku)
+
+    assert result is None
@@ -0,0 +1,75 @@
+from src.block import Block
+from src.cell import Cell, EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.sudokuextrapolateblock import (
+    BlockIntoColumnExtrapolation,
+    BlockIntoRowExtrapolation,
+    eliminate_from_list_of_extrapolated_blocks,
+    find_extrapolations_from_blocks,
+    find_extrapolations_from_single_block,
+)
+
+
+def test_finds_number_in_block_in_single_row():
+    # given
+    without_three = EmptyCell.create().eliminate(3)
+    cells: list[Cell] = [
+        FullCell(5),
+        EmptyCell.create(),
+        EmptyCell.create(),
+        without_three,
+        FullCell(9),
+        without_three,
+        FullCell(7),
+        without_three,
+        without_three,
+    ]
+    block = Block((3, 6), cells)
+
+    # when
+    result = find_extrapolations_from_single_block(block)
+
+    # then
+    assert BlockIntoRowExtrapolation(7, (2, 3), 3) in result
+    assert BlockIntoColumnExtrapolation(5, (2, 3), 3) not in result
+
+
+def test_finds_number_in_block_in_single_column():
+    # given
+    without_four = EmptyCell.create().eliminate(4)
+    cells: list[Cell] = [
+        without_four,
+        EmptyCell.create(),
+        without_four,
+        FullCell(1),
+        EmptyCell.create(),
+        without_four,
+        without_four,
+        FullCell(2),
+        without_four,
+    ]
+    block = Block((0, 0), cells)
+
+    # when
+    result = find_extrapolations_from_single_block(block)
+
+    # then
+    assert BlockIntoColumnExtrapolation(2, (1, 1), 4) in result
+    assert BlockIntoRowExtrapolation(1, (1, 1), 4) not in result
+
+
+def test_eliminates_number_from_rest_of_row():
+    # given
+    sudoku = Sudoku.empty().eliminate_all(
+        [((x, y), [6]) for x in range(1, 4) for y in range(2, 4)]
+    )
+
+    # when
+    extrapolations = find_extrapolations_from_blocks(sudoku)
+    result = eliminate_from_list_of_extrapolated_blocks(sudoku, extrapolations)
+
+    # then
+    assert extrapolations == [BlockIntoRowExtrapolation(1, (1, 1), 6)]
+    assert all(not result.get(x, 1).couldbe(6) for x in range(4, 10))
+    assert all(result.get(x, 1).couldbe(6) for x in range(1, 4))
+    assert result.get(4, 2).couldbe(6)
@@ -1,3 +1,7 @@
+from os import path
+
+import pytest
+
 from src.cell import Cell, EmptyCell, FullCell
 from src.line import Column, Row
 from src.sudoku import Sudoku
@@ -6,24 +10,31 @@ from src.sudokuextrapolateline import (
     RowIntoBlockExtrapolation,
     eliminate_from_extrapolated_column,
     eliminate_from_extrapolated_row,
+    eliminate_from_list_of_extrapolated_columns,
+    eliminate_from_list_of_extrapolated_rows,
+    extrapolate_lines_until_stable,
     find_extrapolations_from_columns,
     find_extrapolations_from_rows,
     find_extrapolations_from_single_column,
     find_extrapolations_from_single_row,
 )
+from src.sudokureader import sudoku_from_file
 
 
 def test_finds_number_in_row_in_single_block():
     # given
     empty_cell_without_three = EmptyCell.create().eliminate(3)
-    cells: dict[int, Cell] = dict()
-    cells[1] = FullCell(5)
-    cells[4] = empty_cell_without_three
-    cells[5] = empty_cell_without_three
-    cells[6] = FullCell(9)
-    cells[7] = empty_cell_without_three
-    cells[8] = FullCell(7)
-    cells[9] = empty_cell_without_three
+    cells: list[Cell] = [
+        FullCell(5),
+        EmptyCell.create(),
+        EmptyCell.create(),
+        empty_cell_without_three,
+        empty_cell_without_three,
+        FullCell(9),
+        empty_cell_without_three,
+        FullCell(7),
+        empty_cell_without_three,
+    ]
 
     row = Row(4, cells)
 
@@ -79,14 +90,17 @@ def test_eliminates_extrapolated_numbers():
 def test_finds_number_in_column_in_single_block():
     # given
     empty_cell_without_three = EmptyCell.create().eliminate(3)
-    cells: dict[int, Cell] = dict()
-    cells[1] = FullCell(5)
-    cells[4] = empty_cell_without_three
-    cells[5] = empty_cell_without_three
-    cells[6] = FullCell(9)
-    cells[7] = empty_cell_without_three
-    cells[8] = FullCell(7)
-    cells[9] = empty_cell_without_three
+    cells: list[Cell] = [
+        FullCell(5),
+        EmptyCell.create(),
+        EmptyCell.create(),
+        empty_cell_without_three,
+        empty_cell_without_three,
+        FullCell(9),
+        empty_cell_without_three,
+        FullCell(7),
+        empty_cell_without_three,
+    ]
 
     column = Column(4, cells)
 
@@ -137,3 +151,30 @@ def test_eliminates_extrapolated_numbers():
         sudoku = eliminate_from_extrapolated_column(sudoku, item)
 
     assert not sudoku.get(8, 3).couldbe(8)
+
+
+@pytest.mark.parametrize("puzzle", ["11", "13", "17", "34", "35"])
+def test_extrapolating_until_stable_matches_repeated_full_passes(puzzle: str):
+    sudoku = sudoku_from_file(path.join("puzzles", f"{puzzle}.txt"))
+    expected = sudoku
+    previous = None
+    while previous is not expected:
+        previous = expected
+        expected = eliminate_from_list_of_extrapolated_rows(
+            expected, find_extrapolations_from_rows(expected)
+        )
+        expected = eliminate_from_list_of_extrapolated_columns(
+            expected, find_extrapolations_from_columns(expected)
+        )
+
+    result = extrapolate_lines_until_stable(sudoku)
+
+    assert result.cells == expected.cells
+
+
+def test_extrapolating_until_stable_returns_same_sudoku_without_extrapolations():
+    sudoku = Sudoku.empty()
+
+    result = extrapolate_lines_until_stable(sudoku)
+
+    assert result is sudoku
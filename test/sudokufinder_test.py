@@ -1,10 +1,21 @@
+from os import path
+
+import pytest
+
 from src.sudoku import Sudoku
 from src.sudokufinder import (
     find_cells_with_single_option,
     find_cells_with_unique_number_in_blocks,
     find_cells_with_unique_number_in_columns,
     find_cells_with_unique_number_in_rows,
+    find_cells_with_unique_number_in_single_block,
+    find_cells_with_unique_number_in_single_column,
+    find_cells_with_unique_number_in_single_row,
+    iter_cells_with_single_option,
+    iter_cells_with_unique_number_in_blocks,
 )
+from src.sudokureader import sudoku_from_file
+from src.units import BLOCK_COORDINATES
 
 
 def test_finds_cell_with_only_one_possible_number():
@@ -85,3 +96,46 @@ def test_finds_cell_with_unique_value_in_block():
     result = find_cells_with_unique_number_in_blocks(sudoku)
 
     assert (5, 3) in result
+
+
+@pytest.mark.parametrize("puzzle", ["11", "13", "17", "34", "35"])
+def test_unique_numbers_match_finding_per_unit(puzzle: str):
+    sudoku = sudoku_from_file(path.join("puzzles", f"{puzzle}.txt"))
+
+    rows = [
+        position
+        for y in range(1, 10)
+        for position in find_cells_with_unique_number_in_single_row(sudoku.getrow(y))
+    ]
+    columns = [
+        position
+        for x in range(1, 10)
+        for position in find_cells_with_unique_number_in_single_column(
+            sudoku.getcolumn(x)
+        )
+    ]
+    blocks = [
+        position
+        for x, y in BLOCK_COORDINATES
+        for position in find_cells_with_unique_number_in_single_block(
+            sudoku.getblock(x, y)
+        )
+    ]
+
+    assert find_cells_with_unique_number_in_rows(sudoku) == rows
+    assert find_cells_with_unique_number_in_columns(sudoku) == columns
+    assert find_cells_with_unique_number_in_blocks(sudoku) == blocks
+
+
+def test_generators_yield_cells_one_at_a_time():
+    # given
+    sudoku = sudoku_from_file(path.join("puzzles", "35.txt"))
+
+    # when
+    result = iter_cells_with_unique_number_in_blocks(sudoku)
+
+    # then
+    assert next(result) == find_cells_with_unique_number_in_blocks(sudoku)[0]
+    assert list(iter_cells_with_single_option(sudoku)) == (
+        find_cells_with_single_option(sudoku)
+    )
@@ -0,0 +1,75 @@
+import io
+
+import pytest
+from samplepuzzles import EASY_PUZZLE
+
+from src.__main__ import print_hints_for_lines
+from src.sudoku import Sudoku
+from src.sudokuhints import find_first_hints, find_hints
+from src.sudokureader import sudoku_from_string
+
+
+def test_finds_no_hints_in_empty_sudoku():
+    result = find_hints(Sudoku.empty())
+
+    assert result.positions == []
+
+
+def test_finds_hints_in_reading_order():
+    result = find_hints(sudoku_from_string(EASY_PUZZLE))
+
+    assert (5, 5) in result.positions
+    assert result.positions == sorted(
+        result.positions, key=lambda position: (position[1], position[0])
+    )
+
+
+def test_writes_one_line_per_puzzle():
+    # given
+    lines = io.StringIO(f"{EASY_PUZZLE}\n{'.' * 81}\n")
+    output = io.StringIO()
+
+    # when
+    print_hints_for_lines(lines, output)
+
+    # then
+    result = output.getvalue().splitlines()
+    assert len(result) == 2
+    assert result[0].split("\t") == [
+        EASY_PUZZLE,
+        "2,1 4,1 6,1 2,2 7,2 8,2 1,3 5,3 8,3 9,4 2,5 3,5 4,5 5,5 6,5 7,5 "
+        "5,6 5,7 5,8 8,8 1,9 2,9 4,9 8,9 9,9",
+    ]
+    assert result[1] == "." * 81 + "\t"
+
+
+def test_first_hints_stop_at_count():
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+
+    result = find_first_hints(sudoku, 3)
+
+    assert len(result.positions) == 3
+    assert set(result.positions) <= set(find_hints(sudoku).positions)
+    assert result.sudoku is sudoku
+
+
+def test_first_hints_extrapolate_when_too_few_are_found():
+    # given
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+    every_hint = find_hints(sudoku).positions
+
+    # when
+    result = find_first_hints(sudoku, len(every_hint) + 1)
+
+    # then
+    assert sorted(result.positions) == sorted(every_hint)
+    assert result.sudoku is not sudoku
+
+
+def test_finds_no_first_hints_in_empty_sudoku():
+    assert find_first_hints(Sudoku.empty()).positions == []
+
+
+def test_rejects_count_below_one():
+    with pytest.raises(ValueError):
+        find_first_hints(Sudoku.empty(), 0)
@@ -1,6 +1,8 @@
+import io
+
 from src.higlights import FieldPointer
 from src.sudoku import Sudoku
-from src.sudokuprinter import print_sudoku
+from src.sudokuprinter import print_sudoku, write_sudokus
 
 
 def test_prints_empty_sudoku():
@@ -109,3 +111,29 @@ def test_prints_highlight_at_block_edge():
 ┃       ┃       ┃       ┃
 ┗━━━━━━━┻━━━━━━━┻━━━━━━━┛"""
     assert result == expected
+
+
+def test_prints_neighbouring_highlights_with_one_marker_between():
+    # given
+    sudoku = Sudoku.empty().set(1, 1, 4).set(2, 1, 7)
+
+    # when
+    result = print_sudoku(sudoku, [FieldPointer((1, 1)), FieldPointer((2, 1))])
+
+    # then
+    assert result.splitlines()[1] == "┃>4<7<  ┃       ┃       ┃"
+
+
+def test_writes_boards_to_stream():
+    # given
+    output = io.StringIO()
+    boards = [(Sudoku.empty(), []), (Sudoku.empty(), [FieldPointer((8, 2))])]
+
+    # when
+    count = write_sudokus(output, boards)
+
+    # then
+    assert count == 2
+    assert output.getvalue() == "".join(
+        print_sudoku(sudoku, highlights) + "\n\n" for sudoku, highlights in boards
+    )
@@ -0,0 +1,91 @@
+import pytest
+from samplepuzzles import EASY_PUZZLE
+
+from src.cell import EmptyCell, FullCell
+from src.sudoku import Sudoku
+from src.sudokupropagator import (
+    ContradictionError,
+    Elimination,
+    Placement,
+    Rule,
+    propagate,
+)
+from src.sudokureader import sudoku_from_string
+
+
+def test_solves_puzzle_that_only_needs_singles():
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+
+    result = propagate(sudoku)
+
+    assert all(isinstance(cell, FullCell) for _, cell in result.sudoku.cells)
+    assert result.sudoku.get(1, 1).value == 4
+
+
+def test_does_not_affect_old_sudoku():
+    sudoku = sudoku_from_string(EASY_PUZZLE)
+
+    propagate(sudoku)
+
+    assert isinstance(sudoku.get(1, 1), EmptyCell)
+
+
+def test_records_naked_single():
+    sudoku = Sudoku.empty()
+    for number in range(1, 9):
+        sudoku = sudoku.set(number, 1, FullCell(number))
+
+    result = propagate(sudoku)
+
+    assert Placement(Rule.NAKED_SINGLE, (9, 1), 9) in result.deductions
+
+
+def test_records_hidden_single():
+    sudoku = (
+        Sudoku.empty()
+        .set(4, 2, FullCell(1))
+        .set(7, 3, FullCell(1))
+        .set(2, 4, FullCell(1))
+        .set(3, 7, FullCell(1))
+    )
+
+    result = propagate(sudoku)
+
+    assert Placement(Rule.HIDDEN_SINGLE, (1, 1), 1) in result.deductions
+
+
+def test_records_line_into_block_elimination():
+    sudoku = Sudoku.empty().eliminate_all(
+        [((x, 1), [5]) for x in range(4, 10)],
+    )
+
+    result = propagate(sudoku)
+
+    assert Elimination(Rule.LINE_INTO_BLOCK, (2, 2), 5) in result.deductions
+    assert not result.sudoku.get(2, 2).couldbe(5)
+    assert result.sudoku.get(2, 1).couldbe(5)
+
+
+def test_returns_no_deductions_for_empty_sudoku():
+    result = propagate(Sudoku.empty())
+
+    assert result.deductions == []
+
+
+def test_raises_on_cell_without_candidates():
+    sudoku = Sudoku.empty().set(5, 5, EmptyCell.frommask(0))
+
+    with pytest.raises(ContradictionError):
+        propagate(sudoku)
+
+
+def test_raises_on_number_twice_in_unit():
+    sudoku = Sudoku(
+        tuple(
+            FullCell(3) if position in [(1, 1), (9, 1)] else cell
+            for position, cell in Sudoku.empty().cells
+        )
+    )
+
+    with pytest.raises(ContradictionError):
+        propagate(sudoku)
@@ -1,6 +1,22 @@
+import io
+
 import pytest
+from samplepuzzles import EASY_PUZZLE
+
+from src.cell import FullCell
+from src.sudoku import Sudoku
+from src.sudokureader import (
+    decode_puzzles,
+    digits_from_file,
+    puzzles_from_file,
+    read_sudokus,
+    sudoku_from_file,
+    sudoku_from_string,
+    sudoku_line_to_list,
+    sudokus_from_file,
+)
 
-from src.sudokureader import sudoku_line_to_list
+EASY_DIGITS = bytes(0 if char == "." else int(char) for char in EASY_PUZZLE)
 
 
 @pytest.mark.parametrize(
@@ -14,3 +30,132 @@ from src.sudokureader import sudoku_line_to_list
 def test_read_string_as_line_of_numbers(input: str, expected: list[int | None]):
     result = sudoku_line_to_list(input)
     assert result == expected
+
+
+def test_reads_sudoku_from_single_line():
+    result = sudoku_from_string(EASY_PUZZLE)
+
+    assert result.get(3, 1) == FullCell(3)
+    assert result.get(1, 9).possible_numbers == (4, 6)
+
+
+def test_reads_dots_and_zeroes_as_empty_cells():
+    result = sudoku_from_string(EASY_PUZZLE.replace(".", "0"))
+
+    assert result.cells == sudoku_from_string(EASY_PUZZLE).cells
+
+
+@pytest.mark.parametrize(
+    "input",
+    [EASY_PUZZLE[:-1], EASY_PUZZLE + "1", EASY_PUZZLE[:-1] + "x"],
+)
+def test_rejects_malformed_line(input: str):
+    with pytest.raises(ValueError):
+        sudoku_from_string(input)
+
+
+def test_reads_sudokus_one_line_at_a_time():
+    # given
+    lines = io.StringIO(f"# corpus\n{EASY_PUZZLE}\n\n{'.' * 81}\n")
+
+    # when
+    result = read_sudokus(lines)
+
+    # then
+    assert next(result).get(3, 1) == FullCell(3)
+    assert lines.tell() < len(lines.getvalue())
+    assert next(result).cells == Sudoku.empty().cells
+    assert next(result, None) is None
+
+
+def test_decodes_both_formats_into_numbers():
+    # given
+    grid = "\n".join(EASY_PUZZLE[y : y + 9] for y in range(0, 81, 9))
+    data = f"# corpus\r\n{EASY_PUZZLE.replace('.', '0')}\r\n\n{grid}\n".encode()
+
+    # when
+    result = list(decode_puzzles(data))
+
+    # then
+    assert result == [EASY_DIGITS, EASY_DIGITS]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"123\n",
+        EASY_PUZZLE[:-1].encode(),
+        EASY_PUZZLE[:-1].encode() + b"x",
+        b"123456789\n" * 8,
+    ],
+)
+def test_rejects_malformed_puzzles(data: bytes):
+    with pytest.raises(ValueError):
+        list(decode_puzzles(data))
+
+
+@pytest.mark.parametrize("comment", ["# puzzles", "# " + "x" * 79])
+def test_skips_comments_of_puzzle_length(comment: str):
+    data = f"{comment}\n{EASY_PUZZLE}\n".encode()
+
+    result = list(decode_puzzles(data))
+
+    assert result == [EASY_DIGITS]
+
+
+def test_decodes_puzzles_across_blocks(monkeypatch):
+    monkeypatch.setattr("src.sudokureader.BLOCK_SIZE", 100)
+    grid = "".join(EASY_PUZZLE[y : y + 9] + "\n" for y in range(0, 81, 9))
+
+    result = list(decode_puzzles(f"{EASY_PUZZLE}\n{grid}{EASY_PUZZLE}".encode()))
+
+    assert len(result) == 3
+    assert len(set(result)) == 1
+
+
+def test_reads_digits_from_memory_mapped_file(tmp_path):
+    filename = tmp_path / "puzzles.txt"
+    filename.write_text(f"{EASY_PUZZLE}\n{'.' * 81}\n")
+
+    result = list(digits_from_file(str(filename)))
+
+    assert result == [EASY_DIGITS, bytes(81)]
+
+
+def test_reads_nothing_from_empty_file(tmp_path):
+    filename = tmp_path / "empty.txt"
+    filename.write_text("")
+
+    assert list(sudokus_from_file(str(filename))) == []
+
+
+def test_reads_sudokus_from_file_in_grid_format():
+    result = list(sudokus_from_file("puzzles/13.txt"))
+
+    assert result == [sudoku_from_file("puzzles/13.txt")]
+
+
+def test_reads_puzzles_from_file_in_both_formats(tmp_path):
+    # given
+    grid = "".join(EASY_PUZZLE[y : y + 9] + "\n" for y in range(0, 81, 9))
+    filename = tmp_path / "puzzles.txt"
+    filename.write_text(f"# corpus\n{EASY_PUZZLE}\n\n{grid}")
+
+    # when
+    result = list(puzzles_from_file(str(filename)))
+
+    # then
+    assert result == [EASY_PUZZLE, EASY_PUZZLE]
+
+
+def test_passes_malformed_puzzles_from_file_on_as_written(tmp_path):
+    # given
+    rows = "".join(EASY_PUZZLE[y : y + 9] + "\n" for y in range(0, 27, 9))
+    filename = tmp_path / "puzzles.txt"
+    filename.write_text(f"123\n{EASY_PUZZLE}\n{rows}\n{EASY_PUZZLE}\n")
+
+    # when
+    result = list(puzzles_from_file(str(filename)))
+
+    # then
+    assert result == ["123", EASY_PUZZLE, EASY_PUZZLE[:27], EASY_PUZZLE]
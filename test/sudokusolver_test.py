@@ -0,0 +1,66 @@
+from samplepuzzles import EASY_PUZZLE, HARD_PUZZLE, HARD_SOLUTION
+
+from src.cell import FullCell
+from src.sudoku import Sudoku
+from src.sudokureader import sudoku_from_string
+from src.sudokusolver import count_solutions, has_unique_solution, solve
+
+
+def test_solves_easy_puzzle():
+    result = solve(sudoku_from_string(EASY_PUZZLE))
+
+    assert result is not None
+    assert result.get(1, 1).value == 4
+
+
+def test_solves_hard_puzzle():
+    result = solve(sudoku_from_string(HARD_PUZZLE))
+
+    assert result is not None
+    assert result.cells == sudoku_from_string(HARD_SOLUTION).cells
+
+
+def test_returns_none_without_solution():
+    sudoku = sudoku_from_string(EASY_PUZZLE).eliminate_all([((1, 1), [4])])
+
+    result = solve(sudoku)
+
+    assert result is None
+
+
+def test_returns_none_for_conflicting_givens():
+    sudoku = Sudoku(
+        tuple(
+            FullCell(3) if position in [(1, 1), (9, 1)] else cell
+            for position, cell in Sudoku.empty().cells
+        )
+    )
+
+    result = solve(sudoku)
+
+    assert result is None
+
+
+def test_counts_single_solution():
+    assert count_solutions(sudoku_from_string(HARD_PUZZLE)) == 1
+
+
+def test_stops_counting_at_limit():
+    assert count_solutions(Sudoku.empty(), limit=2) == 2
+    assert count_solutions(Sudoku.empty(), limit=5) == 5
+
+
+def test_counts_no_solutions():
+    sudoku = sudoku_from_string(EASY_PUZZLE).eliminate_all([((1, 1), [4])])
+
+    assert count_solutions(sudoku) == 0
+
+
+def test_proper_puzzle_has_unique_solution():
+    assert has_unique_solution(sudoku_from_string(EASY_PUZZLE))
+
+
+def test_puzzle_with_missing_givens_does_not_have_unique_solution():
+    sudoku = sudoku_from_string(HARD_PUZZLE[:-9] + "0" * 9)
+
+    assert not has_unique_solution(sudoku)
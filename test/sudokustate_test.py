@@ -0,0 +1,86 @@
+import pytest
+
+from src.sudoku import Sudoku
+from src.sudokubinary import PackedSudokus
+from src.sudokuhints import find_hints
+from src.sudokureader import sudoku_from_file
+from src.sudokustate import (
+    load_state,
+    save_state,
+    state_from_bytes,
+    state_from_text,
+    state_to_bytes,
+    state_to_text,
+)
+
+
+@pytest.fixture
+def extrapolated() -> Sudoku:
+    return find_hints(sudoku_from_file("puzzles/17.txt")).sudoku
+
+
+def test_restores_candidates_from_bytes(extrapolated: Sudoku):
+    data = state_to_bytes(extrapolated)
+
+    result = state_from_bytes(data)
+
+    assert len(data) == 133
+    assert result == extrapolated
+
+
+def test_restores_candidates_from_text(extrapolated: Sudoku):
+    text = state_to_text(extrapolated)
+
+    result = state_from_text(text)
+
+    assert result == extrapolated
+    assert result.locations == extrapolated.locations
+
+
+def test_writes_candidates_in_brackets():
+    sudoku = Sudoku.empty().set(1, 1, 5).eliminate_all([((2, 1), range(2, 10))])
+
+    text = state_to_text(sudoku)
+
+    assert text.split()[:3] == ["5", "[1]", "[12346789]"]
+
+
+def test_ignores_spacing_and_separators():
+    text = " ".join(["5", "[]", *["[1234]"] * 79])
+
+    result = state_from_text(text)
+
+    assert result.get(1, 1).value == 5
+    assert result.get(2, 1).possible_numbers == ()
+    assert result.get(9, 9).possible_numbers == (1, 2, 3, 4)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [" ".join(["1"] * 80), " ".join(["0"] * 81), " ".join(["[11]"] * 81), "[1" * 81],
+)
+def test_rejects_malformed_text(text: str):
+    with pytest.raises(ValueError):
+        state_from_text(text)
+
+
+def test_rejects_bytes_of_wrong_size():
+    with pytest.raises(ValueError):
+        state_from_bytes(bytes(41))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_saves_and_loads_state(tmp_path, extrapolated: Sudoku, binary: bool):
+    filename = str(tmp_path / "state")
+
+    save_state(filename, extrapolated, binary)
+
+    assert load_state(filename) == extrapolated
+
+
+def test_binary_state_is_a_packed_file(tmp_path, extrapolated: Sudoku):
+    filename = str(tmp_path / "state.bin")
+    save_state(filename, extrapolated, binary=True)
+
+    with PackedSudokus(filename) as puzzles:
+        assert list(puzzles) == [extrapolated]
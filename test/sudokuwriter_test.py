@@ -0,0 +1,17 @@
+from samplepuzzles import EASY_PUZZLE
+
+from src.sudoku import Sudoku
+from src.sudokureader import sudoku_from_string
+from src.sudokuwriter import positions_to_string, sudoku_to_string
+
+
+def test_writes_empty_sudoku_as_dots():
+    assert sudoku_to_string(Sudoku.empty()) == "." * 81
+
+
+def test_writes_sudoku_that_reads_back_the_same():
+    assert sudoku_to_string(sudoku_from_string(EASY_PUZZLE)) == EASY_PUZZLE
+
+
+def test_writes_positions_as_pairs():
+    assert positions_to_string([(1, 2), (9, 3)]) == "1,2 9,3"
@@ -0,0 +1,76 @@
+import pytest
+
+from src.units import (
+    BLOCKS,
+    CELL_BLOCK,
+    CELL_COLUMN,
+    CELL_ROW,
+    CELL_UNIT_SLOTS,
+    CELL_UNITS,
+    COLUMN_INTERSECTIONS,
+    COLUMNS,
+    INTERSECTIONS,
+    PEERS,
+    POSITIONS,
+    ROW_INTERSECTIONS,
+    ROWS,
+    UNITS,
+)
+
+
+def test_every_unit_has_nine_different_cells():
+    assert len(UNITS) == 27
+    for unit in UNITS:
+        assert len(set(unit)) == 9
+
+
+@pytest.mark.parametrize("index", range(81))
+def test_every_cell_has_twenty_peers(index: int):
+    assert len(PEERS[index]) == 20
+    assert index not in PEERS[index]
+
+
+def test_block_contains_cells_from_the_same_three_rows_and_columns():
+    positions = [POSITIONS[index] for index in BLOCKS[5]]
+
+    assert {x for x, _ in positions} == {7, 8, 9}
+    assert {y for _, y in positions} == {4, 5, 6}
+
+
+@pytest.mark.parametrize("index", range(81))
+def test_cell_is_in_its_own_units_at_its_slot(index: int):
+    for unit, slot in zip(CELL_UNITS[index], CELL_UNIT_SLOTS[index], strict=True):
+        assert UNITS[unit][slot] == index
+
+
+@pytest.mark.parametrize("index", range(81))
+def test_cell_is_in_the_row_column_and_block_it_points_to(index: int):
+    assert index in ROWS[CELL_ROW[index]]
+    assert index in COLUMNS[CELL_COLUMN[index]]
+    assert index in BLOCKS[CELL_BLOCK[index]]
+
+
+def test_row_intersection_splits_row_and_block():
+    intersection = ROW_INTERSECTIONS[4][1]
+
+    assert [POSITIONS[index] for index in intersection.cells] == [
+        (4, 5),
+        (5, 5),
+        (6, 5),
+    ]
+    assert set(intersection.line_rest) | set(intersection.cells) == set(UNITS[4])
+    assert set(intersection.block_rest) | set(intersection.cells) == set(BLOCKS[4])
+
+
+def test_column_intersection_splits_column_and_block():
+    intersection = COLUMN_INTERSECTIONS[0][2]
+
+    assert [POSITIONS[index] for index in intersection.cells] == [
+        (1, 7),
+        (1, 8),
+        (1, 9),
+    ]
+
+
+def test_there_are_fifty_four_intersections():
+    assert len(INTERSECTIONS) == 54
@@ -0,0 +1,27 @@
+from src.cell import EmptyCell, FullCell
+from src.zobrist import FULL_CELL_CODE, ZOBRIST_KEYS, cell_code, zobrist_hash
+
+
+def test_codes_of_full_cells_do_not_overlap_masks():
+    assert cell_code(EmptyCell.create()) == 0b111111111
+    assert cell_code(FullCell(1)) == FULL_CELL_CODE + 1
+
+
+def test_empty_cell_hash_combines_candidate_keys():
+    keys = ZOBRIST_KEYS[40]
+
+    assert keys[0b101] == keys[0b001] ^ keys[0b100]
+    assert keys[0] == 0
+
+
+def test_every_code_has_a_distinct_key():
+    keys = ZOBRIST_KEYS[0]
+
+    assert len(set(keys[1:])) == len(keys) - 1
+
+
+def test_hash_depends_on_cell_index():
+    first = (FullCell(5),) + (EmptyCell.create(),) * 80
+    second = (EmptyCell.create(), FullCell(5)) + (EmptyCell.create(),) * 79
+
+    assert zobrist_hash(first) != zobrist_hash(second)